@@ -59,9 +59,9 @@ def create_parser():
     
     parser.add_argument(
         '--output', '-o',
-        choices=['json', 'csv', 'excel', 'all'],
+        choices=['json', 'csv', 'excel', 'all', 'feather', 'parquet'],
         default='all',
-        help='输出格式 (默认: all)'
+        help='输出格式 (默认: all；feather/parquet 需要 pyarrow)'
     )
     
     parser.add_argument(
@@ -149,10 +149,10 @@ def print_results_summary(summary):
             file_name = Path(file_path).name
             print(f"    {format_type.upper()}: {file_name}")
 
-def main():
-    """主函数"""
+def main(argv=None):
+    """主函数（argv 为命令行参数列表，None 时读取 sys.argv）"""
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # 打印欢迎信息
     if args.verbose:
@@ -9,6 +9,7 @@ import json
 import requests
 import time
 import logging
+from collections import Counter
 from typing import Dict, List, Any
 
 class OptimizedLLMProcessor:
@@ -317,17 +318,25 @@ Return ONLY a valid JSON array with one object for each case:
         
         return processed_result
     
-    def process_batch(self, input_file: str, output_file: str, delay: float = 2.0, batch_size: int = 3):
-        """批量处理案件 - 针对律师分析优化，减小批次大小"""
+    def process_batch(self, input_file: str, output_file: str, delay: float = 2.0, batch_size: int = 3,
+                      cases: List[Dict[str, Any]] = None):
+        """批量处理案件 - 针对律师分析优化，减小批次大小
+        
+        调用方已加载输入数据时可通过 cases 传入，避免重新读取和解析 input_file
+        
+        Returns:
+            已保存的处理结果列表；读取输入或保存输出失败时返回 None
+        """
         self.logger.info(f"Starting optimized LLM processing (batch_size={batch_size}): {input_file} -> {output_file}")
         
         # 读取输入文件
-        try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                cases = json.load(f)
-        except Exception as e:
-            self.logger.error(f"Failed to read input file: {e}")
-            return
+        if cases is None:
+            try:
+                with open(input_file, 'r', encoding='utf-8') as f:
+                    cases = json.load(f)
+            except Exception as e:
+                self.logger.error(f"Failed to read input file: {e}")
+                return None
         
         processed_cases = []
         total_cases = len(cases)
@@ -398,6 +407,9 @@ Return ONLY a valid JSON array with one object for each case:
             
         except Exception as e:
             self.logger.error(f"Failed to save output file: {e}")
+            return None
+        
+        return processed_cases
     
     def _print_analysis_summary(self, cases: List[Dict[str, Any]]):
         """打印分析摘要"""
@@ -405,15 +417,8 @@ Return ONLY a valid JSON array with one object for each case:
         print("=" * 50)
         
         # 基本统计
-        case_types = {}
-        judgment_results = {}
-        
-        for case in cases:
-            case_type = case.get('case_type', 'unknown')
-            judgment_result = case.get('judgment_result', 'unknown')
-            
-            case_types[case_type] = case_types.get(case_type, 0) + 1
-            judgment_results[judgment_result] = judgment_results.get(judgment_result, 0) + 1
+        case_types = Counter(case.get('case_type', 'unknown') for case in cases)
+        judgment_results = Counter(case.get('judgment_result', 'unknown') for case in cases)
         
         print("案件类型分布:")
         for case_type, count in sorted(case_types.items()):
@@ -91,8 +91,8 @@ def start_visualizer(db_manager: GraphDatabaseManager):
     visualizer = KnowledgeGraphVisualizer(db_manager)
     visualizer.run()
 
-def main():
-    """主函数"""
+def main(argv=None):
+    """主函数（argv 为命令行参数列表，None 时读取 sys.argv）"""
     parser = argparse.ArgumentParser(description='香港法院文书知识图谱系统')
     parser.add_argument('--mode', choices=['import', 'visualize', 'full'], 
                        default='full', help='运行模式')
@@ -104,7 +104,7 @@ def main():
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
                        default='INFO', help='日志级别')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # 设置日志
     setup_logging(getattr(logging, args.log_level))
@@ -167,10 +167,10 @@ def run_benchmark(input_dir: str, args):
         else:
             print("  ❌ 并行处理提升不明显，可能由于文件过小或I/O瓶颈")
 
-def main():
-    """主函数"""
+def main(argv=None):
+    """主函数（argv 为命令行参数列表，None 时读取 sys.argv）"""
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # 打印欢迎信息
     if args.verbose:
@@ -17,14 +17,26 @@ Version: 1.1 - 前页优化版
 import sys
 import os
 import re
+import heapq
+import hashlib
 import logging
 from typing import Dict, Optional, List
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from operator import itemgetter
 
 # 设置输出编码
 import io
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+# 可选的 regex 库（见 requirements.txt）：匹配时可释放 GIL，未安装时使用标准库 re
+try:
+    import regex as _regex
+except ImportError:
+    _regex = None
+
 # 导入中文文档处理器
 try:
     # 尝试从父目录导入
@@ -35,9 +47,754 @@ except ImportError:
     # 如果导入失败，创建一个简单的占位符
     ChineseDocumentExtractor = None
 
+
+# 空白字符规范化
+_WS_RE = re.compile(r'\s+')
+
+# 开头的连接词（and / &）
+_LEADING_AND_RE = re.compile(r'^(?:and\s+|&\s+)', re.IGNORECASE)
+
+
+def _norm_ws(text: str) -> str:
+    """去除首尾空白并将连续空白合并为单个空格"""
+    # str.split() 的空白定义与 \s 相同，且首尾空白自然被丢弃
+    return ' '.join(text.split())
+
+
+def _merge_spans(spans: list) -> list:
+    """合并按起点排序的 (起点, 终点) 区间中相互重叠的区间"""
+    merged = []
+    for start, end in spans:
+        if merged and start < merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _lstrip_noncjk(text: str) -> str:
+    """去除开头的非中文字符（等价于 re.sub(r'^[^\\u4e00-\\u9fff]*', '', text)）"""
+    index = 0
+    length = len(text)
+    while index < length and not '\u4e00' <= text[index] <= '\u9fff':
+        index += 1
+    return text[index:]
+
+
+# 当事人姓名字符集及长度上限：有界重复避免长段落上的多项式回溯
+_PARTY_NAME_CHARS = r"[A-Za-z\s,\.\(\)&\-\'（）]"
+_MAX_PARTY_NAME_LEN = 200
+_PARTY_NAME_NOTE = rf'(?:\([^)]{{0,{_MAX_PARTY_NAME_LEN}}}\))?(?:（[^）]{{0,{_MAX_PARTY_NAME_LEN}}}）)?'
+
+
+def _compile_numbered_party_patterns(party_type: str) -> tuple:
+    """编译编号当事人模式 - 序数词作为捕获组，一次扫描覆盖所有序数"""
+    flags = re.IGNORECASE | re.MULTILINE
+    name = rf'({_PARTY_NAME_CHARS}{{1,{_MAX_PARTY_NAME_LEN}}}?'
+    ordinal = r'(\d+)(st|nd|rd|th)'
+    return (
+        # 模式1：标准换行格式 - 针对BETWEEN段落优化
+        re.compile(rf'{name}{_PARTY_NAME_NOTE})\s*\n\s*{ordinal}\s+{party_type}', flags),
+        # 模式2：同行格式
+        re.compile(rf'{name}{_PARTY_NAME_NOTE})\s+{ordinal}\s+{party_type}', flags),
+        # 模式3：中间有括号注释的换行格式
+        re.compile(rf'{name})\s*\n\s*\([^)]{{0,{_MAX_PARTY_NAME_LEN}}}\)\s*\n\s*{ordinal}\s+{party_type}', flags),
+    )
+
+
+def _compile_enhanced_party_patterns(party_type: str) -> tuple:
+    """编译增强编号当事人模式（姓名以大写字母开头）"""
+    flags = re.IGNORECASE | re.MULTILINE
+    name = rf'([A-Z]{_PARTY_NAME_CHARS}{{1,{_MAX_PARTY_NAME_LEN}}}?{_PARTY_NAME_NOTE})'
+    return (
+        # 正向格式 - 姓名在前，编号在后（第2组分隔空白区分多行/同行格式）
+        re.compile(rf'{name}(\s+)(\d+)(?:st|nd|rd|th)\s+{party_type}', flags),
+        
+        # 反向格式 - 编号在前，姓名在后
+        re.compile(rf'(\d+)(?:st|nd|rd|th)\s+{party_type}\s*\n\s*{name}', flags),
+        
+        # 简化格式 - 只有姓名+身份（无编号）
+        re.compile(rf'{name}\s+{party_type}(?!\s*\d)', flags),
+    )
+
+
+# 全文被告搜索模式（全文扫描，姓名长度必须有界）
+_FULLTEXT_DEFENDANT_PATTERNS = (
+    # 模式1：直接的编号被告
+    re.compile(rf"([A-Za-z\s,\.\(\)&\-\']{{1,{_MAX_PARTY_NAME_LEN}}}?)\s*\n\s*(\d+)(?:st|nd|rd|th)\s+Defendant", re.IGNORECASE),
+    # 模式2：单一被告（无编号）
+    re.compile(r"and\s+([A-Z][A-Za-z\s,\.\(\)&\-\']{10,80}?)\s*\n\s*Defendant(?!\s*\d)", re.IGNORECASE),
+)
+
+# 编号当事人模式（按当事人类型预编译）
+_NUMBERED_PARTY_PATTERNS = {
+    party_type: _compile_numbered_party_patterns(party_type)
+    for party_type in ('Plaintiff', 'Defendant')
+}
+_ENHANCED_PARTY_PATTERNS = {
+    party_type: _compile_enhanced_party_patterns(party_type)
+    for party_type in ('Plaintiff', 'Defendant')
+}
+
+# 支持的最大序数（1st - 20th）
+_MAX_PARTY_ORDINAL = 20
+
+# 序数词后缀表（按个位数索引）
+_ORDINAL_SUFFIXES = ('th', 'st', 'nd', 'rd', 'th', 'th', 'th', 'th', 'th', 'th')
+
+# DCCJ格式当事人模式："XXX Plaintiff" / "XXX\nDefendant"（第2组为分隔空白，第3组标记标识位于行尾）
+_DCCJ_PARTY_PATTERNS = {
+    party_type: re.compile(rf'([A-Z][A-Z\s&\.,\(\)\-]+?)(\s+){party_type}(\s*(?:\n|$))?', re.MULTILINE)
+    for party_type in ('Plaintiff', 'Defendant')
+}
+
+# 中文原告/被告模式的必需关键词（用于快速预检）
+_CN_PLAINTIFF_KEYWORDS = ('原告', '申請人', '上訴人')
+_CN_DEFENDANT_KEYWORDS = ('被告', '被申請人', '被上訴人')
+
+# 中文原告/被告模式（按优先级排列）
+_CN_PLAINTIFF_PATTERNS = tuple(re.compile(p) for p in (
+    r'原告人\s*\n\s*([A-Za-z\s,]+?)(?=\n|\s*及\s*)',
+    r'原告人\s*\n\s*([^\n]+?)(?=\s*第|\s*被告|\s*_)',
+    r'(?:第一原告人|原告人)\s*[：:]\s*([^\n第被]+)',
+    r'(?:第一原告人|原告人)\s*([A-Za-z\s,\.]+)(?=\s*第|\s*被告|\s*及)',
+    r'原告[：:]\s*([^\n]+)',
+    r'申請人[：:]\s*([^\n]+)',
+    r'上訴人[：:]\s*([^\n]+)',
+    r'第一原告人\s*([A-Za-z\s,]+)(?=\n|第二|第三|被告)',
+))
+_CN_DEFENDANT_PATTERNS = tuple(re.compile(p) for p in (
+    r'第一被告人\s*\n?\s*([A-Za-z\s,]+?)(?=\s*第二被告人|\s*第三被告人|\s*_)',
+    r'第一被告人\s*([A-Za-z\s,\.]+)(?=\s*第二|\s*第三|\s*_)',
+    r'第三被告人\s*([^_\n]+?)(?=_|Before|Date|\s*$)',
+    r'第三被告人\s*([^\n]+?)(?=\s*主審|\s*聆訊|\s*判)',
+    r'(?:第一被告人|被告人)\s*[：:]\s*([^\n第原]+)',
+    r'(?:被告|被申請人)\s*[：:]\s*([^\n]+)',
+    r'被告[：:]\s*([^\n]+)',
+    r'被申請人[：:]\s*([^\n]+)',
+    r'被上訴人[：:]\s*([^\n]+)',
+    r'(?:第一被告人|被告人)\s*([A-Za-z\s,]+)(?=\n|第二|第三|原告|Before)',
+))
+
+# 上述模式的起始关键词位置（零宽前瞻，重叠的关键词位置也会全部找到）
+_CN_PLAINTIFF_ANCHOR_RE = re.compile(r'(?=第一原告人|原告|申請人|上訴人)')
+_CN_DEFENDANT_ANCHOR_RE = re.compile(r'(?=第一被告人|第三被告人|被告|被申請人|被上訴人)')
+
+# BETWEEN段落（当事人部分）及其中分隔原被告的"AND"
+_BETWEEN_RE = re.compile(r'BETWEEN\s*(.*?)\s*(?=Before:|__________|Date|主審)', re.DOTALL | re.IGNORECASE)
+_BETWEEN_AND_RE = re.compile(r'\s+AND\s+', re.IGNORECASE)
+
+# 被告标识行：单独编号行 / 单独的 "Defendant" / 同行 "姓名 1st Defendant"
+_DEFENDANT_MARKER_RE = re.compile(
+    r'^[^\S\n]*(?:(\d+)(?:st|nd|rd|th)[^\S\n]+Defendant'
+    r'|(\S.*?)[^\S\n]+(\d+)(?:st|nd|rd|th)[^\S\n]+Defendant'
+    r'|Defendant)[^\S\n]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# 单独的布局字符行（1-3个大写字母或符号）
+_LAYOUT_LINE_RE = re.compile(r'^[^\S\n]*[A-Z\-\+](?:(?:[A-Z\-\+]|[^\S\n])?[A-Z\-\+])?[^\S\n]*$', re.MULTILINE)
+
+# 首尾的逗号和空白
+_EDGE_COMMA_SPACE_RE = re.compile(r'^[,\s]+|[,\s]+$')
+
+# str 模式下 \s 匹配的全部 Unicode 空白字符（字符类内部写法）
+_UNICODE_WS_CHARS = r'\t-\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+
+
+def _compile_ascii(pattern: str, flags: int = 0):
+    """以 re.ASCII 编译英文模式：忽略大小写时只做 ASCII 大小写折叠，省去逐字符的 Unicode 折叠开销。
+    
+    \\s 展开为等价的 Unicode 空白字符类，匹配范围不变；模式中不得使用 \\w、\\d、\\b。
+    """
+    parts = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == '\\':
+            escape = pattern[i:i + 2]
+            if escape == r'\s':
+                parts.append(_UNICODE_WS_CHARS if in_class else '[' + _UNICODE_WS_CHARS + ']')
+            else:
+                parts.append(escape)
+            i += 2
+            continue
+        if pattern[i] == '[':
+            in_class = True
+        elif pattern[i] == ']':
+            in_class = False
+        parts.append(pattern[i])
+        i += 1
+    return re.compile(''.join(parts), flags | re.ASCII)
+
+
+# 段落分隔（空行）
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+
+
+def _iter_paragraph_spans(text: str, start: int = 0):
+    """按空行逐个产出段落的 (起始, 结束) 位置"""
+    for match in _PARAGRAPH_SPLIT_RE.finditer(text, start):
+        yield start, match.start()
+        start = match.end()
+    yield start, len(text)
+
+
+def _iter_paragraphs(text: str, start: int = 0):
+    """按空行逐个产出段落，与 _PARAGRAPH_SPLIT_RE.split(text[start:]) 结果相同但不预先生成整个列表"""
+    for para_start, para_end in _iter_paragraph_spans(text, start):
+        yield text[para_start:para_end]
+
+# 段落内容清理（作用于空白已规范化的文本）：页码标记 "- 12 -"、下划线分隔线、
+# 页眉页脚 "page N"、开头的段落编号和标点
+_PAGE_NUMBER_RE = re.compile(r' ?- ?\d+ ?- ?')
+_UNDERLINE_RE = re.compile(r' *___+ *')
+_PAGE_TAIL_RE = re.compile(r'(?:page|頁)\s*\d', re.IGNORECASE)
+_LEADING_NUMBER_PUNCT_RE = re.compile(r'^\s*(?:\d+\.\s*)?[,;.:\s]*')
+
+
+def _clean_segment_text(content: str) -> str:
+    """清理段落内容：规范空白、移除页码和分隔符、截掉页眉页脚、去除首尾编号和标点"""
+    if not content:
+        return ""
+    
+    cleaned = _norm_ws(content)
+    cleaned = _PAGE_NUMBER_RE.sub(' ', cleaned)
+    cleaned = _UNDERLINE_RE.sub(' ', cleaned)
+    
+    # 文本已无换行："page N" 起到末尾的内容全部丢弃（先用子串检查避免逐位置的忽略大小写匹配）
+    if '頁' in cleaned or 'page' in cleaned.lower():
+        match = _PAGE_TAIL_RE.search(cleaned)
+        if match:
+            cleaned = cleaned[:match.start()]
+    
+    # 开头的段落编号与标点用一次锚定匹配移除；末尾的句点和空格（此时空白只剩空格）用 rstrip
+    cleaned = _LEADING_NUMBER_PUNCT_RE.sub('', cleaned, count=1)
+    return cleaned.rstrip('. ')
+
 class DocumentExtractor:
     """香港法庭文书信息提取器"""
     
+    # 英文法官提取模式（按优先级分层，预编译）
+    # 每项为 (必需关键词, 模式)：文本中不含任一关键词时该模式不可能匹配，直接跳过
+    # 第1层：特殊格式优先模式 - 增强精度
+    _JUDGE_SPECIAL_PATTERNS = (
+        # Recorder 格式 (如: Mr. Recorder Manzoni, SC) - 要求至少2个词
+        (('recorder',), re.compile(r'(?:mr\.?\s+|ms\.?\s+)?recorder\s+([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?:\s*,?\s*sc)?(?=\s+in\s+(?:court|chambers)|\n|$)', re.IGNORECASE)),
+        
+        # Master 格式 (如: Master Isaac Chan) - 要求至少2个词
+        (('master',), re.compile(r'master\s+([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?=\s+in\s+(?:court|chambers)|\n|$)', re.IGNORECASE)),
+        
+        # 括号内法官格式 (如: (Manzoni, SC)) - 至少3个字符
+        (None, re.compile(r'\(([A-Z][A-Za-z]{2,}(?:\s+[A-Z][A-Za-z]+)*)\s*,?\s*sc?\)')),
+        
+        # Deputy Judge 格式 - 要求至少2个词
+        (('deputy', 'dhcj'), re.compile(r'(?:deputy\s+(?:high\s+court\s+)?judge\s+|dhcj\s+)([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?:\s+sc)?(?=\s+in\s+(?:court|chambers)|\n|$)', re.IGNORECASE)),
+    )
+    
+    # 第2层：标准Before格式模式 - 增强精度
+    _JUDGE_BEFORE_PATTERNS = (
+        # 更精确的Before模式 - 要求姓名格式
+        (('before:',), re.compile(r'before:\s*(?:the\s+hon(?:ourable)?\.\s+)?([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?:\s+j\.?)?(?=\s+in\s+(?:court|chambers)|\n)', re.IGNORECASE)),
+        (('before:',), re.compile(r'before:\s*(?:deputy\s+(?:high\s+court\s+)?judge\s+)?([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?:\s+j\.?)?(?=\s+sitting|\n)', re.IGNORECASE)),
+        
+        # 兜底模式 - 但要求至少包含大写字母开头的词
+        (('before:',), re.compile(r'before:\s*([A-Z][A-Za-z]{2,}(?:\s+[A-Z][A-Za-z]+)*(?:\s+j\.?)?)', re.IGNORECASE)),
+    )
+    
+    # 第3层：备用模式 - 更严格的验证
+    _JUDGE_ALTERNATIVE_PATTERNS = (
+        # 要求完整的职称+姓名组合
+        (('deputy',), re.compile(r'(deputy\s+(?:high\s+court\s+)?judge\s+[A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?=\s+sitting|\s+in\s+(?:court|chambers)|\n)', re.IGNORECASE)),
+        (('justice',), re.compile(r'(justice\s+[A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?=\s+sitting|\s+in\s+(?:court|chambers)|\n)', re.IGNORECASE)),
+        (('hon',), re.compile(r'(the\s+hon(?:ourable)?\.\s+[A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+\s+j\.?)(?=\s|\n)', re.IGNORECASE)),
+        
+        # 判决书末尾的法官签名格式 - 要求合理的姓名长度
+        (('judge',), re.compile(r'\(([A-Z][A-Za-z]{2,}(?:\s+[A-Z][A-Za-z]+)+)\s*\)\s*(?:deputy\s+high\s+court\s+)?judge\s+of\s+the\s+court', re.IGNORECASE)),
+        (('recorder',), re.compile(r'\(([A-Z][A-Za-z]{2,}(?:\s+[A-Z][A-Za-z]+)+)\s*\)\s*recorder\s+of\s+the\s+high\s+court', re.IGNORECASE)),
+    )
+    
+    # 文件名中的文书类型代码：包含其他代码的长代码排在前面（HCAL 先于 HCA，HCA 先于 HC）
+    _DOCUMENT_TYPES = ('HCAL', 'HCA', 'CACC', 'CAMP', 'CACV', 'DCCC', 'DCMP', 'DCCJ', 'LD', 'HC', 'FCMC')
+    
+    # 当事人类型的中文名称（用于日志）
+    _PARTY_LABELS = {'Plaintiff': '原告', 'Defendant': '被告'}
+    
+    # 当事人姓名校验：干扰词表与字母检测
+    _PARTY_BAD_WORDS = frozenset([
+        'and', 'or', 'the', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+        'before', 'after', 'during', 'plaintiff', 'defendant', 'court', 'judge',
+        'chambers', 'sitting', 'hearing', 'date', 'action', 'case'
+    ])
+    _HAS_LETTER_RE = re.compile(r'[A-Za-z]')
+    _HAS_UPPER_RE = re.compile(r'[A-Z]')
+    
+    # 标准格式中文当事人（第N原告人/第N被告人）：角色 -> (合并扫描模式, 逐个序号的模式)
+    # 合并模式的先行断言放宽为任意后续序号，一次扫描找出各序号的首个候选；
+    # 后续序号不在该序号允许范围内时，再用对应序号的模式从该位置重新查找
+    _CN_ORDINALS = '一二三四五六七八九十'  # 中文序号，下标 + 1 即序号数值
+    _CN_STANDARD_PARTY_PATTERNS = {
+        '原告': (
+            re.compile(r'第([一二三四五])原告人\s*([^第\n]+)(?=第([二三四五六])原告人|被告)'),
+            tuple(re.compile(p) for p in (
+                r'第一原告人\s*([^第\n]+)(?=第二原告人|第三原告人|被告)',
+                r'第二原告人\s*([^第\n]+)(?=第三原告人|第四原告人|被告)',
+                r'第三原告人\s*([^第\n]+)(?=第四原告人|第五原告人|被告)',
+                r'第四原告人\s*([^第\n]+)(?=第五原告人|第六原告人|被告)',
+                r'第五原告人\s*([^第\n]+)(?=第六原告人|被告)',
+            )),
+        ),
+        '被告': (
+            re.compile(r'第([一二三四五])被告人\s*([^第\n]+)(?=第([二三四五六])被告人|Before)'),
+            tuple(re.compile(p) for p in (
+                r'第一被告人\s*([^第\n]+)(?=第二被告人|第三被告人|Before)',
+                r'第二被告人\s*([^第\n]+)(?=第三被告人|第四被告人|Before)',
+                r'第三被告人\s*([^第\n]+)(?=第四被告人|第五被告人|Before)',
+                r'第四被告人\s*([^第\n]+)(?=第五被告人|第六被告人|Before)',
+                r'第五被告人\s*([^第\n]+)(?=第六被告人|Before)',
+            )),
+        ),
+    }
+    
+    # 诉讼描述格式的被告：完整诉讼描述（起訴第一被告人XXX、第二被告人YYY...）、简化模式、回退模式
+    _CN_LITIGATION_DEFENDANT_FULL_RE = re.compile(r'''
+        起訴.*?第一被告人([^，、第]+?)(?:女士|先生)?[，、]
+        .*?第二被告人([^，、第]+?)(?:女士|先生)?
+        (?:[，、].*?第三被告人([^，、第]+?)(?:女士|先生)?)?
+        (?:[，、].*?第四被告人([^，、第]+?)(?:女士|先生)?)?
+    ''', re.VERBOSE)
+    _CN_LITIGATION_DEFENDANT_SIMPLE_RE = re.compile(r'第([一二三四五六七八九十])被告人([^，、第\n]+?)(?:女士|先生)?(?:[，、]|$)')
+    # 回退模式：第一至第四被告人合并为一个模式，以逗号/顿号收尾（第三组），第四被告人还可以位于文本末尾
+    _CN_LITIGATION_DEFENDANT_DIRECT_RE = re.compile(r'第([一二三四])被告人[：:\s]*([^，、第\n]+?)(?:女士|先生)?(?:([，、])|$)')
+    
+    # 中文被告姓名清理：称谓后缀、首尾连接词与标点、无效内容
+    # （姓名已做空白规范化，空白只剩单个空格，首尾干扰字符可直接用 str.strip 去除）
+    _CN_NAME_HONORIFICS = ('女士', '先生', '小姐')
+    _CN_NAME_JUNK_CHARS = '及、，, '
+    _CN_NAME_INVALID_RE = re.compile(r'^[\s\d，、,]+$')
+    
+    # 诉讼描述格式的原告（原告人XXX起訴 / 申請人XXX申請），按顺序取第一个匹配
+    _CN_LITIGATION_PLAINTIFF_PATTERNS = tuple(re.compile(p) for p in (
+        # 模式1：之原告人XXX起訴
+        r'之原告人([^起訴\n]+?)(?:起訴|女士起訴|先生起訴)',
+        # 模式2：原告人XXX起訴
+        r'原告人([^起訴\n]+?)(?:起訴|女士起訴|先生起訴)',
+        # 模式3：申請人XXX申請
+        r'申請人([^申請\n]+?)(?:申請|女士申請|先生申請)',
+    ))
+    
+    # 法官候选预过滤：介词/代词、法律术语
+    _JUDGE_STOPWORD_RE = re.compile(r'^(?:to|at|in|on|for|and|or|the|of|with|from)$', re.IGNORECASE)
+    _JUDGE_BEFORE_STOPWORD_RE = re.compile(r'^(?:to|at|in|on|for|and|or|the|of|with|from|by|this|that|these|those)$', re.IGNORECASE)
+    _JUDGE_LEGAL_TERM_RE = re.compile(r'^(?:court|chambers|sitting|hearing|judgment|decision|order)$', re.IGNORECASE)
+    _JUDGE_LEGAL_PREFIX_RE = re.compile(r'^(?:court|chambers|sitting|hearing|judgment|decision|order).*', re.IGNORECASE)
+    
+    # 中文法官提取模式
+    _CN_JUDGE_PATTERNS = tuple(re.compile(p) for p in (
+        r'主審法官[：:]\s*([^\n]+)',
+        r'審訊法官[：:]\s*([^\n]+)',
+        r'(?:高等法院原訟法庭法官|法官)\s*([^\n\s]{2,10})',
+    ))
+    
+    # 法官姓名清理
+    # 注意：原实现把 re.IGNORECASE 作为第4个位置参数（即 count）传给 re.sub，
+    # 这些后缀/前缀模式实际上区分大小写；此处保持原有行为，不加 IGNORECASE
+    _JUDGE_TITLE_WORDS_RE = re.compile(r'\b(?:deputy|high|court|judge|justice|the|hon\.?|honourable|mr|ms|mrs)\b\s*', re.IGNORECASE)
+    _JUDGE_J_SUFFIX_RE = re.compile(r'\s*j\.?\s*$')
+    _JUDGE_SITTING_TAIL_RE = re.compile(r'\s*(?:sitting|in|chambers)\s*.*$')
+    _JUDGE_HON_J_STRIP_RE = re.compile(r'^(?:hon\.?\s+)?(.+?)\s*j\.?\s*$', re.IGNORECASE)
+    _JUDGE_SC_SUFFIX_RE = re.compile(r'\s*,?\s*sc\s*$')
+    _JUDGE_LOCATION_TAIL_RE = re.compile(r'\s*(?:sitting|in|at)\s+(?:court|chambers).*$')
+    _JUDGE_LEADING_TITLE_RE = re.compile(r'^(?:the\s+|hon\.?\s+|honourable\s+)')
+    
+    # 法官姓名的完整格式
+    _JUDGE_HON_J_RE = re.compile(r'^(?:the\s+)?hon\.?\s+(.+?)\s*j\.?\s*(?:in\s+(?:court|chambers).*)?$', re.IGNORECASE)
+    _JUDGE_RECORDER_RE = re.compile(r'^(?:mr\.?\s+|ms\.?\s+)?recorder\s+(.+?)(?:\s*,?\s*sc)?(?:\s+in\s+(?:court|chambers).*)?$', re.IGNORECASE)
+    _JUDGE_MASTER_RE = re.compile(r'^master\s+(.+?)(?:\s+in\s+(?:court|chambers).*)?$', re.IGNORECASE)
+    _JUDGE_DEPUTY_RE = re.compile(r'^deputy\s+(?:high\s+court\s+)?judge\s+(.+?)(?:\s+in\s+(?:court|chambers).*)?$', re.IGNORECASE)
+    _JUDGE_BRACKET_RE = re.compile(r'^\(([A-Za-z\s]+?)\s*,?\s*sc?\)$', re.IGNORECASE)
+    
+    # 法官姓名预验证：立即拒绝明显错误的输入
+    # 字面量词表用集合查找（不区分大小写的按小写比较），其余字符类模式合并为一个锚定的交替模式
+    _JUDGE_PRE_INVALID_WORDS = frozenset((
+        # 常见介词/代词
+        'to', 'at', 'in', 'on', 'for', 'and', 'or', 'the', 'of', 'with', 'from', 'by', 'if', 'is', 'as',
+        'be', 'it', 'he', 'she', 'we', 'they', 'this', 'that', 'these', 'those',
+        # 法律术语
+        'court', 'chambers', 'sitting', 'hearing', 'judgment', 'judgement', 'decision', 'order', 'matter',
+        'case', 'action', 'appeal', 'application',
+        # 疑问词/时间词
+        'before', 'after', 'during', 'while', 'when', 'where', 'what', 'who', 'how', 'why',
+        # 判决用词
+        'granted', 'dismissed', 'allowed', 'refused', 'upheld', 'affirmed', 'reversed',
+        # 当事人
+        'plaintiff', 'defendant', 'applicant', 'respondent', 'appellant',
+        # 情态动词
+        'must', 'shall', 'should', 'would', 'could', 'may', 'might', 'can', 'will',
+    ))
+    # 动词（区分大小写）
+    _JUDGE_PRE_INVALID_VERBS = frozenset((
+        'held', 'gave', 'said', 'found', 'noted', 'stated', 'ordered', 'directed',
+    ))
+    _JUDGE_PRE_INVALID_RE = re.compile('^(?:' + '|'.join((
+        r'[A-Z]',                              # 单个大写字母
+        r'[a-z]',                              # 单个小写字母
+        r'[A-Za-z]{1,2}',                      # 1-2个字母（如'e', 'To'）
+        r'\d+',                                # 纯数字
+        r'[,.\s\-_:;]+',                       # 纯标点和空格
+        r'[0-9]{1,4}|[ivxlc]+',                # 数字或罗马数字
+    )) + ')$')
+    
+    # 法官姓名清理后的无效词（不区分大小写，同上）
+    _JUDGE_INVALID_WORDS = frozenset((
+        # 介词/代词
+        'to', 'at', 'in', 'on', 'for', 'and', 'or', 'the', 'of', 'with', 'from', 'by', 'if', 'is', 'as',
+        'be', 'it', 'he', 'she', 'we', 'they',
+        # 法律术语
+        'court', 'chambers', 'sitting', 'hearing', 'judgment', 'judgement', 'decision', 'order', 'matter',
+        'case', 'action', 'appeal',
+        # 其他常见词
+        'before', 'after', 'during', 'while', 'when', 'where', 'what', 'who', 'how', 'why',
+        'shall', 'must', 'would', 'could',
+        # 当事人
+        'plaintiff', 'defendant', 'applicant', 'respondent', 'appellant', 'petitioner',
+        # 判决/动词
+        'granted', 'dismissed', 'allowed', 'refused', 'upheld', 'affirmed', 'reversed', 'held', 'gave',
+        'said', 'found',
+        # 长介词短语的开头
+        'less than', 'more than', 'between', 'among', 'within', 'without', 'unless', 'until', 'since',
+        'because',
+        # 财务术语
+        'inclusive', 'exclusive', 'interest', 'cost', 'costs', 'fee', 'fees',
+    ))
+    # 可带复数 "s" 的无效词
+    _JUDGE_INVALID_PLURAL_WORDS = frozenset((
+        # 法律程序术语
+        'hearing', 'trial', 'motion', 'summons', 'application', 'appeal', 'judgment',
+        # 数字/时间
+        'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten',
+        'week', 'month', 'year', 'day',
+    ))
+    _JUDGE_INVALID_RE = re.compile('^(?:' + '|'.join((
+        r'[A-Za-z]{1,2}',                      # 1-2个字母（如'e', 'To', 'In'）
+        r'\d+',                                # 纯数字
+        r'[,.\s\-_:;]+',                       # 纯标点和空格
+        r'[ivxlc]+',                           # 罗马数字
+    )) + ')$')
+    
+    # 英文律师：represented by 格式（主要）与 counsel for 格式（备用）
+    _LAWYER_REPRESENTATION_PATTERNS = tuple(_compile_ascii(p, re.IGNORECASE) for p in (
+        r'(?:plaintiff|applicant|p)\s+(?:was\s+)?represented\s+by\s+(.*?)(?=\s+and\s+(?:defendant|d\s+|the\s+defendant)|\.|\n)',
+        r'(?:defendant|respondent|d)\s+(?:was\s+)?represented\s+by\s+(.*?)(?=\.|\n)',
+        r'at\s+the\s+(?:trial|hearing),?\s+(?:p|plaintiff)\s+(?:was\s+)?represented\s+by\s+(.*?)(?=\s+and\s+d\s+|\.|\n)',
+    ))
+    _LAWYER_COUNSEL_PATTERNS = tuple(_compile_ascii(p, re.IGNORECASE) for p in (
+        r'counsel\s+for\s+(?:the\s+)?(?:plaintiff|defendant|applicant|respondent)[:\s]+([^\n\.]+)',
+        r'for\s+the\s+(?:plaintiff|defendant)[:\s]+([^\n\.]+)',
+    ))
+    
+    # 律师文本中的 Mr/Ms + 姓名，以及两个连续的单词（各自独立扫描，匹配可相互重叠）
+    _LAWYER_NAME_PATTERNS = tuple(_compile_ascii(p, re.IGNORECASE) for p in (
+        r'mr\.?\s+([A-Za-z\s]+?)(?:\s+sc\s*|\s+leading|\s+and|\s*,|\s*$)',
+        r'ms\.?\s+([A-Za-z\s]+?)(?:\s+sc\s*|\s+leading|\s+and|\s*,|\s*$)',
+        r'(?:leading\s+)?([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s+sc)?',
+    ))
+    
+    # 中文律师
+    _CN_LAWYER_PATTERNS = tuple(re.compile(p) for p in (
+        r'委托律师[：:]\s*([^\n]+)',
+        r'代理律师[：:]\s*([^\n]+)',
+        r'(?:原告|申請人).*?委託.*?([^\n]{2,20}).*?代理',
+        r'(?:被告|被申請人).*?委託.*?([^\n]{2,20}).*?代理',
+    ))
+    
+    # 英文律师信息段落：段落检测模式、扩大范围时的明确模式、律师姓名模式
+    # 段落检测只关心是否有任一模式命中，合并为一个交替模式（忽略大小写）一次扫描
+    _EN_LAWYER_SEGMENT_RE = re.compile('|'.join('(?:{})'.format(p) for p in (
+        # 标准格式
+        r'(?:mr|ms|miss)\.?\s+[A-Z][a-z]+[^.]*?instructed\s+by[^.]*?for\s+(?:the\s+)?(?:plaintiff|defendant)',
+        r'instructed\s+by[^.]*?for\s+(?:the\s+)?(?:plaintiff|defendant)',
+        r'counsel\s+for\s+(?:the\s+)?(?:plaintiff|defendant)[:\s]+([^\n\.]+)',
+        r'(?:plaintiff|defendant).*?represented\s+by[^.]*?instructed\s+by',
+        
+        # 新增格式
+        r'for\s+(?:the\s+)?(?:plaintiff|defendant)[:\s]+(?:mr|ms|miss)\.?\s+[A-Z][a-z]+',
+        r'(?:mr|ms|miss)\.?\s+[A-Z][a-z]+.*?(?:instructed\s+by|of\s+[A-Z][a-z]+.*?(?:chambers|solicitors?))',
+        r'(?:mr|ms|miss)\.?\s+[A-Z][a-z]+.*?for\s+(?:the\s+)?(?:plaintiff|defendant|1st|2nd|3rd|4th)',
+        r'(?:leading\s+)?counsel.*?(?:instructed\s+by|for\s+(?:the\s+)?(?:plaintiff|defendant))',
+        r'(?:the\s+)?(?:plaintiff|defendant).*?(?:was\s+)?not\s+represented',
+    )), re.IGNORECASE)
+    _EN_LAWYER_SEGMENT_KEYWORDS = (
+        'instructed by', 'counsel for', 'represented by', 'chambers', 'solicitor',
+        'barrister', 'appeared for', 'acting for', 'law firm',
+        'not represented', 'in person', 'did not appear'
+    )  # 'solicitors' 已被 'solicitor' 覆盖
+    _EN_LAWYER_CLEAR_PATTERNS = tuple(re.compile(p) for p in (
+        r'(?i)(?:mr|ms|miss)\.?\s+[A-Z][a-z]+.*?instructed\s+by.*?for\s+(?:the\s+)?(?:plaintiff|defendant)',
+        r'(?i)for\s+(?:the\s+)?(?:plaintiff|defendant)[:\s]+(?:mr|ms|miss)\.?\s+[A-Z][a-z]+.*?(?:instructed|chambers)',
+        r'(?i)(?:the\s+)?(?:plaintiff|defendant).*?not\s+represented',
+        r'(?i)(?:the\s+)?(?:plaintiff|defendant).*?did\s+not\s+appear'
+    ))
+    # 末尾逐行扫描的关键词；_is_lawyer_segment 的必需关键词与当事方关键词
+    _LAWYER_LINE_KEYWORDS = ('instructed', 'counsel', 'represented', 'chambers')
+    _LAWYER_REQUIRED_KEYWORDS = ('instructed', 'counsel', 'represented', 'solicitor', 'chambers')
+    _LAWYER_PARTY_KEYWORDS = ('plaintiff', 'defendant', 'applicant', 'respondent')
+    _LAWYER_TITLE_NAME_RE = re.compile(r'(?i)(?:mr|ms|miss)\.?\s+[A-Z][a-z]+')
+    # _is_lawyer_segment 使用区分大小写的版本（称谓须为小写）
+    _LAWYER_TITLE_NAME_CASED_RE = re.compile(r'(?:mr|ms|miss)\.?\s+[A-Z][a-z]+')
+    
+    # 中文律师信息段落关键词：委托律师/代理律师 已被 律师/代理 覆盖；
+    # 原有的律师信息模式（委托律师：、代理律师：、...委託...代理、律师...代表/代理）都必然包含其中之一
+    _CN_LAWYER_SEGMENT_KEYWORDS = ('律师', '委託', '代理')
+    
+    # 律师信息段落清理：页码、分隔线、页脚（首尾标点在空白规范化后用 str.strip 去除）
+    _LAWYER_PAGE_NUMBER_RE = re.compile(r'\s*-\s*\d+\s*-\s*')
+    _LAWYER_UNDERLINE_RE = re.compile(r'\s*_{5,}\s*')
+    _LAWYER_PAGE_TAIL_RE = re.compile(r'(?i)\s*(?:page|頁|第.*頁).*$')
+    
+    # case_type 提取扫描的开头/末尾字符数
+    _CASE_TYPE_HEAD_CHARS = 20000
+    _CASE_TYPE_TAIL_CHARS = 15000
+    
+    # 英文案件类型：关键段落与判决相关描述，每项为 (模式, 权重, 类型)
+    _EN_CASE_SECTION_PATTERNS = tuple((_compile_ascii(p, re.IGNORECASE | re.DOTALL), weight, section_type) for p, weight, section_type in (
+        # Introduction段落 - 通常包含案件概述
+        (r'Introduction\s*[:\.]?\s*\n((?:[^\n]+\n){3,20})', 10, 'introduction'),
+        
+        # Background段落 - 案件背景
+        (r'(?:BACKGROUND|Background)\s*[:\.]?\s*\n((?:[^\n]+\n){5,25})', 9, 'background'),
+        
+        # Facts段落 - 案件事实
+        (r'(?:FACTS?|Facts?)\s*[:\.]?\s*\n((?:[^\n]+\n){3,20})', 8, 'facts'),
+        
+        # 案件性质描述
+        (r'(?:This is|These are)\s+(?:an?\s+)?(action|application|proceeding|matter|case|appeal|motion|summons)([^\n.]{20,300})', 7, 'nature'),
+        
+        # 申请描述
+        (r'(?:The|This)\s+(?:plaintiff|applicant|defendant|appellant)\s+(?:seeks?|applies?|brings?|claims?)\s+([^\n.]{30,400})', 6, 'application'),
+    ))
+    _EN_CASE_JUDGMENT_PATTERNS = tuple((_compile_ascii(p, re.IGNORECASE | re.DOTALL), weight, section_type) for p, weight, section_type in (
+        (r'(?:ORDER|ORDERS|JUDGMENT|HELD|DISPOSITION)\s*[:\.]?\s*\n((?:[^\n]+\n){2,15})', 5, 'judgment_context'),
+        (r'(?:For (?:these reasons|the foregoing reasons)|Accordingly|In (?:conclusion|the result))\s*[,.]?\s*([^\n.]{50,500})', 4, 'conclusion'),
+    ))
+    # 长段落筛选的案件相关关键词（与小写段落比较）
+    _EN_CASE_KEYWORDS = ('application', 'proceeding', 'action', 'dispute', 'matter', 'claim', 'relief', 'judgment', 'order')
+    
+    # 中文案件类型
+    _CN_CASE_SECTION_PATTERNS = tuple((re.compile(p), weight, section_type) for p, weight, section_type in (
+        # 背景/事实段落
+        (r'(?:背景|事實|案情|簡介)\s*[：:.]?\s*\n((?:[^\n]+\n){3,20})', 10, 'background'),
+        
+        # 争议/问题段落
+        (r'(?:爭議|問題|焦點|糾紛)\s*[：:.]?\s*\n((?:[^\n]+\n){2,15})', 9, 'dispute'),
+        
+        # 申请人请求
+        (r'(?:申請人|原告人?)\s*(?:申請|請求|要求|尋求|指稱)\s*([^\n。]{50,500})', 8, 'application'),
+        
+        # 案件性质
+        (r'(?:本案|該案|此案)\s*(?:涉及|關於|係|為)\s*([^\n。]{30,400})', 7, 'nature'),
+    ))
+    _CN_CASE_JUDGMENT_PATTERNS = tuple((re.compile(p), weight, section_type) for p, weight, section_type in (
+        (r'(?:命令|判令|裁定|判決)\s*[：:.]?\s*\n((?:[^\n]+\n){2,15})', 6, 'judgment'),
+        (r'(?:綜上所述|因此|故此|據此)\s*[，,]?\s*([^\n。]{30,400})', 5, 'conclusion'),
+    ))
+    # 中文关键词合并为一个交替模式：一次扫描即可判断段落是否含任一关键词
+    _CN_CASE_KEYWORD_RE = re.compile(r'申請|爭議|糾紛|案件|法庭|法院|判決|命令|裁定')
+    
+    # 英文判决结果：ORDER/JUDGMENT段落（优先级1）与明确的判决语句（优先级2）
+    _EN_ORDER_PATTERNS = tuple(_compile_ascii(p, re.IGNORECASE | re.DOTALL) for p in (
+        # 原有模式
+        r'(?:ORDER|ORDERS|JUDGMENT|CONCLUSION|DISPOSITION)\s*[:\.]?\s*\n((?:[^\n]+\n?){2,12})',
+        r'(?:IT IS ORDERED|I ORDER|THE COURT ORDERS?)\s*[:\.]?\s*((?:[^\n]+\n?){1,8})',
+        r'(?:For (?:these reasons|the foregoing reasons)|Accordingly|Therefore)\s*[,.]?\s*([^\n.]{30,500})',
+        
+        # 新增模式 - 更灵活的判决表达
+        r'(I (?:make an )?[Oo]rder[^.]*?(?:that|in terms of)[^.]*?[.\n])',  # "I make an Order that..." 或 "I order that..."
+        r'(I (?:would )?(?:make|grant|allow|dismiss|refuse)[^.]*?(?:order|application|claim)[^.]*?[.\n])',  # "I would make/grant/allow..."
+        r'([Bb]ased on the above[^.]*?[Oo]rder[^.]*?[.\n])',  # "Based on the above, I make an Order..."
+        r'([Ii]n conclusion[^.]*?(?:order|grant|dismiss|allow)[^.]*?[.\n])',  # "In conclusion, I..."
+        r'([Ff]or the (?:above )?reasons?[^.]*?(?:order|grant|dismiss|allow)[^.]*?[.\n])',  # "For the reasons..."
+    ))
+    # 每项为 (模式, 是否以句末 [.\n] 结尾)：这类模式的匹配只可能落在最后一个句号/换行之前
+    _EN_DECISION_PATTERNS = tuple((_compile_ascii(p, re.IGNORECASE), p.endswith(r'[.\n])')) for p in (
+        # 原有模式
+        r'((?:dismiss|grant|refuse|allow|upheld|affirmed).*?(?:application|claim|appeal|action))',
+        r'((?:Judgment|judgment)\s+(?:be\s+)?entered\s+for.*?)',
+        r'(I\s+(?:dismiss|grant|order|hold|refuse|allow).*?)',
+        r'((?:The\s+)?(?:application|appeal|claim)\s+(?:is|shall be)\s+(?:granted|dismissed|refused|allowed).*?)',
+        
+        # 新增模式 - 更多判决表达
+        r'((?:The\s+)?[Dd]efendants?.*?(?:pay|liable|responsible)[^.]*?(?:costs|damages|compensation)[^.]*?[.\n])',  # 被告支付费用
+        r'((?:The\s+)?[Pp]laintiffs?.*?(?:entitled|succeed)[^.]*?[.\n])',  # 原告胜诉
+        r'([Ss]ummary judgment.*?(?:granted|entered|allowed)[^.]*?[.\n])',  # 简易判决
+        r'([Cc]osts.*?(?:assessed|taxed|awarded)[^.]*?[.\n])',  # 费用裁定
+        r'([Ii]nterest.*?(?:awarded|granted|payable)[^.]*?[.\n])',  # 利息裁定
+        r'([Aa]pplication.*?(?:granted|dismissed|refused|allowed)[^.]*?[.\n])',  # 申请结果
+    ))
+    
+    # 上述每个英文模式都至少包含其中一个关键词：一个都没有时所有模式都不可能匹配
+    _EN_JUDGMENT_KEYWORD_RE = _compile_ascii(
+        r'order|judgment|conclusion|disposition|reason|accordingly|therefore|grant|allow|dismiss|refuse|make'
+        r'|upheld|affirmed|hold|defendant|plaintiff|costs|interest',
+        re.IGNORECASE)
+    
+    # 中文判决结果
+    _CN_ORDER_PATTERNS = tuple(re.compile(p) for p in (
+        r'(?:命令|判令|裁定|判決|判决)\s*[：:.]?\s*\n((?:[^\n]+\n?){2,10})',
+        r'(?:本庭|法庭|法院)\s*(?:命令|判令|裁定|判決|判决)\s*([^\n。]{15,400})',
+        r'(?:綜上所述|因此|故此|據此)\s*[，,：:.]*\s*([^\n。]{20,400})',
+    ))
+    _CN_DECISION_PATTERNS = tuple(re.compile(p) for p in (
+        r'((?:批准|拒絕|駁回|允許|准許|不准).*?(?:申請|請求|上訴))',
+        r'((?:勝訴|敗訴|得直|不得直).*?)',
+        r'((?:撤回|撤訴).*?)',
+    ))
+    # 上述每个中文模式都至少包含其中一个关键词
+    _CN_JUDGMENT_KEYWORD_RE = re.compile(
+        r'命令|判令|裁定|判決|判决|綜上所述|因此|故此|據此|批准|拒絕|駁回|允許|准許|不准|勝訴|敗訴|得直|撤回|撤訴')
+    
+    # 金额识别模式；中文文档另外识别中文币种和单位
+    _EN_AMOUNT_PATTERNS = (
+        # 完整货币表达
+        r'HK\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
+        r'USD?[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
+        r'US\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
+        r'RMB[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
+        
+        # 文字描述
+        r'(?:Hong Kong|US|United States)\s+Dollars?\s*[\d,]+(?:\.\d{2})?',
+        r'(?:the\s+)?sum of\s+HK\$[\d,]+(?:\.\d{2})?',
+        r'(?:the\s+)?amount of\s+USD?[\d,]+(?:\.\d{2})?',
+        
+        # 复合表达（本金+利息）
+        r'HK\$[\d,]+(?:\.\d{2})?\s+(?:plus|together with|and)\s+interest',
+        r'principal sum of\s+HK\$[\d,]+(?:\.\d{2})?',
+        r'outstanding balance of\s+USD?[\d,]+(?:\.\d{2})?',
+        
+        # 数字先行模式
+        r'[\d,]+(?:\.\d{2})?\s*(?:Hong Kong Dollars|US Dollars|USD|HKD)',
+        r'[\d,]+(?:\.\d{2})?\s*(?:million|billion|thousand)?\s*(?:dollars?|USD|HKD)',
+        
+        # 简单数字模式（大金额）
+        r'\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
+        r'[\d]{1,3}(?:,\d{3})+(?:\.\d{2})?',  # 格式化大数字
+    )
+    _CN_AMOUNT_PATTERNS = _EN_AMOUNT_PATTERNS + (
+        r'(?:港幣|港币|美金|美元|人民幣|人民币)[\d,\.]+(?:萬|万|億|亿)?',
+        r'[\d,]+(?:\.\d{2})?\s*(?:港元|美元|人民币)',
+        r'[\d,]+\s*(?:萬|万|億|亿)\s*(?:港元|美元)',
+    )
+    # 合并为一个交替模式（忽略大小写）一次扫描：匹配互不重叠，同一位置按上面的顺序取第一个能匹配的模式
+    # 开头的先行断言列出所有模式可能的首字符，其他位置不再逐个尝试各分支（新增模式时需同步补充）
+    # 安装了 regex 库时用它编译，扫描期间释放 GIL
+    _AMOUNT_FIRST_CHAR = r'(?=[\d,$hurtsaop港美人])'
+    _EN_AMOUNT_RE = (_regex or re).compile(
+        _AMOUNT_FIRST_CHAR + '(?:' + '|'.join(map('(?:{})'.format, _EN_AMOUNT_PATTERNS)) + ')', re.IGNORECASE)
+    _CN_AMOUNT_RE = (_regex or re).compile(
+        _AMOUNT_FIRST_CHAR + '(?:' + '|'.join(map('(?:{})'.format, _CN_AMOUNT_PATTERNS)) + ')', re.IGNORECASE)
+    
+    # 金额上下文关键词库：(语言, 金额类型) -> (关键词, 上下文词汇)
+    _AMOUNT_KEYWORDS = {
+        ('english', 'claim'): (
+            (
+                # 原有关键词
+                'claims', 'seeks', 'damages', 'compensation', 'plaintiff seeks',
+                'applicant seeks', 'prays for', 'relief sought',
+                
+                # 新增关键词
+                'sum of', 'amount of', 'payment of', 'recovery of', 'reimbursement of',
+                'refund of', 'outstanding', 'principal amount', 'principal sum',
+                'loan amount', 'debt of', 'owing', 'due and owing', 'balance of',
+                'unpaid sum', 'contractual amount', 'agreed sum', 'deposit of',
+                'security of', 'guarantee of', 'liability of', 'quantum of',
+                'monetary claim', 'financial claim', 'pecuniary loss', 'loss and damage',
+            ),
+            ('claim', 'seek', 'damage', 'compensation', 'debt', 'owing', 'recovery', 'loss'),
+        ),
+        ('english', 'judgment'): (
+            (
+                # 原有关键词
+                'ordered to pay', 'judgment for', 'costs assessed', 'defendant shall pay',
+                'award', 'grant', 'summarily assessed',
+                
+                # 新增关键词
+                'I order', 'the court orders', 'hereby ordered', 'it is ordered',
+                'judgment is entered', 'decree that', 'direct payment', 'liable to pay',
+                'responsible for', 'costs of', 'costs in the sum', 'interest on',
+                'penalty of', 'fine of', 'damages awarded', 'compensation ordered',
+                'restitution of', 'refund ordered', 'payment directed', 'sum awarded',
+                'amount granted', 'relief granted', 'monetary judgment', 'pecuniary award',
+                'costs summarily assessed', 'costs taxed', 'interest at', 'compound interest',
+                'default judgment for', 'judgment in favour', 'enter judgment for',
+            ),
+            ('order', 'pay', 'costs', 'assess', 'award', 'judgment', 'grant', 'liable'),
+        ),
+        ('chinese', 'claim'): (
+            (
+                '申請', '索償', '賠償', '損失', '要求', '請求', '原告申請', '申請人請求',
+                '欠款', '債務', '借款', '貸款', '本金', '利息', '違約金', '罰款',
+            ),
+            ('申請', '索償', '賠償', '要求', '損失', '債務'),
+        ),
+        ('chinese', 'judgment'): (
+            (
+                '判令', '命令', '賠償', '支付', '費用', '法庭命令', '判決', '裁定支付',
+                '責令', '判給', '給予', '授予', '課以', '罰款', '利息',
+            ),
+            ('判令', '支付', '費用', '賠償', '命令', '判決'),
+        ),
+    }
+    # 金额上下文负面关键词（避免误判）：金额类型 -> 词汇
+    _AMOUNT_NEGATIVE_WORDS = {
+        'claim': ('costs', 'legal fees', 'court fees', 'filing fee', 'ordered to pay'),
+        'judgment': ('claims', 'seeks damages', 'plaintiff seeks', 'applicant seeks'),
+    }
+    
+    # 从金额段落中提取具体数字的模式（忽略大小写）
+    # 紧接在金额之前、表明这是另一笔追加金额的措辞（"a further HK$..."、"另加港幣..."）
+    _AMOUNT_ADDITIONAL_RE = re.compile(
+        r'(?:\b(?:further|additional|plus)\s+(?:(?:sum|amount)\s+of\s+)?|另(?:外|加|付)?\s*(?:港幣|港元|人民幣|美元)?\s*)$', re.IGNORECASE)
+    _AMOUNT_ADDITIONAL_LOOKBEHIND = 30
+    
+    _AMOUNT_NUMBER_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+        # 标准货币格式
+        r'HK\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
+        r'USD?\s*[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
+        r'US\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
+        r'RMB[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
+        
+        # 文字表达
+        r'(?:Hong Kong|US|United States)\s+Dollars?\s*[\d,]+(?:\.\d{2})?',
+        r'(?:the\s+)?sum of\s+(?:HK\$|USD?|US\$)[\d,]+(?:\.\d{2})?',
+        r'(?:the\s+)?amount of\s+(?:HK\$|USD?|US\$)[\d,]+(?:\.\d{2})?',
+        
+        # 数字在前格式
+        r'[\d,]+(?:\.\d{2})?\s*(?:Hong Kong Dollars|US Dollars|USD|HKD)',
+        r'[\d,]+(?:\.\d{2})?\s*(?:million|billion|thousand)?\s*(?:dollars?|USD|HKD)',
+        
+        # 简单数字（大金额）
+        r'\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
+        r'[\d]{1,3}(?:,\d{3})+(?:\.\d{2})?',  # 格式化大数字
+        
+        # 中文格式
+        r'(?:港币|港幣|美金|美元|人民币|人民幣)[\d,]+(?:\.\d{2})?(?:\s*(?:万|萬|亿|億))?',
+        r'[\d,]+(?:\.\d{2})?\s*(?:港元|美元|人民币|元)',
+        r'[\d,]+\s*(?:万|萬|亿|億)\s*(?:港元|美元|元)',
+        
+        # 法律文档常见表达
+        r'damages?\s+(?:of|in the sum of|totaling|amounting to)\s+(?:HK\$|USD?|US\$|\$)[\d,]+(?:\.\d{2})?',
+        r'compensation\s+(?:of|in the sum of)\s+(?:HK\$|USD?|US\$|\$)[\d,]+(?:\.\d{2})?',
+        r'costs?\s+(?:of|in the sum of|assessed at)\s+(?:HK\$|USD?|US\$|\$)[\d,]+(?:\.\d{2})?',
+    ))
+    # 金额字符串中的数字部分
+    _AMOUNT_DIGITS_RE = re.compile(r'[\d,]+(?:\.\d{2})?')
+    # 金额单位及倍数，按顺序取第一个出现在（小写）金额字符串中的单位
+    _AMOUNT_UNIT_MULTIPLIERS = {
+        'million': 1000000, 'billion': 1000000000, 'thousand': 1000,
+        '万': 10000, '萬': 10000, '亿': 100000000, '億': 100000000,
+    }
+    
     def __init__(self, log_level=logging.INFO):
         """初始化提取器"""
         self.logger = self._setup_logger(log_level)
@@ -49,6 +806,18 @@ class DocumentExtractor:
             self.chinese_extractor = None
             self.logger.warning("Chinese document extractor not available")
         
+        # 按文档类型分派的英文当事人提取方法（未列出的类型使用BETWEEN段落格式）
+        self._party_extractors = {'DCCJ': self._extract_party_from_dccj}
+        
+        # BETWEEN段落缓存：(文本, 段落内容, (原告段落, 被告段落))
+        self._between_cache = (None, None, None)
+        
+        # 金额上下文评分表缓存：(语言, 金额类型) -> ((小写词, 分值), ...)
+        self._keyword_weight_cache = {}
+        
+        # 最近一次金额扫描结果：((文本摘要, 文本长度, 语言), 扫描结果)；以摘要为键，不保留文档文本
+        self._amount_matches_cache = (None, None)
+        
     def _setup_logger(self, log_level):
         """设置日志"""
         logger = logging.getLogger('DocumentExtractor')
@@ -82,14 +851,16 @@ class DocumentExtractor:
             import PyPDF2
             with open(pdf_path, 'rb') as file:
                 reader = PyPDF2.PdfReader(file)
+                page_texts = []
                 for i, page in enumerate(reader.pages):
                     try:
                         page_text = page.extract_text()
-                        text += page_text + "\n"
+                        page_texts.append(page_text + "\n")
                     except Exception as e:
-                        self.logger.warning(f"Error extracting page {i}: {e}")
+                        self.logger.warning("Error extracting page %d: %s", i, e)
                         continue
-            self.logger.info(f"PyPDF2: Successfully extracted {len(reader.pages)} pages")
+                text = "".join(page_texts)
+            self.logger.info("PyPDF2: Successfully extracted %d pages", len(reader.pages))
             if text:
                 text = self._clean_pdf_index_artifacts(text)
             return text
@@ -100,18 +871,19 @@ class DocumentExtractor:
         try:
             import fitz
             doc = fitz.open(pdf_path)
-            text = ""
+            page_texts = []
             for page_num in range(len(doc)):
                 try:
                     page = doc.load_page(page_num)
                     page_text = page.get_text()
                     # 处理编码问题
                     page_text = page_text.encode('utf-8', errors='ignore').decode('utf-8')
-                    text += page_text + "\n"
+                    page_texts.append(page_text + "\n")
                 except Exception as e:
-                    self.logger.warning(f"Error extracting page {page_num}: {e}")
+                    self.logger.warning("Error extracting page %d: %s", page_num, e)
                     continue
-            self.logger.info(f"Fitz: Successfully extracted {len(doc)} pages")
+            text = "".join(page_texts)
+            self.logger.info("Fitz: Successfully extracted %d pages", len(doc))
             doc.close()
             if text:
                 text = self._clean_pdf_index_artifacts(text)
@@ -123,17 +895,18 @@ class DocumentExtractor:
         try:
             import pdfplumber
             with pdfplumber.open(pdf_path) as pdf:
-                text = ""
+                page_texts = []
                 for i, page in enumerate(pdf.pages):
                     try:
                         page_text = page.extract_text() or ""
                         # 处理编码问题
                         page_text = page_text.encode('utf-8', errors='ignore').decode('utf-8')
-                        text += page_text + "\n"
+                        page_texts.append(page_text + "\n")
                     except Exception as e:
-                        self.logger.warning(f"Error extracting page {i}: {e}")
+                        self.logger.warning("Error extracting page %d: %s", i, e)
                         continue
-            self.logger.info(f"Pdfplumber: Successfully extracted {len(pdf.pages)} pages")
+                text = "".join(page_texts)
+            self.logger.info("Pdfplumber: Successfully extracted %d pages", len(pdf.pages))
             if text:
                 text = self._clean_pdf_index_artifacts(text)
             return text
@@ -240,8 +1013,8 @@ class DocumentExtractor:
             self.logger.warning("Empty text for language detection")
             return 'english'
         
-        # 取前200个词进行检测
-        words = text.split()[:200]
+        # 取前200个词进行检测（最多切分200次，只有剩余部分作为一整段保留，不切分全文）
+        words = text.split(maxsplit=200)[:200]
         analysis_text = ' '.join(words)
         
         # 简单判断：如果包含"被告"就是中文文档
@@ -299,7 +1072,7 @@ class DocumentExtractor:
         if not date_str:
             return ""
         
-        cleaned = re.sub(r'\s+', ' ', date_str.strip())
+        cleaned = _norm_ws(date_str)
         cleaned = re.sub(r'\s*-\s*\d+\s*-\s*', '', cleaned)
         cleaned = re.sub(r'\s*第\s*\d+\s*页.*$', '', cleaned)
         cleaned = re.sub(r'\s+(?:and|&|及)\s*$', '', cleaned)
@@ -383,7 +1156,7 @@ class DocumentExtractor:
         if not court_name:
             return ""
         
-        cleaned = re.sub(r'\s+', ' ', court_name.strip())
+        cleaned = _norm_ws(court_name)
         
         # 特殊处理：标准化中文法院名称的空格
         # 将"香 港 特 別 行 政 區"标准化为"香港特別行政區"
@@ -472,7 +1245,7 @@ class DocumentExtractor:
             for pattern in patterns:
                 match = re.search(pattern, text_start)
                 if match:
-                    case_number = re.sub(r'\s+', ' ', match.group(1).strip())
+                    case_number = _norm_ws(match.group(1))
                     self.logger.info(f"Found Chinese case number: '{case_number}'")
                     return case_number
                     
@@ -497,7 +1270,7 @@ class DocumentExtractor:
                 # 支持: ACTION NO, ACTION N O, ACTION NO ., ACTION NO. 等格式
                 if re.match(r'ACTION\s+(?:N\s+)?O\s*\.?\s*\d+[A-Z]?\s+OF\s+\d{4}', line, re.IGNORECASE):
                     # 已经完整，直接返回
-                    cleaned_line = re.sub(r'\s+', ' ', line.strip())
+                    cleaned_line = _norm_ws(line)
                     # 修复ACTION N O -> ACTION NO
                     cleaned_line = re.sub(r'ACTION\s+N\s+O\b', 'ACTION NO', cleaned_line, flags=re.IGNORECASE)
                     # 修复NO . -> NO
@@ -510,7 +1283,7 @@ class DocumentExtractor:
                     cleaned_line = re.sub(r'ACTION\s+N\s+O\b', 'ACTION NO', cleaned_line, flags=re.IGNORECASE)
                     # 修复NO . -> NO
                     cleaned_line = re.sub(r'NO\s*\.\s*', 'NO ', cleaned_line, flags=re.IGNORECASE)
-                    cleaned_line = re.sub(r'\s+', ' ', cleaned_line)
+                    cleaned_line = _WS_RE.sub(' ', cleaned_line)
                     return cleaned_line
                 
                 # 如果不完整，尝试与下一行组合
@@ -520,7 +1293,7 @@ class DocumentExtractor:
                     
                     # 检查组合后是否完整
                     if re.match(r'ACTION\s+(?:N\s+)?O\s*\.?\s*\d+[A-Z]?\s+OF\s+\d{4}', combined, re.IGNORECASE):
-                        cleaned_combined = re.sub(r'\s+', ' ', combined.strip())
+                        cleaned_combined = _norm_ws(combined)
                         # 修复ACTION N O -> ACTION NO
                         cleaned_combined = re.sub(r'ACTION\s+N\s+O\b', 'ACTION NO', cleaned_combined, flags=re.IGNORECASE)
                         # 修复NO . -> NO
@@ -533,7 +1306,7 @@ class DocumentExtractor:
                         cleaned_combined = re.sub(r'ACTION\s+N\s+O\b', 'ACTION NO', cleaned_combined, flags=re.IGNORECASE)
                         # 修复NO . -> NO
                         cleaned_combined = re.sub(r'NO\s*\.\s*', 'NO ', cleaned_combined, flags=re.IGNORECASE)
-                        cleaned_combined = re.sub(r'\s+', ' ', cleaned_combined)
+                        cleaned_combined = _WS_RE.sub(' ', cleaned_combined)
                         return cleaned_combined
                 
                 # 如果还不完整，尝试在当前行附近查找年份
@@ -557,7 +1330,7 @@ class DocumentExtractor:
                 # 如果找到ACTION但无法构建完整案件号，至少返回找到的部分
                 if re.search(r'(?:N\s+)?O\s*\.?\s*\d+', line, re.IGNORECASE):
                     self.logger.warning(f"Found incomplete ACTION line: '{line}'")
-                    cleaned_line = re.sub(r'\s+', ' ', line.strip())
+                    cleaned_line = _norm_ws(line)
                     # 修复ACTION N O -> ACTION NO
                     cleaned_line = re.sub(r'ACTION\s+N\s+O\b', 'ACTION NO', cleaned_line, flags=re.IGNORECASE)
                     # 修复NO . -> NO
@@ -654,7 +1427,7 @@ class DocumentExtractor:
                     case_number = match.group(0)
                 
                 # 清理和标准化
-                case_number = re.sub(r'\s+', ' ', case_number.strip())
+                case_number = _norm_ws(case_number)
                 self.logger.info(f"Found case number in middle section: '{case_number}' (pattern: {pattern[:30]}...)")
                 return case_number
         
@@ -703,7 +1476,7 @@ class DocumentExtractor:
         for pattern in chinese_patterns:
             match = re.search(pattern, middle_section)
             if match:
-                return re.sub(r'\s+', ' ', match.group(0).strip())
+                return _norm_ws(match.group(0))
         
         return ""
     
@@ -716,232 +1489,193 @@ class DocumentExtractor:
         if language == 'english':
             return self._extract_plaintiff_improved(text, doc_type)
         else:
-            # 中文原告提取保持原逻辑
-            patterns = [
-                r'原告人\s*\n\s*([A-Za-z\s,]+?)(?=\n|\s*及\s*)',
-                r'原告人\s*\n\s*([^\n]+?)(?=\s*第|\s*被告|\s*_)',
-                r'(?:第一原告人|原告人)\s*[：:]\s*([^\n第被]+)',
-                r'(?:第一原告人|原告人)\s*([A-Za-z\s,\.]+)(?=\s*第|\s*被告|\s*及)',
-                r'原告[：:]\s*([^\n]+)',
-                r'申請人[：:]\s*([^\n]+)',
-                r'上訴人[：:]\s*([^\n]+)',
-                r'第一原告人\s*([A-Za-z\s,]+)(?=\n|第二|第三|被告)',
-            ]
+            # 快速预检：不含任何原告关键词时所有模式都不可能匹配
+            if not any(keyword in text for keyword in _CN_PLAINTIFF_KEYWORDS):
+                return ""
             
-            for pattern in patterns:
-                match = re.search(pattern, text)
+            # 中文原告提取保持原逻辑（模式按优先级排列，仅在关键词位置尝试匹配）
+            starts = [m.start() for m in _CN_PLAINTIFF_ANCHOR_RE.finditer(text)]
+            
+            for pattern in _CN_PLAINTIFF_PATTERNS:
+                match = self._match_at_anchors(pattern, text, starts)
                 if match:
-                    plaintiff = match.group(1).strip()
-                    plaintiff = re.sub(r'\s+', ' ', plaintiff)
-                    plaintiff = re.sub(r'^\s*[：:]\s*', '', plaintiff)
-                    if len(plaintiff) > 3 and len(plaintiff) < 200 and not re.match(r'^\d+\s*$', plaintiff):
+                    plaintiff = _norm_ws(match.group(1))
+                    # 仅当捕获内容以冒号开头时（如"原告人\n：XXX"）才需去除
+                    if plaintiff.startswith(('：', ':')):
+                        plaintiff = plaintiff[1:].lstrip()
+                    if len(plaintiff) > 3 and len(plaintiff) < 200 and not plaintiff.isdecimal():
                         return plaintiff
         return ""
     
+    def _match_at_anchors(self, pattern, text: str, starts: list):
+        """在预先找到的关键词位置依次尝试匹配，结果与 pattern.search(text) 相同
+        
+        模式均以关键词开头，因此只可能从这些位置开始匹配；
+        一次关键词扫描即可替代每个模式各自的全文扫描。
+        """
+        for pos in starts:
+            match = pattern.match(text, pos)
+            if match:
+                return match
+        return None
+    
     def _extract_plaintiff_improved(self, text: str, doc_type: str = 'GENERIC') -> str:
         """改进的英文原告提取方法 - 支持DCCJ和HCA格式"""
-        
-        # 根据文档类型选择处理策略
-        if doc_type == 'DCCJ':
-            # DCCJ格式：直接搜索"XXX Plaintiff"格式
-            dccj_patterns = [
-                r'([A-Z][A-Z\s&\.,\(\)]+?)\s*\n\s*Plaintiff\s*(?:\n|$)',
-                r'([A-Z][A-Z\s&\.,\(\)]+?)\s+Plaintiff\s*(?:\n|$)',
-                r'([A-Z][A-Z\s&\.,\(\)\-]+?)\s*\n\s*Plaintiff',
-                r'([A-Z][A-Z\s&\.,\(\)\-]+?)\s+Plaintiff',
-            ]
-            
-            for pattern in dccj_patterns:
-                matches = re.findall(pattern, text, re.MULTILINE)
-                if matches:
-                    for match in matches:
-                        clean_name = re.sub(r'\s+', ' ', match.strip())
-                        clean_name = re.sub(r'^and\s+', '', clean_name, flags=re.IGNORECASE)
-                        # 确保是有效的公司名称（全大写或首字母大写）
-                        if len(clean_name) > 3 and len(clean_name) < 100:
-                            self.logger.info(f"DCCJ格式原告匹配: '{clean_name}'")
-                            return clean_name
-        else:
-            # HCA格式：标准BETWEEN段落格式
-            between_match = re.search(r'BETWEEN\s*(.*?)\s*(?=Before:|__________|Date|主審)', text, re.DOTALL | re.IGNORECASE)
-            if between_match:
-                between_content = between_match.group(1).strip()
-                
-                # 找到"AND"的位置，提取"AND"之前的所有内容作为原告段落
-                and_match = re.search(r'\s+AND\s+', between_content, re.IGNORECASE)
-                if and_match:
-                    plaintiff_section = between_content[:and_match.start()].strip()
-                    
-                    # 提取原告信息
-                    plaintiffs = self._extract_parties_robust(plaintiff_section, 'Plaintiff')
-                    
-                    # 智能格式化
-                    return self._format_parties_smart(plaintiffs, 'Plaintiff')
-        
-        return ""
+        # 根据文档类型选择处理策略（DCCJ为直接格式，其余为BETWEEN段落格式）
+        extract_party = self._party_extractors.get(doc_type, self._extract_party_from_between)
+        return extract_party(text, 'Plaintiff')
     
     def extract_defendant(self, text: str, language: str, doc_type: str = 'GENERIC') -> str:
         """提取被告信息 - 改进版：修复不完整提取并智能格式化，支持DCCJ和HCA格式"""
         if language == 'english':
             return self._extract_defendant_improved(text, doc_type)
         else:
-            # 中文被告提取保持原逻辑
-            patterns = [
-                r'第一被告人\s*\n?\s*([A-Za-z\s,]+?)(?=\s*第二被告人|\s*第三被告人|\s*_)',
-                r'第一被告人\s*([A-Za-z\s,\.]+)(?=\s*第二|\s*第三|\s*_)',
-                r'第三被告人\s*([^_\n]+?)(?=_|Before|Date|\s*$)',
-                r'第三被告人\s*([^\n]+?)(?=\s*主審|\s*聆訊|\s*判)',
-                r'(?:第一被告人|被告人)\s*[：:]\s*([^\n第原]+)',
-                r'(?:被告|被申請人)\s*[：:]\s*([^\n]+)',
-                r'被告[：:]\s*([^\n]+)',
-                r'被申請人[：:]\s*([^\n]+)',
-                r'被上訴人[：:]\s*([^\n]+)',
-                r'(?:第一被告人|被告人)\s*([A-Za-z\s,]+)(?=\n|第二|第三|原告|Before)',
-            ]
+            # 快速预检：不含任何被告关键词时所有模式都不可能匹配
+            if not any(keyword in text for keyword in _CN_DEFENDANT_KEYWORDS):
+                return ""
             
-            for pattern in patterns:
-                match = re.search(pattern, text)
+            # 中文被告提取保持原逻辑（模式按优先级排列，仅在关键词位置尝试匹配）
+            starts = [m.start() for m in _CN_DEFENDANT_ANCHOR_RE.finditer(text)]
+            
+            for pattern in _CN_DEFENDANT_PATTERNS:
+                match = self._match_at_anchors(pattern, text, starts)
                 if match:
-                    defendant = match.group(1).strip()
-                    defendant = re.sub(r'\s+', ' ', defendant)
-                    defendant = re.sub(r'^\s*[：:]\s*', '', defendant)
-                    if len(defendant) > 3 and len(defendant) < 500 and not re.match(r'^\d+\s*$', defendant):
+                    defendant = _norm_ws(match.group(1))
+                    # 仅当捕获内容以冒号开头时（如"原告人\n：XXX"）才需去除
+                    if defendant.startswith(('：', ':')):
+                        defendant = defendant[1:].lstrip()
+                    if len(defendant) > 3 and len(defendant) < 500 and not defendant.isdecimal():
                         return defendant
         return ""
     
     def _extract_defendant_improved(self, text: str, doc_type: str = 'GENERIC') -> str:
         """改进的英文被告提取方法 - 支持DCCJ和HCA格式"""
+        # 根据文档类型选择处理策略（DCCJ为直接格式，其余为BETWEEN段落格式）
+        extract_party = self._party_extractors.get(doc_type, self._extract_party_from_between)
+        return extract_party(text, 'Defendant')
+    
+    def _extract_party_from_dccj(self, text: str, party_type: str) -> str:
+        """DCCJ格式：直接搜索"XXX Plaintiff" / "XXX Defendant"格式"""
+        clean_name = self._extract_dccj_party(text, party_type)
+        if clean_name:
+            self.logger.info("DCCJ格式%s匹配: '%s'", self._PARTY_LABELS[party_type], clean_name)
+        return clean_name
+    
+    def _extract_party_from_between(self, text: str, party_type: str) -> str:
+        """HCA格式：标准BETWEEN段落格式，"AND"之前为原告段落，之后为被告段落"""
+        between_split = self._get_between_split(text)
+        if not between_split:
+            return ""
         
-        # 根据文档类型选择处理策略
-        if doc_type == 'DCCJ':
-            # DCCJ格式：直接搜索"XXX Defendant"格式
-            dccj_patterns = [
-                r'([A-Z][A-Z\s&\.,\(\)]+?)\s*\n\s*Defendant\s*(?:\n|$)',
-                r'([A-Z][A-Z\s&\.,\(\)]+?)\s+Defendant\s*(?:\n|$)',
-                r'([A-Z][A-Z\s&\.,\(\)\-]+?)\s*\n\s*Defendant',
-                r'([A-Z][A-Z\s&\.,\(\)\-]+?)\s+Defendant',
-            ]
-            
-            for pattern in dccj_patterns:
-                matches = re.findall(pattern, text, re.MULTILINE)
-                if matches:
-                    for match in matches:
-                        clean_name = re.sub(r'\s+', ' ', match.strip())
-                        clean_name = re.sub(r'^and\s+', '', clean_name, flags=re.IGNORECASE)
-                        # 确保是有效的公司名称（全大写或首字母大写）
-                        if len(clean_name) > 3 and len(clean_name) < 100:
-                            self.logger.info(f"DCCJ格式被告匹配: '{clean_name}'")
-                            return clean_name
-        else:
-            # HCA格式：标准BETWEEN段落格式
-            between_match = re.search(r'BETWEEN\s*(.*?)\s*(?=Before:|__________|Date|主審)', text, re.DOTALL | re.IGNORECASE)
-            if between_match:
-                between_content = between_match.group(1).strip()
-                
-                # 找到"AND"的位置，提取"AND"之后的所有内容作为被告段落
-                and_match = re.search(r'\s+AND\s+', between_content, re.IGNORECASE)
+        section = between_split[0] if party_type == 'Plaintiff' else between_split[1]
+        
+        # 提取当事人信息并智能格式化
+        names, numbers = self._extract_parties_robust(section, party_type)
+        return self._format_parties_smart(names, numbers, party_type)
+    
+    def _get_between_content(self, text: str) -> Optional[str]:
+        """获取BETWEEN段落内容（按文档缓存，同一文本只扫描一次）"""
+        if self._between_cache[0] is not text:
+            between_content, between_split = None, None
+            # 快速预检：不含"BETWEEN"时无需运行DOTALL正则
+            match = _BETWEEN_RE.search(text) if 'between' in text.lower() else None
+            if match:
+                between_content = match.group(1).strip()
+                # 找到"AND"的位置，之前为原告段落，之后为被告段落
+                and_match = _BETWEEN_AND_RE.search(between_content)
                 if and_match:
+                    plaintiff_section = between_content[:and_match.start()].strip()
                     defendant_section = between_content[and_match.end():].strip()
-                    
-                    # 清理被告段落，移除下划线等无关内容
+                    # 清理被告段落，移除末尾的下划线分隔符等无关内容
                     defendant_section = re.sub(r'_{5,}.*$', '', defendant_section, flags=re.DOTALL).strip()
-                    
-                    # 提取被告信息
-                    defendants = self._extract_parties_robust(defendant_section, 'Defendant')
-                    
-                    # 智能格式化
-                    return self._format_parties_smart(defendants, 'Defendant')
+                    between_split = (plaintiff_section, defendant_section)
+            self._between_cache = (text, between_content, between_split)
+        return self._between_cache[1]
+    
+    def _get_between_split(self, text: str) -> Optional[tuple]:
+        """按"AND"拆分BETWEEN段落，返回 (原告段落, 被告段落)"""
+        self._get_between_content(text)
+        return self._between_cache[2]
+    
+    def _extract_dccj_party(self, text: str, party_type: str) -> str:
+        """DCCJ格式当事人提取 - 一次扫描，按格式优先级选取匹配
         
-        return ""
+        优先级：换行+行尾 > 行尾 > 换行 > 同行
+        """
+        best_name, best_rank = "", -1
+        for match in _DCCJ_PARTY_PATTERNS[party_type].finditer(text):
+            clean_name = _norm_ws(match.group(1))
+            clean_name = _LEADING_AND_RE.sub('', clean_name)
+            # 确保是有效的公司名称（全大写或首字母大写）
+            if not 3 < len(clean_name) < 100:
+                continue
+            rank = (match.group(3) is not None) * 2 + ('\n' in match.group(2))
+            if rank == 3:
+                return clean_name
+            if rank > best_rank:
+                best_name, best_rank = clean_name, rank
+        return best_name
     
-    def _extract_parties_robust(self, section: str, party_type: str) -> list:
-        """鲁棒的当事人提取方法 - 支持各种格式"""
-        parties = []
+    def _extract_parties_robust(self, section: str, party_type: str) -> tuple:
+        """鲁棒的当事人提取方法 - 支持各种格式
         
+        Returns:
+            (姓名列表, 编号列表) 两个平行列表，无编号的当事人编号为 None
+        """
         # 方法1：提取编号当事人（如：1st Plaintiff, 2nd Defendant等）
-        numbered_parties = self._extract_numbered_parties_enhanced(section, party_type)
-        if numbered_parties:
-            parties.extend(numbered_parties)
+        names, numbers = self._extract_numbered_parties_enhanced(section, party_type)
         
         # 方法2：如果没有编号当事人，尝试提取简单格式
-        if not parties:
-            simple_party = self._extract_simple_party(section, party_type)
-            if simple_party:
-                parties.append(simple_party)
+        if not names:
+            simple_name = self._extract_simple_party(section, party_type)
+            if simple_name:
+                names, numbers = [simple_name], [None]
         
-        return parties
+        return names, numbers
     
-    def _extract_numbered_parties_enhanced(self, section: str, party_type: str) -> list:
-        """增强的编号当事人提取"""
-        parties = []
-        
-        # 改进的模式：更准确地捕获姓名
-        patterns = [
-            # 模式1：多行格式 - 姓名在上，编号在下
-            rf'([A-Z][A-Za-z\s,\.\(\)&\-\'（）]+?(?:\([^)]*\))?(?:（[^）]*）)?)\s*\n\s*(\d+)(?:st|nd|rd|th)\s+{party_type}',
-            
-            # 模式2：同行格式 - 姓名和编号在同一行
-            rf'([A-Z][A-Za-z\s,\.\(\)&\-\'（）]+?(?:\([^)]*\))?(?:（[^）]*）)?)\s+(\d+)(?:st|nd|rd|th)\s+{party_type}',
-            
-            # 模式3：反向格式 - 编号在前，姓名在后
-            rf'(\d+)(?:st|nd|rd|th)\s+{party_type}\s*\n\s*([A-Z][A-Za-z\s,\.\(\)&\-\'（）]+?(?:\([^)]*\))?(?:（[^）]*）)?)',
-            
-            # 模式4：简化格式 - 只有姓名+身份（无编号）
-            rf'([A-Z][A-Za-z\s,\.\(\)&\-\'（）]+?(?:\([^)]*\))?(?:（[^）]*）)?)\s+{party_type}(?!\s*\d)',
-        ]
+    def _extract_numbered_parties_enhanced(self, section: str, party_type: str) -> tuple:
+        """增强的编号当事人提取，返回 (姓名列表, 编号列表)"""
+        names = []
+        numbers = []
+        seen_names = set()
         
-        for i, pattern in enumerate(patterns):
-            matches = re.findall(pattern, section, re.IGNORECASE | re.MULTILINE)
-            
-            for match in matches:
-                if i < 3:  # 前3个模式有编号
-                    if i == 2:  # 反向格式
-                        number, name = match
-                    else:  # 正向格式
-                        name, number = match
-                    
-                    clean_name = self._clean_party_name(name)
-                    if clean_name:
-                        suffix = self._get_ordinal_suffix(int(number))
-                        party_info = {
-                            'name': clean_name,
-                            'number': int(number),
-                            'formatted': f"{clean_name} ({number}{suffix} {party_type})"
-                        }
-                        parties.append(party_info)
-                else:  # 第4个模式无编号
-                    name = match
-                    clean_name = self._clean_party_name(name)
-                    if clean_name:
-                        party_info = {
-                            'name': clean_name,
-                            'number': None,
-                            'formatted': f"{clean_name} ({party_type})"
-                        }
-                        parties.append(party_info)
+        # 按格式优先级依次尝试：多行格式 > 同行格式 > 反向格式 > 简化格式（无编号）
+        for matches in self._iter_enhanced_party_matches(section, party_type):
+            for name, number in matches:
+                clean_name = self._clean_party_name(name)
+                # 去重：同名当事人只保留第一次出现
+                if not clean_name or clean_name in seen_names:
+                    continue
+                seen_names.add(clean_name)
+                names.append(clean_name)
+                numbers.append(int(number) if number is not None else None)
             
             # 如果已经找到当事人，不继续尝试其他模式
-            if parties:
+            if names:
                 break
         
-        # 去重并排序
-        unique_parties = []
-        seen_names = set()
-        
-        for party in parties:
-            if party['name'] not in seen_names:
-                unique_parties.append(party)
-                seen_names.add(party['name'])
-        
         # 按编号排序（如果有编号的话）
-        unique_parties.sort(key=lambda x: x['number'] if x['number'] is not None else 0)
+        order = sorted(range(len(names)), key=lambda i: numbers[i] or 0)
+        return [names[i] for i in order], [numbers[i] for i in order]
+    
+    def _iter_enhanced_party_matches(self, section: str, party_type: str):
+        """按格式优先级依次产出 (姓名, 编号) 匹配列表，后续格式仅在需要时才扫描"""
+        forward, reverse, simple = _ENHANCED_PARTY_PATTERNS[party_type]
+        
+        # 正向格式一次扫描：分隔空白含换行的为多行格式，否则为同行格式
+        multiline, same_line = [], []
+        for name, separator, number in forward.findall(section):
+            (multiline if '\n' in separator else same_line).append((name, number))
+        yield multiline
+        yield same_line
         
-        return unique_parties
+        yield [(name, number) for number, name in reverse.findall(section)]
+        yield [(name, None) for name in simple.findall(section)]
     
-    def _extract_simple_party(self, section: str, party_type: str) -> dict:
+    def _extract_simple_party(self, section: str, party_type: str) -> Optional[str]:
         """提取简单格式的当事人（无编号）"""
         # 先清理段落
-        clean_section = re.sub(r'\s+', ' ', section.strip())
+        clean_section = _norm_ws(section)
         
         # 移除身份标识
         clean_section = re.sub(rf'\s*{party_type}\s*$', '', clean_section, flags=re.IGNORECASE)
@@ -951,11 +1685,7 @@ class DocumentExtractor:
         
         # 验证是否是有效的姓名
         if self._is_valid_party_name(clean_section):
-            return {
-                'name': clean_section,
-                'number': None,
-                'formatted': f"{clean_section} ({party_type})"
-            }
+            return clean_section
         
         return None
     
@@ -965,14 +1695,14 @@ class DocumentExtractor:
             return ""
         
         # 基本清理
-        clean = re.sub(r'\s+', ' ', name.strip())
+        clean = _norm_ws(name)
         
         # 移除开头和结尾的干扰词
-        clean = re.sub(r'^(?:and\s+|&\s+)', '', clean, flags=re.IGNORECASE)
+        clean = _LEADING_AND_RE.sub('', clean)
         clean = re.sub(r'\s*(?:and|&)\s*$', '', clean, flags=re.IGNORECASE)
         
         # 移除多余的标点
-        clean = re.sub(r'^[,\s]+|[,\s]+$', '', clean)
+        clean = _EDGE_COMMA_SPACE_RE.sub('', clean)
         
         # 验证清理后的结果
         if self._is_valid_party_name(clean):
@@ -988,157 +1718,96 @@ class DocumentExtractor:
         if len(name) > 200:
             return False
         
-        # 必须包含字母
-        if not re.search(r'[A-Za-z]', name):
-            return False
-        
-        # 不能全是数字
-        if re.match(r'^\d+$', name):
+        # 必须包含字母（包含字母即不可能全是数字）
+        if not self._HAS_LETTER_RE.search(name):
             return False
         
         # 不能是常见的干扰词
-        bad_words = [
-            'and', 'or', 'the', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'before', 'after', 'during', 'plaintiff', 'defendant', 'court', 'judge',
-            'chambers', 'sitting', 'hearing', 'date', 'action', 'case'
-        ]
-        
-        if name.lower().strip() in bad_words:
-            return False
-        
-        return True
+        return name.lower().strip() not in self._PARTY_BAD_WORDS
     
-    def _format_parties_smart(self, parties: list, party_type: str) -> str:
-        """智能格式化当事人信息"""
-        if not parties:
+    def _format_parties_smart(self, names: list, numbers: list, party_type: str) -> str:
+        """智能格式化当事人信息（姓名与编号为平行列表）"""
+        if not names:
             return ""
         
-        if len(parties) == 1:
+        if len(names) == 1:
             # 单个当事人：只显示名字
-            return parties[0]['name']
+            return names[0]
         else:
             # 多个当事人：显示完整标识
             formatted_list = []
-            for party in parties:
-                if party['number'] is not None:
-                    suffix = self._get_ordinal_suffix(party['number'])
-                    formatted_list.append(f"{party['name']} ({party['number']}{suffix} {party_type})")
+            for name, number in zip(names, numbers):
+                if number is not None:
+                    suffix = self._get_ordinal_suffix(number)
+                    formatted_list.append(f"{name} ({number}{suffix} {party_type})")
                 else:
-                    formatted_list.append(f"{party['name']} ({party_type})")
+                    formatted_list.append(f"{name} ({party_type})")
             
             return ' | '.join(formatted_list)
     
-
-    
     def _extract_defendant_with_format(self, text: str) -> str:
         """按照原文格式提取被告信息"""
-        # 查找BETWEEN段落
-        between_match = re.search(r'BETWEEN\s*(.*?)\s*(?=Before:|__________|Date|主審)', text, re.DOTALL | re.IGNORECASE)
-        if not between_match:
-            return ""
-        
-        between_content = between_match.group(1).strip()
-        
-        # 找到"AND"的位置，提取"AND"之后的所有内容作为被告段落
-        and_match = re.search(r'\s+AND\s+', between_content, re.IGNORECASE)
-        if not and_match:
+        # 查找BETWEEN段落并取"AND"之后的被告段落
+        between_split = self._get_between_split(text)
+        if not between_split:
             return ""
         
-        defendant_section = between_content[and_match.end():].strip()
-        
-        # 清理被告段落，移除下划线等无关内容
-        # 先移除末尾的下划线分隔符
-        defendant_section = re.sub(r'_{5,}.*$', '', defendant_section, flags=re.DOTALL).strip()
+        defendant_section = between_split[1]
         
         defendants = []
         
-        # 使用更精确的模式匹配被告信息
-        # 模式1：标准格式 - 多行姓名 + 编号 (如用户图片所示)
-        
-        # 按行处理，但更智能地组合名称和编号
-        lines = defendant_section.split('\n')
-        current_name_parts = []
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
-                i += 1
-                continue
-            
-            # 跳过单独的布局字符
-            if re.match(r'^[A-Z\-\+\s]{1,3}$', line):
-                i += 1
-                continue
+        # 以编号标识行为锚点一次扫描：标识行之间的内容即为姓名（可跨多行）
+        last_end = 0
+        for marker in _DEFENDANT_MARKER_RE.finditer(defendant_section):
+            name = self._join_party_lines(defendant_section[last_end:marker.start()])
+            last_end = marker.end()
             
-            # 检查当前行是否是编号标识行
-            defendant_match = re.match(r'^(\d+)(?:st|nd|rd|th)\s+Defendant\s*$', line, re.IGNORECASE)
-            if defendant_match:
-                # 这是一个编号行，前面的内容应该是姓名
-                if current_name_parts:
-                    name = ' '.join(current_name_parts).strip()
-                    ordinal_num = int(defendant_match.group(1))
+            if marker.group(1):
+                # 单独的编号标识行，前面的内容应该是姓名
+                if name:
+                    ordinal_num = int(marker.group(1))
                     suffix = self._get_ordinal_suffix(ordinal_num)
                     defendants.append(f"{name} ({ordinal_num}{suffix} Defendant)")
-                    current_name_parts = []
-                i += 1
-            elif re.match(r'^Defendant\s*$', line, re.IGNORECASE):
+            elif marker.group(3):
+                # 同一行包含姓名和编号
+                name = f"{name} {marker.group(2).strip()}".strip()
+                ordinal_num = int(marker.group(3))
+                suffix = self._get_ordinal_suffix(ordinal_num)
+                defendants.append(f"{name} ({ordinal_num}{suffix} Defendant)")
+            elif name:
                 # 单独的 "Defendant" 标识
-                if current_name_parts:
-                    name = ' '.join(current_name_parts).strip()
-                    defendants.append(f"{name} (Defendant)")
-                    current_name_parts = []
-                i += 1
-            else:
-                # 这可能是姓名的一部分，或者是包含编号的行
-                # 检查这行是否包含编号信息
-                inline_match = re.match(r'^(.*?)\s+(\d+)(?:st|nd|rd|th)\s+Defendant\s*$', line, re.IGNORECASE)
-                if inline_match:
-                    # 同一行包含姓名和编号
-                    name_part = inline_match.group(1).strip()
-                    if current_name_parts:
-                        name = ' '.join(current_name_parts + [name_part]).strip()
-                    else:
-                        name = name_part
-                    ordinal_num = int(inline_match.group(2))
-                    suffix = self._get_ordinal_suffix(ordinal_num)
-                    defendants.append(f"{name} ({ordinal_num}{suffix} Defendant)")
-                    current_name_parts = []
-                else:
-                    # 这是姓名的一部分
-                    current_name_parts.append(line)
-                i += 1
+                defendants.append(f"{name} (Defendant)")
         
         # 处理剩余的姓名部分（如果有的话）
-        if current_name_parts:
-            name = ' '.join(current_name_parts).strip()
-            if name and not re.match(r'^_{3,}|Before:|Date:', name, re.IGNORECASE):
-                # 如果已经有被告，这个应该是下一个编号
-                if defendants:
-                    next_num = len(defendants) + 1
-                    suffix = self._get_ordinal_suffix(next_num)
-                    defendants.append(f"{name} ({next_num}{suffix} Defendant)")
-                else:
-                    defendants.append(f"{name} (Defendant)")
+        name = self._join_party_lines(defendant_section[last_end:])
+        if name and not re.match(r'^_{3,}|Before:|Date:', name, re.IGNORECASE):
+            # 如果已经有被告，这个应该是下一个编号
+            if defendants:
+                next_num = len(defendants) + 1
+                suffix = self._get_ordinal_suffix(next_num)
+                defendants.append(f"{name} ({next_num}{suffix} Defendant)")
+            else:
+                defendants.append(f"{name} (Defendant)")
         
         if defendants:
             result = ' | '.join(defendants)
-            self.logger.info(f"格式化提取被告: '{result}'")
+            self.logger.info("格式化提取被告: '%s'", result)
             return result
         
         return ""
     
+    def _join_party_lines(self, block: str) -> str:
+        """合并多行姓名，跳过空行和单独的布局字符"""
+        block = _LAYOUT_LINE_RE.sub('', block)
+        return ' '.join(line for line in map(str.strip, block.split('\n')) if line)
+    
     def _extract_multiple_parties(self, text: str, party_type: str) -> str:
         """提取多方当事人（英文）- 增强版"""
         # 查找BETWEEN段落
-        between_pattern = r'BETWEEN\s*(.*?)\s*(?=Before:|__________|Date|主審)'
-        match = re.search(between_pattern, text, re.DOTALL | re.IGNORECASE)
-        
-        if not match:
+        between_content = self._get_between_content(text)
+        if between_content is None:
             return ""
         
-        between_content = match.group(1).strip()
-        
         if party_type == 'Plaintiff':
             return self._extract_plaintiffs_improved(between_content)
         else:  # Defendant
@@ -1162,7 +1831,7 @@ class DocumentExtractor:
             return plaintiffs[0]
         else:
             # 非编号的单一原告
-            clean_section = re.sub(r'\s+', ' ', plaintiff_section.strip())
+            clean_section = _norm_ws(plaintiff_section)
             clean_section = re.sub(r'\s*Plaintiff\s*$', '', clean_section, flags=re.IGNORECASE)
             if len(clean_section) > 3 and len(clean_section) < 300:
                 return clean_section
@@ -1212,37 +1881,25 @@ class DocumentExtractor:
         """从全文搜索被告信息（处理格式异常）"""
         defendants = []
         
-        # 扩展的被告搜索模式
-        patterns = [
-            # 模式1：直接的编号被告
-            r'([A-Za-z\s,\.\(\)&\-\']+?)\s*\n\s*(\d+)(?:st|nd|rd|th)\s+Defendant',
-            # 模式2：单一被告（无编号）
-            r'and\s+([A-Z][A-Za-z\s,\.\(\)&\-\']{10,80}?)\s*\n\s*Defendant(?!\s*\d)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        # 扩展的被告搜索模式：编号被告 / 单一被告（无编号）
+        for pattern in _FULLTEXT_DEFENDANT_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 if isinstance(match, tuple):
                     name, number = match
-                    clean_name = re.sub(r'\s+', ' ', name.strip())
-                    clean_name = re.sub(r'^(?:and\s+)?', '', clean_name, flags=re.IGNORECASE)
+                    clean_name = _norm_ws(name)
+                    clean_name = _LEADING_AND_RE.sub('', clean_name)
                     if len(clean_name) > 3:
                         suffix = self._get_ordinal_suffix(int(number))
                         defendants.append(f"{clean_name} ({number}{suffix} Defendant)")
                 else:
-                    clean_name = re.sub(r'\s+', ' ', str(match).strip())
-                    clean_name = re.sub(r'^(?:and\s+)?', '', clean_name, flags=re.IGNORECASE)
+                    clean_name = _norm_ws(str(match))
+                    clean_name = _LEADING_AND_RE.sub('', clean_name)
                     if len(clean_name) > 3:
                         defendants.append(clean_name)
         
-        # 去重并限制数量
-        unique_defendants = []
-        for defendant in defendants:
-            if defendant not in unique_defendants:
-                unique_defendants.append(defendant)
-            if len(unique_defendants) >= 10:  # 最多10个被告
-                break
+        # 去重（保持顺序）并限制数量：最多10个被告
+        unique_defendants = list(dict.fromkeys(defendants))[:10]
         
         if len(unique_defendants) > 1:
             return ' | '.join(unique_defendants)
@@ -1261,7 +1918,7 @@ class DocumentExtractor:
             
             # 简单清理
             defendant_section = re.sub(r'\s*Defendant.*$', '', defendant_section, flags=re.IGNORECASE)
-            defendant_section = re.sub(r'\s+', ' ', defendant_section)
+            defendant_section = _WS_RE.sub(' ', defendant_section)
             
             if 5 < len(defendant_section) < 200:
                 return defendant_section
@@ -1270,40 +1927,30 @@ class DocumentExtractor:
     
     def _extract_numbered_parties(self, section: str, party_type: str) -> list:
         """从段落中提取编号的当事人 - 优化姓名捕获"""
-        parties = []
-        
-        # 扩展的匹配模式，支持更多序数词
-        ordinals = [
-            '1st', '2nd', '3rd', '4th', '5th', '6th', '7th', '8th', '9th', '10th',
-            '11th', '12th', '13th', '14th', '15th', '16th', '17th', '18th', '19th', '20th'
-        ]
-        
-        for ordinal in ordinals:
-            # 更精确的模式匹配，确保捕获完整姓名
-            patterns = [
-                # 模式1：标准换行格式 - 针对BETWEEN段落优化
-                rf'([A-Za-z\s,\.\(\)&\-\'（）]+?(?:\([^)]*\))?(?:（[^）]*）)?)\s*\n\s*{ordinal}\s+{party_type}',
-                # 模式2：同行格式
-                rf'([A-Za-z\s,\.\(\)&\-\'（）]+?(?:\([^)]*\))?(?:（[^）]*）)?)\s+{ordinal}\s+{party_type}',
-                # 模式3：中间有括号注释的换行格式
-                rf'([A-Za-z\s,\.\(\)&\-\'（）]+?)\s*\n\s*\([^)]*\)\s*\n\s*{ordinal}\s+{party_type}',
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, section, re.IGNORECASE | re.MULTILINE)
-                for match in matches:
-                    clean_name = re.sub(r'\s+', ' ', match.strip())
-                    clean_name = re.sub(r'^(?:and\s+)?', '', clean_name, flags=re.IGNORECASE)
-                    
-                    # 更严格的验证：确保是有效的姓名
-                    name_for_validation = re.sub(r'\([^)]*\)', '', clean_name)
-                    name_for_validation = re.sub(r'（[^）]*）', '', name_for_validation).strip()
-                    
-                    # 确保不是空的或只有标点符号
-                    if len(name_for_validation) > 2 and re.search(r'[A-Za-z]', name_for_validation):
-                        party_entry = f"{clean_name} ({ordinal} {party_type})"
-                        if party_entry not in parties:  # 避免重复
-                            parties.append(party_entry)
+        found = []
+
+        # 序数词作为捕获组：每个模式只扫描一次段落，支持1st-20th
+        for pattern in _NUMBERED_PARTY_PATTERNS[party_type]:
+            for match in pattern.finditer(section):
+                number = int(match.group(2))
+                suffix = self._get_ordinal_suffix(number)
+                if not 1 <= number <= _MAX_PARTY_ORDINAL or match.group(3).lower() != suffix:
+                    continue
+
+                clean_name = _norm_ws(match.group(1))
+                clean_name = _LEADING_AND_RE.sub('', clean_name)
+
+                # 更严格的验证：确保是有效的姓名
+                name_for_validation = re.sub(r'\([^)]*\)', '', clean_name)
+                name_for_validation = re.sub(r'（[^）]*）', '', name_for_validation).strip()
+
+                # 确保不是空的或只有标点符号
+                if len(name_for_validation) > 2 and re.search(r'[A-Za-z]', name_for_validation):
+                    found.append((number, f"{clean_name} ({number}{suffix} {party_type})"))
+
+        # 按序数排序（稳定排序，同一序数内保持模式优先级），去重保持顺序
+        found.sort(key=lambda item: item[0])
+        parties = list(dict.fromkeys(party_entry for _, party_entry in found))
         
         # 如果上述模式失败，尝试更直接的方法专门针对BETWEEN段落
         if not parties and party_type == 'Defendant':
@@ -1318,7 +1965,7 @@ class DocumentExtractor:
         # 分析BETWEEN段落的具体结构
         lines = section.split('\n')
         
-        current_name = ""
+        name_lines = []  # 当前被告姓名的各行，遇到编号行时合并
         for i, line in enumerate(lines):
             line = line.strip()
             if not line:
@@ -1326,12 +1973,12 @@ class DocumentExtractor:
             
             # 检查是否是被告编号行
             defendant_match = re.match(r'(\d+)(?:st|nd|rd|th)\s+Defendant', line, re.IGNORECASE)
-            if defendant_match and current_name:
+            if defendant_match and name_lines:
                 ordinal_num = defendant_match.group(1)
                 ordinal = ordinal_num + self._get_ordinal_suffix(int(ordinal_num))
-                clean_name = re.sub(r'\s+', ' ', current_name.strip())
+                clean_name = _norm_ws(' '.join(name_lines))
                 defendants.append(f"{clean_name} ({ordinal} Defendant)")
-                current_name = ""
+                name_lines = []
             
             # 如果不是被告编号行，可能是姓名行
             elif not re.match(r'^\d+(?:st|nd|rd|th)\s+(?:Plaintiff|Defendant)', line, re.IGNORECASE):
@@ -1339,10 +1986,7 @@ class DocumentExtractor:
                 if not re.match(r'^(?:and|Plaintiff)$', line, re.IGNORECASE):
                     # 如果有中文括号，可能是注释，跳过
                     if not re.match(r'^\([^)]*\)$', line) and not re.match(r'^（[^）]*）$', line):
-                        if current_name:
-                            current_name += " " + line
-                        else:
-                            current_name = line
+                        name_lines.append(line)
         
         return defendants
     
@@ -1350,102 +1994,69 @@ class DocumentExtractor:
         """提取法官信息"""
         if language == 'english':
             return self._extract_english_judge(text)
-        else:
-            return self._extract_chinese_judge(text)
+        return self._extract_chinese_judge(text)
     
     def _extract_english_judge(self, text: str) -> str:
         """提取英文法官信息 - 优化版，支持更多格式"""
+        # 一次性转小写，用于关键词预检
+        lowered = text.lower()
         
-        # 第1层：特殊格式优先模式 - 增强精度
-        special_patterns = [
-            # Recorder 格式 (如: Mr. Recorder Manzoni, SC) - 要求至少2个词
-            r'(?i)(?:mr\.?\s+|ms\.?\s+)?recorder\s+([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?:\s*,?\s*sc)?(?=\s+in\s+(?:court|chambers)|\n|$)',
-            
-            # Master 格式 (如: Master Isaac Chan) - 要求至少2个词
-            r'(?i)master\s+([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?=\s+in\s+(?:court|chambers)|\n|$)',
-            
-            # 括号内法官格式 (如: (Manzoni, SC)) - 至少3个字符
-            r'\(([A-Z][A-Za-z]{2,}(?:\s+[A-Z][A-Za-z]+)*)\s*,?\s*sc?\)',
-            
-            # Deputy Judge 格式 - 要求至少2个词
-            r'(?i)(?:deputy\s+(?:high\s+court\s+)?judge\s+|dhcj\s+)([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?:\s+sc)?(?=\s+in\s+(?:court|chambers)|\n|$)',
-        ]
-        
-        for pattern in special_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                judge_raw = matches[0].strip()
+        # 第1层：特殊格式优先模式
+        for keywords, pattern in self._JUDGE_SPECIAL_PATTERNS:
+            if keywords and not any(keyword in lowered for keyword in keywords):
+                continue
+            match = pattern.search(text)
+            if match:
+                judge_raw = match.group(1).strip()
                 # 额外验证：确保不是明显的错误匹配
-                if len(judge_raw) >= 3 and not re.match(r'^(?:to|at|in|on|for|and|or|the|of|with|from)$', judge_raw, re.IGNORECASE):
+                if len(judge_raw) >= 3 and not self._JUDGE_STOPWORD_RE.match(judge_raw):
                     judge_clean = self._clean_judge_name_enhanced(judge_raw)
                     if judge_clean:
-                        self.logger.info(f"找到特殊格式法官: {judge_clean}")
+                        self.logger.info("找到特殊格式法官: %s", judge_clean)
                         return judge_clean
         
-        # 第2层：标准Before格式模式 - 增强精度
-        before_patterns = [
-            # 更精确的Before模式 - 要求姓名格式
-            r'(?i)before:\s*(?:the\s+hon(?:ourable)?\.\s+)?([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?:\s+j\.?)?(?=\s+in\s+(?:court|chambers)|\n)',
-            r'(?i)before:\s*(?:deputy\s+(?:high\s+court\s+)?judge\s+)?([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?:\s+j\.?)?(?=\s+sitting|\n)',
-            
-            # 兜底模式 - 但要求至少包含大写字母开头的词
-            r'(?i)before:\s*([A-Z][A-Za-z]{2,}(?:\s+[A-Z][A-Za-z]+)*(?:\s+j\.?)?)',
-        ]
-        
-        for pattern in before_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                judge_raw = matches[0].strip()
+        # 第2层：标准Before格式模式
+        for keywords, pattern in self._JUDGE_BEFORE_PATTERNS:
+            if keywords and not any(keyword in lowered for keyword in keywords):
+                continue
+            match = pattern.search(text)
+            if match:
+                judge_raw = match.group(1).strip()
                 # 预过滤明显错误的匹配
                 if (len(judge_raw) >= 3 and 
-                    not re.match(r'^(?:to|at|in|on|for|and|or|the|of|with|from|by|this|that|these|those)$', judge_raw, re.IGNORECASE) and
-                    not re.match(r'^(?:court|chambers|sitting|hearing|judgment|decision|order)$', judge_raw, re.IGNORECASE)):
+                    not self._JUDGE_BEFORE_STOPWORD_RE.match(judge_raw) and
+                    not self._JUDGE_LEGAL_TERM_RE.match(judge_raw)):
                     
                     judge_clean = self._clean_judge_name_enhanced(judge_raw)
                     if judge_clean:
-                        self.logger.info(f"找到Before格式法官: {judge_clean}")
+                        self.logger.info("找到Before格式法官: %s", judge_clean)
                         return judge_clean
         
-        # 第3层：备用模式 - 更严格的验证
-        alternative_patterns = [
-            # 要求完整的职称+姓名组合
-            r'(?i)(deputy\s+(?:high\s+court\s+)?judge\s+[A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?=\s+sitting|\s+in\s+(?:court|chambers)|\n)',
-            r'(?i)(justice\s+[A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)(?=\s+sitting|\s+in\s+(?:court|chambers)|\n)',
-            r'(?i)(the\s+hon(?:ourable)?\.\s+[A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+\s+j\.?)(?=\s|\n)',
-            
-            # 判决书末尾的法官签名格式 - 要求合理的姓名长度
-            r'(?i)\(([A-Z][A-Za-z]{2,}(?:\s+[A-Z][A-Za-z]+)+)\s*\)\s*(?:deputy\s+high\s+court\s+)?judge\s+of\s+the\s+court',
-            r'(?i)\(([A-Z][A-Za-z]{2,}(?:\s+[A-Z][A-Za-z]+)+)\s*\)\s*recorder\s+of\s+the\s+high\s+court',
-        ]
-        
-        for pattern in alternative_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                judge_raw = matches[0].strip()
+        # 第3层：备用模式
+        for keywords, pattern in self._JUDGE_ALTERNATIVE_PATTERNS:
+            if keywords and not any(keyword in lowered for keyword in keywords):
+                continue
+            match = pattern.search(text)
+            if match:
+                judge_raw = match.group(1).strip()
                 # 额外的合理性检查
                 if (len(judge_raw) >= 5 and 
                     ' ' in judge_raw and  # 确保至少有两个词
-                    not re.match(r'^(?:court|chambers|sitting|hearing|judgment|decision|order).*', judge_raw, re.IGNORECASE)):
+                    not self._JUDGE_LEGAL_PREFIX_RE.match(judge_raw)):
                     
                     judge_clean = self._clean_judge_name_enhanced(judge_raw)
                     if judge_clean:
-                        self.logger.info(f"找到备用格式法官: {judge_clean}")
+                        self.logger.info("找到备用格式法官: %s", judge_clean)
                         return judge_clean
         
         return ""
     
     def _extract_chinese_judge(self, text: str) -> str:
         """提取中文法官信息"""
-        patterns = [
-            r'主審法官[：:]\s*([^\n]+)',
-            r'審訊法官[：:]\s*([^\n]+)',
-            r'(?:高等法院原訟法庭法官|法官)\s*([^\n\s]{2,10})',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                judge_raw = matches[0].strip()
+        for pattern in self._CN_JUDGE_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                judge_raw = match.group(1).strip()
                 judge_clean = self._clean_judge_name(judge_raw)
                 if judge_clean:
                     return judge_clean
@@ -1458,18 +2069,18 @@ class DocumentExtractor:
             return ""
         
         # 移除常见职称和修饰词
-        clean = re.sub(r'(?i)\b(?:deputy|high|court|judge|justice|the|hon\.?|honourable|mr|ms|mrs)\b\s*', '', judge_raw)
-        clean = re.sub(r'\s*j\.?\s*$', '', clean, re.IGNORECASE)  # 移除末尾的 J.
-        clean = re.sub(r'\s*(?:sitting|in|chambers)\s*.*$', '', clean, re.IGNORECASE)
+        clean = self._JUDGE_TITLE_WORDS_RE.sub('', judge_raw)
+        clean = self._JUDGE_J_SUFFIX_RE.sub('', clean)  # 移除末尾的 J.
+        clean = self._JUDGE_SITTING_TAIL_RE.sub('', clean)
         
         # 额外清理：处理"Hon XXX J"格式
-        clean = re.sub(r'(?i)^(?:hon\.?\s+)?(.+?)\s*j\.?\s*$', r'\1', clean)
+        clean = self._JUDGE_HON_J_STRIP_RE.sub(r'\1', clean)
         
         # 移除多余空格
-        clean = re.sub(r'\s+', ' ', clean).strip()
+        clean = _norm_ws(clean)
         
         # 验证结果
-        if 2 <= len(clean) <= 50 and not re.match(r'^\d+$', clean):
+        if 2 <= len(clean) <= 50 and not clean.isdecimal():
             return clean
         
         return ""
@@ -1483,112 +2094,91 @@ class DocumentExtractor:
         clean = judge_raw.strip()
         
         # 第0步：预验证 - 立即拒绝明显错误的输入
-        pre_invalid_patterns = [
-            r'^[A-Z]$',                              # 单个大写字母
-            r'^[a-z]$',                              # 单个小写字母
-            r'^[A-Za-z]{1,2}$',                      # 1-2个字母（如'e', 'To'）
-            r'^\d+$',                                # 纯数字
-            r'^[,.\s\-_:;]+$',                       # 纯标点和空格
-            r'(?i)^(?:to|at|in|on|for|and|or|the|of|with|from|by|if|is|as|be|it|he|she|we|they|this|that|these|those)$',  # 常见介词/代词
-            r'(?i)^(?:court|chambers|sitting|hearing|judgment|judgement|decision|order|matter|case|action|appeal|application)$',  # 法律术语
-            r'(?i)^(?:before|after|during|while|when|where|what|who|how|why)$',  # 疑问词/时间词
-            r'(?i)^(?:granted|dismissed|allowed|refused|upheld|affirmed|reversed)$',  # 判决用词
-            r'(?i)^(?:plaintiff|defendant|applicant|respondent|appellant)$',  # 当事人
-            r'^(?:held|gave|said|found|noted|stated|ordered|directed)$',  # 动词
-            r'^(?:[0-9]{1,4}|[ivxlc]+)$',            # 数字或罗马数字
-            r'(?i)^(?:must|shall|should|would|could|may|might|can|will)$',  # 情态动词
-        ]
+        # 后续各步只会删除字符：不足3个字符或不含大写字母的输入必然无法通过最终验证
+        if len(clean) < 3 or not self._HAS_UPPER_RE.search(clean):
+            self.logger.warning("法官姓名预验证失败（过短或无大写字母）: '%s' -> '%s'", original_input, clean)
+            return ""
         
-        is_pre_invalid = any(re.match(pattern, clean) for pattern in pre_invalid_patterns)
+        is_pre_invalid = (clean.lower() in self._JUDGE_PRE_INVALID_WORDS or
+                          clean in self._JUDGE_PRE_INVALID_VERBS or
+                          self._JUDGE_PRE_INVALID_RE.match(clean))
         if is_pre_invalid:
-            self.logger.warning(f"法官姓名预验证失败（明显错误）: '{original_input}' -> '{clean}'")
+            self.logger.warning("法官姓名预验证失败（明显错误）: '%s' -> '%s'", original_input, clean)
             return ""
         
         # 第1步：处理常见的完整格式
         # 处理 "Hon XXX J" -> "XXX"
-        hon_j_match = re.search(r'(?i)^(?:the\s+)?hon\.?\s+(.+?)\s*j\.?\s*(?:in\s+(?:court|chambers).*)?$', clean)
+        hon_j_match = self._JUDGE_HON_J_RE.search(clean)
         if hon_j_match:
             clean = hon_j_match.group(1).strip()
         
         # 处理 "Mr/Ms Recorder XXX" -> "XXX"
-        recorder_match = re.search(r'(?i)^(?:mr\.?\s+|ms\.?\s+)?recorder\s+(.+?)(?:\s*,?\s*sc)?(?:\s+in\s+(?:court|chambers).*)?$', clean)
+        recorder_match = self._JUDGE_RECORDER_RE.search(clean)
         if recorder_match:
             clean = recorder_match.group(1).strip()
         
         # 处理 "Master XXX" -> "XXX"
-        master_match = re.search(r'(?i)^master\s+(.+?)(?:\s+in\s+(?:court|chambers).*)?$', clean)
+        master_match = self._JUDGE_MASTER_RE.search(clean)
         if master_match:
             clean = master_match.group(1).strip()
         
         # 处理 "Deputy High Court Judge XXX" -> "XXX"
-        deputy_match = re.search(r'(?i)^deputy\s+(?:high\s+court\s+)?judge\s+(.+?)(?:\s+in\s+(?:court|chambers).*)?$', clean)
+        deputy_match = self._JUDGE_DEPUTY_RE.search(clean)
         if deputy_match:
             clean = deputy_match.group(1).strip()
         
         # 处理括号格式 "(XXX, SC)" -> "XXX"
-        bracket_match = re.search(r'^\(([A-Za-z\s]+?)\s*,?\s*sc?\)$', clean, re.IGNORECASE)
+        bracket_match = self._JUDGE_BRACKET_RE.search(clean)
         if bracket_match:
             clean = bracket_match.group(1).strip()
         
         # 第2步：移除末尾的职称后缀
-        clean = re.sub(r'\s*,?\s*sc\s*$', '', clean, re.IGNORECASE)  # 移除末尾的 SC
-        clean = re.sub(r'\s*j\.?\s*$', '', clean, re.IGNORECASE)     # 移除末尾的 J.
+        clean = self._JUDGE_SC_SUFFIX_RE.sub('', clean)  # 移除末尾的 SC
+        clean = self._JUDGE_J_SUFFIX_RE.sub('', clean)   # 移除末尾的 J.
         
         # 第3步：移除位置信息
-        clean = re.sub(r'\s*(?:sitting|in|at)\s+(?:court|chambers).*$', '', clean, re.IGNORECASE)
+        clean = self._JUDGE_LOCATION_TAIL_RE.sub('', clean)
         
         # 第4步：只移除开头的明确职称词汇（保守清理）
-        clean = re.sub(r'^(?:the\s+|hon\.?\s+|honourable\s+)', '', clean, re.IGNORECASE)
+        clean = self._JUDGE_LEADING_TITLE_RE.sub('', clean)
         
         # 第5步：清理空格和标点
-        clean = re.sub(r'\s+', ' ', clean).strip()
-        clean = re.sub(r'^[,\s]+|[,\s]+$', '', clean)
+        clean = _norm_ws(clean)
+        clean = _EDGE_COMMA_SPACE_RE.sub('', clean)
         
         # 第6步：增强验证结果
         if clean:
             # 基本长度检查
             if len(clean) < 3 or len(clean) > 50:
-                self.logger.warning(f"法官姓名清理失败（长度不符）: '{original_input}' -> '{clean}'")
+                self.logger.warning("法官姓名清理失败（长度不符）: '%s' -> '%s'", original_input, clean)
                 return ""
             
             # 检查是否包含有效的姓名字符
-            if not re.search(r'[A-Za-z]', clean):
-                self.logger.warning(f"法官姓名清理失败（无字母）: '{original_input}' -> '{clean}'")
+            if not self._HAS_LETTER_RE.search(clean):
+                self.logger.warning("法官姓名清理失败（无字母）: '%s' -> '%s'", original_input, clean)
                 return ""
             
             # 增强的无效模式检查
-            invalid_patterns = [
-                r'^[A-Za-z]{1,2}$',                      # 1-2个字母（如'e', 'To', 'In'）
-                r'^\d+$',                                # 纯数字
-                r'^[,.\s\-_:;]+$',                       # 纯标点和空格
-                r'(?i)^(?:to|at|in|on|for|and|or|the|of|with|from|by|if|is|as|be|it|he|she|we|they)$',  # 介词/代词
-                r'(?i)^(?:court|chambers|sitting|hearing|judgment|judgement|decision|order|matter|case|action|appeal)$',  # 法律术语
-                r'(?i)^(?:before|after|during|while|when|where|what|who|how|why|shall|must|would|could)$',  # 其他常见词
-                r'(?i)^(?:plaintiff|defendant|applicant|respondent|appellant|petitioner)$',  # 当事人
-                r'(?i)^(?:granted|dismissed|allowed|refused|upheld|affirmed|reversed|held|gave|said|found)$',  # 判决/动词
-                r'^[ivxlc]+$',                           # 罗马数字
-                r'(?i)^(?:less than|more than|between|among|within|without|unless|until|since|because)$',  # 长介词短语的开头
-                r'(?i)^(?:hearing|trial|motion|summons|application|appeal|judgment)s?$',  # 法律程序术语
-                r'(?i)^(?:inclusive|exclusive|interest|cost|costs|fee|fees)$',  # 财务术语
-                r'(?i)^(?:one|two|three|four|five|six|seven|eight|nine|ten|week|month|year|day)s?$',  # 数字/时间
-            ]
-            
-            is_invalid = any(re.match(pattern, clean) for pattern in invalid_patterns)
+            lowered = clean.lower()
+            is_invalid = (lowered in self._JUDGE_INVALID_WORDS or
+                          lowered in self._JUDGE_INVALID_PLURAL_WORDS or
+                          (lowered.endswith('s') and lowered[:-1] in self._JUDGE_INVALID_PLURAL_WORDS) or
+                          self._JUDGE_INVALID_RE.match(clean))
             
             if is_invalid:
-                self.logger.warning(f"法官姓名清理失败（匹配无效模式）: '{original_input}' -> '{clean}'")
+                self.logger.warning("法官姓名清理失败（匹配无效模式）: '%s' -> '%s'", original_input, clean)
                 return ""
             
             # 最后验证：确保至少包含一个大写字母（姓名特征）
-            if not re.search(r'[A-Z]', clean):
-                self.logger.warning(f"法官姓名清理失败（无大写字母）: '{original_input}' -> '{clean}'")
+            if not self._HAS_UPPER_RE.search(clean):
+                self.logger.warning("法官姓名清理失败（无大写字母）: '%s' -> '%s'", original_input, clean)
                 return ""
             
             # 验证通过
-            self.logger.info(f"法官姓名清理成功: '{original_input}' -> '{clean}'")
+            self.logger.info("法官姓名清理成功: '%s' -> '%s'", original_input, clean)
             return clean
         
-        self.logger.warning(f"法官姓名清理失败（清理后为空）: '{original_input}' -> '{clean}'")
+        self.logger.warning("法官姓名清理失败（清理后为空）: '%s' -> '%s'", original_input, clean)
         return ""
     
     def extract_lawyer(self, text: str, language: str) -> str:
@@ -1603,26 +2193,15 @@ class DocumentExtractor:
         lawyers = []
         
         # 主要模式：represented by 格式
-        representation_patterns = [
-            r'(?i)(?:plaintiff|applicant|p)\s+(?:was\s+)?represented\s+by\s+(.*?)(?=\s+and\s+(?:defendant|d\s+|the\s+defendant)|\.|\n)',
-            r'(?i)(?:defendant|respondent|d)\s+(?:was\s+)?represented\s+by\s+(.*?)(?=\.|\n)',
-            r'(?i)at\s+the\s+(?:trial|hearing),?\s+(?:p|plaintiff)\s+(?:was\s+)?represented\s+by\s+(.*?)(?=\s+and\s+d\s+|\.|\n)',
-        ]
-        
-        for pattern in representation_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in self._LAWYER_REPRESENTATION_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 extracted_lawyers = self._extract_lawyer_names(match)
                 lawyers.extend(extracted_lawyers)
         
         # 备用模式：counsel for 格式
-        counsel_patterns = [
-            r'(?i)counsel\s+for\s+(?:the\s+)?(?:plaintiff|defendant|applicant|respondent)[:\s]+([^\n\.]+)',
-            r'(?i)for\s+the\s+(?:plaintiff|defendant)[:\s]+([^\n\.]+)',
-        ]
-        
-        for pattern in counsel_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in self._LAWYER_COUNSEL_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 extracted_lawyers = self._extract_lawyer_names(match)
                 lawyers.extend(extracted_lawyers)
@@ -1642,18 +2221,11 @@ class DocumentExtractor:
     
     def _extract_chinese_lawyers(self, text: str) -> str:
         """提取中文律师信息"""
-        patterns = [
-            r'委托律师[：:]\s*([^\n]+)',
-            r'代理律师[：:]\s*([^\n]+)',
-            r'(?:原告|申請人).*?委託.*?([^\n]{2,20}).*?代理',
-            r'(?:被告|被申請人).*?委託.*?([^\n]{2,20}).*?代理',
-        ]
-        
         lawyers = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
+        for pattern in self._CN_LAWYER_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
-                clean_lawyer = re.sub(r'\s+', ' ', match.strip())
+                clean_lawyer = _norm_ws(match)
                 if 2 <= len(clean_lawyer) <= 30:
                     lawyers.append(clean_lawyer)
         
@@ -1667,113 +2239,68 @@ class DocumentExtractor:
         lawyers = []
         
         # 匹配 Mr/Ms + 姓名模式
-        name_patterns = [
-            r'(?i)mr\.?\s+([A-Za-z\s]+?)(?:\s+sc\s*|\s+leading|\s+and|\s*,|\s*$)',
-            r'(?i)ms\.?\s+([A-Za-z\s]+?)(?:\s+sc\s*|\s+leading|\s+and|\s*,|\s*$)',
-            r'(?i)(?:leading\s+)?([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s+sc)?',
-        ]
-        
-        for pattern in name_patterns:
-            matches = re.findall(pattern, lawyer_text)
-            for match in matches:
-                clean_name = re.sub(r'\s+', ' ', match.strip())
-                if 3 <= len(clean_name) <= 50 and clean_name not in lawyers:
+        for pattern in self._LAWYER_NAME_PATTERNS:
+            for match in pattern.findall(lawyer_text):
+                clean_name = _norm_ws(match)
+                if 3 <= len(clean_name) <= 50:
                     lawyers.append(clean_name)
         
-        return lawyers
+        return list(dict.fromkeys(lawyers))
     
     def extract_case_type(self, text: str, language: str, doc_type: str = 'GENERIC') -> str:
         """提取案件类型相关文本段落，供LLM分析判断"""
         try:
             self.logger.info("开始提取case_type - 增强版")
             
-            # 限制文档长度
-            if len(text) > 80000:
-                text = text[:80000]
-                self.logger.info("文档过长，截取前80000字符进行case_type提取")
+            # 限制扫描范围：Introduction/Background/Facts 位于判决书开头，ORDER/结论位于末尾，
+            # 中间的论证部分对案件类型帮助不大，只扫描开头和末尾
+            head_chars, tail_chars = self._CASE_TYPE_HEAD_CHARS, self._CASE_TYPE_TAIL_CHARS
+            if len(text) > head_chars + tail_chars:
+                text = text[:head_chars] + '\n\n' + text[-tail_chars:]
+                self.logger.info("文档过长，只扫描前%d和后%d字符进行case_type提取", head_chars, tail_chars)
             
             if language == 'english':
                 result = self._extract_english_case_type_comprehensive(text)
             else:
                 result = self._extract_chinese_case_type_comprehensive(text)
             
-            self.logger.info(f"case_type提取完成，长度: {len(result)}")
+            self.logger.info("case_type提取完成，长度: %d", len(result))
             return result
         except Exception as e:
-            self.logger.warning(f"case_type提取失败: {e}")
+            self.logger.warning("case_type提取失败: %s", e)
             return ""
     
     def _extract_english_case_type_comprehensive(self, text: str) -> str:
         """增强版英文案件类型提取 - 基于PDF结构分析"""
-        case_segments = []
+        case_segments = []  # 每项为 (权重, 类型, 内容, 内容前30字符)
         
         # 第1层：提取关键段落 - Introduction/Background/Facts (最高优先级)
-        key_section_patterns = [
-            # Introduction段落 - 通常包含案件概述
-            (r'Introduction\s*[:\.]?\s*\n((?:[^\n]+\n){3,20})', 10, 'introduction'),
-            
-            # Background段落 - 案件背景
-            (r'(?:BACKGROUND|Background)\s*[:\.]?\s*\n((?:[^\n]+\n){5,25})', 9, 'background'),
-            
-            # Facts段落 - 案件事实
-            (r'(?:FACTS?|Facts?)\s*[:\.]?\s*\n((?:[^\n]+\n){3,20})', 8, 'facts'),
-            
-            # 案件性质描述
-            (r'(?:This is|These are)\s+(?:an?\s+)?(action|application|proceeding|matter|case|appeal|motion|summons)([^\n.]{20,300})', 7, 'nature'),
-            
-            # 申请描述
-            (r'(?:The|This)\s+(?:plaintiff|applicant|defendant|appellant)\s+(?:seeks?|applies?|brings?|claims?)\s+([^\n.]{30,400})', 6, 'application'),
-        ]
-        
-        for pattern, weight, section_type in key_section_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE | re.DOTALL))
-            for match in matches[:2]:  # 每个模式最多2个匹配
+        for pattern, weight, section_type in self._EN_CASE_SECTION_PATTERNS:
+            for match in islice(pattern.finditer(text), 2):  # 每个模式最多2个匹配
                 content = match.group(1) if match.lastindex >= 1 else match.group(0)
                 clean_content = self._clean_comprehensive_content(content)
                 
                 if 50 <= len(clean_content) <= 2000:
-                    case_segments.append({
-                        'content': clean_content,
-                        'weight': weight,
-                        'type': section_type,
-                        'length': len(clean_content)
-                    })
+                    case_segments.append((weight, section_type, clean_content, clean_content[:30]))
         
         # 第2层：提取判决相关描述
-        judgment_context_patterns = [
-            (r'(?:ORDER|ORDERS|JUDGMENT|HELD|DISPOSITION)\s*[:\.]?\s*\n((?:[^\n]+\n){2,15})', 5, 'judgment_context'),
-            (r'(?:For (?:these reasons|the foregoing reasons)|Accordingly|In (?:conclusion|the result))\s*[,.]?\s*([^\n.]{50,500})', 4, 'conclusion'),
-        ]
-        
-        for pattern, weight, section_type in judgment_context_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE | re.DOTALL))
-            for match in matches[:2]:
+        for pattern, weight, section_type in self._EN_CASE_JUDGMENT_PATTERNS:
+            for match in islice(pattern.finditer(text), 2):
                 content = match.group(1)
                 clean_content = self._clean_comprehensive_content(content)
                 
                 if 30 <= len(clean_content) <= 1500:
-                    case_segments.append({
-                        'content': clean_content,
-                        'weight': weight,
-                        'type': section_type,
-                        'length': len(clean_content)
-                    })
+                    case_segments.append((weight, section_type, clean_content, clean_content[:30]))
         
         # 第3层：提取长段落中的案件描述
-        paragraphs = re.split(r'\n\s*\n', text)
-        for paragraph in paragraphs:
+        # 全文只转一次小写，按同样的分隔拆分后与原段落一一对应（小写化不会增删空白）
+        for paragraph, lowered in zip(_iter_paragraphs(text), _iter_paragraphs(text.lower())):
             if 200 <= len(paragraph) <= 2000:
                 # 检查段落是否包含案件相关关键词
-                case_keywords = ['application', 'proceeding', 'action', 'dispute', 'matter', 'claim', 'relief', 'judgment', 'order']
-                if any(keyword in paragraph.lower() for keyword in case_keywords):
+                if any(keyword in lowered for keyword in self._EN_CASE_KEYWORDS):
                     clean_para = self._clean_comprehensive_content(paragraph)
                     if 100 <= len(clean_para) <= 1500:
-                        case_segments.append({
-                            'content': clean_para,
-                            'weight': 2,
-                            'type': 'long_paragraph',
-                            'length': len(clean_para)
-                        })
+                        case_segments.append((2, 'long_paragraph', clean_para, clean_para[:30]))
                         if len(case_segments) >= 8:  # 限制段落数量
                             break
         
@@ -1781,54 +2308,31 @@ class DocumentExtractor:
     
     def _clean_comprehensive_content(self, content: str) -> str:
         """清理案件类型内容"""
-        if not content:
-            return ""
-        
-        # 基本清理
-        cleaned = re.sub(r'\s+', ' ', content.strip())
-        
-        # 移除页码和分隔符
-        cleaned = re.sub(r'\s*-\s*\d+\s*-\s*', ' ', cleaned)
-        cleaned = re.sub(r'\s*_{3,}\s*', ' ', cleaned)
-        
-        # 移除明显的干扰信息
-        cleaned = re.sub(r'\s*(?:page|頁)\s*\d+.*$', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'^\s*(?:\d+\.\s*)?', '', cleaned)  # 移除段落编号
-        
-        # 移除多余的标点
-        cleaned = re.sub(r'^[,;.:\s]+', '', cleaned)
-        cleaned = re.sub(r'[.\s]+$', '', cleaned)
-        
-        return cleaned.strip()
+        return _clean_segment_text(content)
     
     def _combine_comprehensive_segments(self, segments, max_length=3000):
-        """合并案件类型段落"""
+        """合并案件类型段落，segments 每项为 (权重, 类型, 内容, 内容前30字符)"""
         if not segments:
             return ""
         
-        # 按权重排序
-        segments.sort(key=lambda x: x.get('weight', 0), reverse=True)
+        # 按权重排序（稳定排序，同权重保持提取顺序）
+        segments.sort(key=itemgetter(0), reverse=True)
         
         # 选择最有价值的段落
         selected_parts = []
+        selected_prefixes = set()  # 已选段落（长度>30）的前30字符
         total_length = 0
         
-        for segment in segments:
-            content = segment.get('content', '')
-            if not content:
+        for _, _, content, prefix in segments:
+            # 避免重复内容：前30字符相同视为重复
+            is_long = len(content) > 30
+            if is_long and prefix in selected_prefixes:
                 continue
-                
-            # 避免重复内容
-            is_duplicate = False
-            for existing in selected_parts:
-                if len(content) > 30 and len(existing) > 30:
-                    # 简单相似度检查
-                    if content[:30] == existing[:30]:
-                        is_duplicate = True
-                        break
             
-            if not is_duplicate and total_length + len(content) <= max_length:
+            if total_length + len(content) <= max_length:
                 selected_parts.append(content)
+                if is_long:
+                    selected_prefixes.add(prefix)
                 total_length += len(content)
                 
                 # 限制段落数量
@@ -1845,71 +2349,33 @@ class DocumentExtractor:
     
     def _extract_chinese_case_type_comprehensive(self, text: str) -> str:
         """增强版中文案件类型提取"""
-        case_segments = []
+        case_segments = []  # 每项为 (权重, 类型, 内容, 内容前30字符)
         
         # 第1层：关键段落提取
-        key_section_patterns = [
-            # 背景/事实段落
-            (r'(?:背景|事實|案情|簡介)\s*[：:.]?\s*\n((?:[^\n]+\n){3,20})', 10, 'background'),
-            
-            # 争议/问题段落  
-            (r'(?:爭議|問題|焦點|糾紛)\s*[：:.]?\s*\n((?:[^\n]+\n){2,15})', 9, 'dispute'),
-            
-            # 申请人请求
-            (r'(?:申請人|原告人?)\s*(?:申請|請求|要求|尋求|指稱)\s*([^\n。]{50,500})', 8, 'application'),
-            
-            # 案件性质
-            (r'(?:本案|該案|此案)\s*(?:涉及|關於|係|為)\s*([^\n。]{30,400})', 7, 'nature'),
-        ]
-        
-        for pattern, weight, section_type in key_section_patterns:
-            matches = list(re.finditer(pattern, text))
-            for match in matches[:2]:
+        for pattern, weight, section_type in self._CN_CASE_SECTION_PATTERNS:
+            for match in islice(pattern.finditer(text), 2):
                 content = match.group(1)
                 clean_content = self._clean_comprehensive_content(content)
                 
                 if 30 <= len(clean_content) <= 1500:
-                    case_segments.append({
-                        'content': clean_content,
-                        'weight': weight,
-                        'type': section_type,
-                        'length': len(clean_content)
-                    })
+                    case_segments.append((weight, section_type, clean_content, clean_content[:30]))
         
         # 第2层：判决相关段落
-        judgment_patterns = [
-            (r'(?:命令|判令|裁定|判決)\s*[：:.]?\s*\n((?:[^\n]+\n){2,15})', 6, 'judgment'),
-            (r'(?:綜上所述|因此|故此|據此)\s*[，,]?\s*([^\n。]{30,400})', 5, 'conclusion'),
-        ]
-        
-        for pattern, weight, section_type in judgment_patterns:
-            matches = list(re.finditer(pattern, text))
-            for match in matches[:2]:
+        for pattern, weight, section_type in self._CN_CASE_JUDGMENT_PATTERNS:
+            for match in islice(pattern.finditer(text), 2):
                 content = match.group(1)
                 clean_content = self._clean_comprehensive_content(content)
                 
                 if 20 <= len(clean_content) <= 1000:
-                    case_segments.append({
-                        'content': clean_content,
-                        'weight': weight,
-                        'type': section_type,
-                        'length': len(clean_content)
-                    })
+                    case_segments.append((weight, section_type, clean_content, clean_content[:30]))
         
         # 第3层：长段落提取
-        paragraphs = re.split(r'\n\s*\n', text)
-        for paragraph in paragraphs:
+        for paragraph in _iter_paragraphs(text):
             if 150 <= len(paragraph) <= 1500:
-                case_keywords = ['申請', '爭議', '糾紛', '案件', '法庭', '法院', '判決', '命令', '裁定']
-                if any(keyword in paragraph for keyword in case_keywords):
+                if self._CN_CASE_KEYWORD_RE.search(paragraph):
                     clean_para = self._clean_comprehensive_content(paragraph)
                     if 80 <= len(clean_para) <= 1200:
-                        case_segments.append({
-                            'content': clean_para,
-                            'weight': 2,
-                            'type': 'long_paragraph',
-                            'length': len(clean_para)
-                        })
+                        case_segments.append((2, 'long_paragraph', clean_para, clean_para[:30]))
                         if len(case_segments) >= 8:
                             break
         
@@ -1925,17 +2391,17 @@ class DocumentExtractor:
             last_15_percent_start = max(total_chars * 85 // 100, total_chars - 5000)
             judgment_section = text[last_15_percent_start:]
             
-            self.logger.info(f"判决结果搜索范围: 最后{len(judgment_section)}字符")
+            self.logger.info("判决结果搜索范围: 最后%d字符", len(judgment_section))
             
             if language == 'english':
                 result = self._extract_judgment_result_focused(judgment_section)
             else:
                 result = self._extract_chinese_judgment_result_focused(judgment_section)
             
-            self.logger.info(f"judgment_result提取完成，长度: {len(result)}")
+            self.logger.info("judgment_result提取完成，长度: %d", len(result))
             return result
         except Exception as e:
-            self.logger.warning(f"judgment_result提取失败: {e}")
+            self.logger.warning("judgment_result提取失败: %s", e)
             return ""
     
     def _extract_judgment_result_focused(self, judgment_section: str) -> str:
@@ -1943,26 +2409,15 @@ class DocumentExtractor:
         if not judgment_section or len(judgment_section) < 100:
             return ""
         
+        # 没有任何判决关键词时直接返回，省去逐个模式的扫描
+        if not self._EN_JUDGMENT_KEYWORD_RE.search(judgment_section):
+            return ""
+        
         judgment_segments = []
         
         # 优先级1: ORDER/JUDGMENT段落 (最重要，90%有效) - 增强版
-        order_patterns = [
-            # 原有模式
-            r'(?:ORDER|ORDERS|JUDGMENT|CONCLUSION|DISPOSITION)\s*[:\.]?\s*\n((?:[^\n]+\n?){2,12})',
-            r'(?:IT IS ORDERED|I ORDER|THE COURT ORDERS?)\s*[:\.]?\s*((?:[^\n]+\n?){1,8})',
-            r'(?:For (?:these reasons|the foregoing reasons)|Accordingly|Therefore)\s*[,.]?\s*([^\n.]{30,500})',
-            
-            # 新增模式 - 更灵活的判决表达
-            r'(I (?:make an )?[Oo]rder[^.]*?(?:that|in terms of)[^.]*?[.\n])',  # "I make an Order that..." 或 "I order that..."
-            r'(I (?:would )?(?:make|grant|allow|dismiss|refuse)[^.]*?(?:order|application|claim)[^.]*?[.\n])',  # "I would make/grant/allow..."
-            r'([Bb]ased on the above[^.]*?[Oo]rder[^.]*?[.\n])',  # "Based on the above, I make an Order..."
-            r'([Ii]n conclusion[^.]*?(?:order|grant|dismiss|allow)[^.]*?[.\n])',  # "In conclusion, I..."
-            r'([Ff]or the (?:above )?reasons?[^.]*?(?:order|grant|dismiss|allow)[^.]*?[.\n])',  # "For the reasons..."
-        ]
-        
-        for pattern in order_patterns:
-            matches = list(re.finditer(pattern, judgment_section, re.IGNORECASE | re.DOTALL))
-            for match in matches[:2]:  # 每个模式最多2个匹配
+        for pattern in self._EN_ORDER_PATTERNS:
+            for match in islice(pattern.finditer(judgment_section), 2):  # 每个模式最多2个匹配
                 content = match.group(1)
                 clean_content = self._clean_judgment_content(content)
                 
@@ -1970,25 +2425,12 @@ class DocumentExtractor:
                     judgment_segments.append(clean_content)
         
         # 优先级2: 明确的判决语句 (95%有效) - 增强版
-        decision_patterns = [
-            # 原有模式
-            r'((?:dismiss|grant|refuse|allow|upheld|affirmed).*?(?:application|claim|appeal|action))',
-            r'((?:Judgment|judgment)\s+(?:be\s+)?entered\s+for.*?)',
-            r'(I\s+(?:dismiss|grant|order|hold|refuse|allow).*?)',
-            r'((?:The\s+)?(?:application|appeal|claim)\s+(?:is|shall be)\s+(?:granted|dismissed|refused|allowed).*?)',
-            
-            # 新增模式 - 更多判决表达
-            r'((?:The\s+)?[Dd]efendants?.*?(?:pay|liable|responsible)[^.]*?(?:costs|damages|compensation)[^.]*?[.\n])',  # 被告支付费用
-            r'((?:The\s+)?[Pp]laintiffs?.*?(?:entitled|succeed)[^.]*?[.\n])',  # 原告胜诉
-            r'([Ss]ummary judgment.*?(?:granted|entered|allowed)[^.]*?[.\n])',  # 简易判决
-            r'([Cc]osts.*?(?:assessed|taxed|awarded)[^.]*?[.\n])',  # 费用裁定
-            r'([Ii]nterest.*?(?:awarded|granted|payable)[^.]*?[.\n])',  # 利息裁定
-            r'([Aa]pplication.*?(?:granted|dismissed|refused|allowed)[^.]*?[.\n])',  # 申请结果
-        ]
-        
-        for pattern in decision_patterns:
-            matches = list(re.finditer(pattern, judgment_section, re.IGNORECASE))
-            for match in matches[:2]:
+        # 以句末结尾的模式限定在最后一个句号/换行之前扫描：末尾没有句号的长文本上，
+        # .*? 与 [^.]*? 嵌套会在注定失败的位置上反复回溯
+        section_end = len(judgment_section)
+        sentence_end = max(judgment_section.rfind('.'), judgment_section.rfind('\n')) + 1
+        for pattern, sentence_only in self._EN_DECISION_PATTERNS:
+            for match in islice(pattern.finditer(judgment_section, 0, sentence_end if sentence_only else section_end), 2):
                 content = match.group(1)
                 clean_content = self._clean_judgment_content(content)
                 
@@ -1999,14 +2441,11 @@ class DocumentExtractor:
         if judgment_segments:
             # 简单去重
             unique_segments = []
+            seen_prefixes = set()
             for segment in judgment_segments:
-                is_duplicate = False
-                for existing in unique_segments:
-                    if len(segment) > 0 and len(existing) > 0:
-                        if segment[:30] == existing[:30]:
-                            is_duplicate = True
-                            break
-                if not is_duplicate:
+                prefix = segment[:30]
+                if prefix not in seen_prefixes:
+                    seen_prefixes.add(prefix)
                     unique_segments.append(segment)
             
             # 限制数量和总长度
@@ -2026,18 +2465,15 @@ class DocumentExtractor:
         if not judgment_section or len(judgment_section) < 100:
             return ""
         
+        # 没有任何判决关键词时直接返回，省去逐个模式的扫描
+        if not self._CN_JUDGMENT_KEYWORD_RE.search(judgment_section):
+            return ""
+        
         judgment_segments = []
         
         # 优先级1: 中文判决段落
-        order_patterns = [
-            r'(?:命令|判令|裁定|判決|判决)\s*[：:.]?\s*\n((?:[^\n]+\n?){2,10})',
-            r'(?:本庭|法庭|法院)\s*(?:命令|判令|裁定|判決|判决)\s*([^\n。]{15,400})',
-            r'(?:綜上所述|因此|故此|據此)\s*[，,：:.]*\s*([^\n。]{20,400})'
-        ]
-        
-        for pattern in order_patterns:
-            matches = list(re.finditer(pattern, judgment_section))
-            for match in matches[:2]:
+        for pattern in self._CN_ORDER_PATTERNS:
+            for match in islice(pattern.finditer(judgment_section), 2):
                 content = match.group(1)
                 clean_content = self._clean_judgment_content(content)
                 
@@ -2045,15 +2481,8 @@ class DocumentExtractor:
                     judgment_segments.append(clean_content)
         
         # 优先级2: 明确的判决动词
-        decision_patterns = [
-            r'((?:批准|拒絕|駁回|允許|准許|不准).*?(?:申請|請求|上訴))',
-            r'((?:勝訴|敗訴|得直|不得直).*?)',
-            r'((?:撤回|撤訴).*?)'
-        ]
-        
-        for pattern in decision_patterns:
-            matches = list(re.finditer(pattern, judgment_section))
-            for match in matches[:2]:
+        for pattern in self._CN_DECISION_PATTERNS:
+            for match in islice(pattern.finditer(judgment_section), 2):
                 content = match.group(1)
                 clean_content = self._clean_judgment_content(content)
                 
@@ -2063,14 +2492,11 @@ class DocumentExtractor:
         # 合并结果
         if judgment_segments:
             unique_segments = []
+            seen_prefixes = set()
             for segment in judgment_segments:
-                is_duplicate = False
-                for existing in unique_segments:
-                    if len(segment) > 0 and len(existing) > 0:
-                        if segment[:20] == existing[:20]:
-                            is_duplicate = True
-                            break
-                if not is_duplicate:
+                prefix = segment[:20]
+                if prefix not in seen_prefixes:
+                    seen_prefixes.add(prefix)
                     unique_segments.append(segment)
             
             if len(unique_segments) > 4:
@@ -2086,25 +2512,7 @@ class DocumentExtractor:
     
     def _clean_judgment_content(self, content: str) -> str:
         """清理判决内容 - 简化版"""
-        if not content:
-            return ""
-        
-        # 基本清理
-        cleaned = re.sub(r'\s+', ' ', content.strip())
-        
-        # 移除页码和分隔符
-        cleaned = re.sub(r'\s*-\s*\d+\s*-\s*', ' ', cleaned)
-        cleaned = re.sub(r'\s*_{3,}\s*', ' ', cleaned)
-        
-        # 移除明显的干扰信息
-        cleaned = re.sub(r'\s*(?:page|頁)\s*\d+.*$', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'^\s*(?:\d+\.\s*)?', '', cleaned)  # 移除段落编号
-        
-        # 移除多余的标点
-        cleaned = re.sub(r'^[,;.:\s]+', '', cleaned)
-        cleaned = re.sub(r'[.\s]+$', '', cleaned)
-        
-        return cleaned.strip()
+        return _clean_segment_text(content)
     
     def extract_amount_segments(self, text: str, language: str, segment_type: str) -> str:
         """
@@ -2136,19 +2544,24 @@ class DocumentExtractor:
         """增强版申请金额提取 - 三层递进策略"""
         
         # 第一层：精确搜索（前30% + 后30%）
-        result = self._extract_amounts_precise(text, language, 'claim')
+        # 全文只扫描一次金额表达，三层搜索各自按区间筛选候选金额；
+        # 各层区间重叠处的同一上下文只做一次关键词评分
+        amount_matches = self._scan_amount_matches(text, language)
+        context_scores = {}
+        
+        result = self._extract_amounts_precise(text, language, 'claim', amount_matches, context_scores)
         if result:
             self.logger.info("第一层精确搜索成功")
             return result
         
         # 第二层：扩展搜索（前50% + 中间30%-80%）
-        result = self._extract_amounts_extended(text, language, 'claim')
+        result = self._extract_amounts_extended(text, language, 'claim', amount_matches, context_scores)
         if result:
             self.logger.info("第二层扩展搜索成功")
             return result
         
         # 第三层：全文宽松搜索
-        result = self._extract_amounts_loose(text, language, 'claim')
+        result = self._extract_amounts_loose(text, language, 'claim', amount_matches, context_scores)
         if result:
             self.logger.info("第三层宽松搜索成功")
             return result
@@ -2160,19 +2573,24 @@ class DocumentExtractor:
         """增强版判决金额提取 - 三层递进策略"""
         
         # 第一层：精确搜索（后40%）
-        result = self._extract_amounts_precise(text, language, 'judgment')
+        # 全文只扫描一次金额表达，三层搜索各自按区间筛选候选金额；
+        # 各层区间重叠处的同一上下文只做一次关键词评分
+        amount_matches = self._scan_amount_matches(text, language)
+        context_scores = {}
+        
+        result = self._extract_amounts_precise(text, language, 'judgment', amount_matches, context_scores)
         if result:
             self.logger.info("第一层精确搜索成功")
             return result
         
         # 第二层：扩展搜索（中间40%-90%）
-        result = self._extract_amounts_extended(text, language, 'judgment')
+        result = self._extract_amounts_extended(text, language, 'judgment', amount_matches, context_scores)
         if result:
             self.logger.info("第二层扩展搜索成功")
             return result
         
         # 第三层：全文宽松搜索
-        result = self._extract_amounts_loose(text, language, 'judgment')
+        result = self._extract_amounts_loose(text, language, 'judgment', amount_matches, context_scores)
         if result:
             self.logger.info("第三层宽松搜索成功")
             return result
@@ -2180,7 +2598,8 @@ class DocumentExtractor:
         self.logger.info("所有层级搜索均未找到判决金额")
         return ""
     
-    def _extract_amounts_precise(self, text: str, language: str, amount_type: str) -> str:
+    def _extract_amounts_precise(self, text: str, language: str, amount_type: str, amount_matches: Optional[list] = None,
+                                 context_scores: Optional[dict] = None) -> str:
         """第一层：精确搜索"""
         total_chars = len(text)
         
@@ -2189,27 +2608,29 @@ class DocumentExtractor:
             front_30_end = min(total_chars * 3 // 10, 10000)
             back_30_start = max(total_chars * 7 // 10, total_chars - 8000)
             
-            front_section = text[:front_30_end]
-            back_section = text[back_30_start:]
-            
-            self.logger.info(f"精确搜索申请金额: 前{front_30_end}字符 + 后{len(back_section)}字符")
+            self.logger.info(f"精确搜索申请金额: 前{front_30_end}字符 + 后{total_chars - back_30_start}字符")
             
             # 使用增强关键词搜索
-            front_result = self._extract_amounts_by_enhanced_keywords(front_section, language, amount_type, threshold=2.5)
-            back_result = self._extract_amounts_by_enhanced_keywords(back_section, language, amount_type, threshold=2.5)
+            front_result = self._extract_amounts_by_enhanced_keywords(text, language, amount_type, threshold=2.5,
+                                                                      amount_matches=amount_matches, context_scores=context_scores,
+                                                                      end=front_30_end)
+            back_result = self._extract_amounts_by_enhanced_keywords(text, language, amount_type, threshold=2.5,
+                                                                     amount_matches=amount_matches, context_scores=context_scores,
+                                                                     start=back_30_start)
             
             return self._combine_amount_results([front_result, back_result])
             
         else:  # judgment
             # 后40%
             back_40_start = max(total_chars * 6 // 10, total_chars - 12000)
-            judgment_section = text[back_40_start:]
-            
-            self.logger.info(f"精确搜索判决金额: 后{len(judgment_section)}字符")
+            self.logger.info(f"精确搜索判决金额: 后{total_chars - back_40_start}字符")
             
-            return self._extract_amounts_by_enhanced_keywords(judgment_section, language, amount_type, threshold=2.5)
+            return self._extract_amounts_by_enhanced_keywords(text, language, amount_type, threshold=2.5,
+                                                              amount_matches=amount_matches, context_scores=context_scores,
+                                                              start=back_40_start)
 
-    def _extract_amounts_extended(self, text: str, language: str, amount_type: str) -> str:
+    def _extract_amounts_extended(self, text: str, language: str, amount_type: str, amount_matches: Optional[list] = None,
+                                  context_scores: Optional[dict] = None) -> str:
         """第二层：扩展搜索"""
         total_chars = len(text)
         
@@ -2219,13 +2640,14 @@ class DocumentExtractor:
             middle_start = total_chars * 3 // 10
             middle_end = total_chars * 8 // 10
             
-            front_section = text[:front_50_end]
-            middle_section = text[middle_start:middle_end]
+            self.logger.info(f"扩展搜索申请金额: 前{front_50_end}字符 + 中间{middle_end - middle_start}字符")
             
-            self.logger.info(f"扩展搜索申请金额: 前{front_50_end}字符 + 中间{len(middle_section)}字符")
-            
-            front_result = self._extract_amounts_by_enhanced_keywords(front_section, language, amount_type, threshold=2.0)
-            middle_result = self._extract_amounts_by_enhanced_keywords(middle_section, language, amount_type, threshold=2.0)
+            front_result = self._extract_amounts_by_enhanced_keywords(text, language, amount_type, threshold=2.0,
+                                                                      amount_matches=amount_matches, context_scores=context_scores,
+                                                                      end=front_50_end)
+            middle_result = self._extract_amounts_by_enhanced_keywords(text, language, amount_type, threshold=2.0,
+                                                                       amount_matches=amount_matches, context_scores=context_scores,
+                                                                       start=middle_start, end=middle_end)
             
             return self._combine_amount_results([front_result, middle_result])
             
@@ -2233,57 +2655,65 @@ class DocumentExtractor:
             # 中间40%-90%
             middle_start = total_chars * 4 // 10
             middle_end = total_chars * 9 // 10
-            judgment_section = text[middle_start:middle_end]
-            
-            self.logger.info(f"扩展搜索判决金额: 中间{len(judgment_section)}字符")
+            self.logger.info(f"扩展搜索判决金额: 中间{middle_end - middle_start}字符")
             
-            return self._extract_amounts_by_enhanced_keywords(judgment_section, language, amount_type, threshold=2.0)
+            return self._extract_amounts_by_enhanced_keywords(text, language, amount_type, threshold=2.0,
+                                                              amount_matches=amount_matches, context_scores=context_scores,
+                                                              start=middle_start, end=middle_end)
 
-    def _extract_amounts_loose(self, text: str, language: str, amount_type: str) -> str:
+    def _extract_amounts_loose(self, text: str, language: str, amount_type: str, amount_matches: Optional[list] = None,
+                               context_scores: Optional[dict] = None) -> str:
         """第三层：全文宽松搜索"""
         self.logger.info(f"宽松搜索{amount_type}金额: 全文{len(text)}字符")
         
         # 降低阈值，进行全文搜索
-        return self._extract_amounts_by_enhanced_keywords(text, language, amount_type, threshold=1.0)
+        return self._extract_amounts_by_enhanced_keywords(text, language, amount_type, threshold=1.0,
+                                                          amount_matches=amount_matches, context_scores=context_scores)
 
-    def _extract_amounts_by_enhanced_keywords(self, text: str, language: str, amount_type: str, threshold: float = 2.0) -> str:
-        """使用增强关键词库的金额提取"""
-        if not text or len(text) < 50:
+    def _extract_amounts_by_enhanced_keywords(self, text: str, language: str, amount_type: str, threshold: float = 2.0,
+                                              amount_matches: Optional[list] = None, start: int = 0,
+                                              end: Optional[int] = None, context_scores: Optional[dict] = None) -> str:
+        """使用增强关键词库的金额提取（只考虑 text[start:end] 区间内的金额）"""
+        if end is None:
+            end = len(text)
+        if end - start < 50:
             return ""
         
         # 获取增强的关键词库
-        keywords, context_words = self._get_enhanced_keywords(language, amount_type)
-        
-        # 获取增强的金额模式
-        amount_patterns = self._get_enhanced_amount_patterns(language)
+        keyword_weights = self._get_keyword_weights(language, amount_type)
         
         # 先找到所有潜在金额
-        potential_amounts = self._find_potential_amounts(text, amount_patterns)
+        if amount_matches is None:
+            amount_matches = self._scan_amount_matches(text, language)
+        potential_amounts = self._find_potential_amounts(text, amount_matches, start, end)
         
         # 验证每个金额的上下文相关性
+        if context_scores is None:
+            context_scores = {}
         validated_amounts = []
         for amount_info in potential_amounts:
-            score = self._validate_amount_context(amount_info, amount_type, language, keywords, context_words)
+            score = self._validate_amount_context(amount_info, end - start, amount_type, keyword_weights, context_scores)
             if score >= threshold:
-                validated_amounts.append({
-                    'text': amount_info['context'],
-                    'score': score,
-                    'amount': amount_info['amount']
-                })
+                validated_amounts.append((score, amount_info[0], amount_info[1]))
         
-        # 按分数排序并返回结果
+        # 按分数取结果
         if validated_amounts:
-            validated_amounts.sort(key=lambda x: x['score'], reverse=True)
-            # 最多返回前3个最相关的结果
-            top_results = validated_amounts[:3]
-            result_texts = [item['text'] for item in top_results]
+            # 最多返回前3个最相关的结果（nlargest 与稳定降序排序后取前3个结果相同，无需整体排序）
+            top_results = heapq.nlargest(3, validated_amounts, key=itemgetter(0))
+            result_texts = [_norm_ws(text[context_start:context_end]) for _, context_start, context_end in top_results]
             
             combined_result = ' | '.join(result_texts)
             if len(combined_result) > 3000:
                 combined_result = combined_result[:2997] + '...'
             
+            # 金额分析使用按位置合并后的上下文：相互重叠的窗口合并为一段，原文中的同一处金额只出现一次
+            merged_spans = _merge_spans(sorted((context_start, context_end) for _, context_start, context_end in top_results))
+            analysis_text = ' | '.join(_norm_ws(text[span_start:span_end]) for span_start, span_end in merged_spans)
+            if len(analysis_text) > 3000:
+                analysis_text = analysis_text[:2997] + '...'
+            
             # LLM分析：从文本中提取具体的金额数字
-            analyzed_amount = self._analyze_amount_with_llm(combined_result, amount_type, language)
+            analyzed_amount = self._analyze_amount_with_llm(analysis_text, amount_type, language)
             if analyzed_amount:
                 return analyzed_amount
             
@@ -2292,151 +2722,100 @@ class DocumentExtractor:
         return ""
 
     def _get_enhanced_keywords(self, language: str, amount_type: str) -> tuple:
-        """获取增强的关键词库"""
-        if language == 'english':
-            if amount_type == 'claim':
-                keywords = [
-                    # 原有关键词
-                    'claims', 'seeks', 'damages', 'compensation', 'plaintiff seeks', 
-                    'applicant seeks', 'prays for', 'relief sought',
-                    
-                    # 新增关键词
-                    'sum of', 'amount of', 'payment of', 'recovery of', 'reimbursement of',
-                    'refund of', 'outstanding', 'principal amount', 'principal sum',
-                    'loan amount', 'debt of', 'owing', 'due and owing', 'balance of',
-                    'unpaid sum', 'contractual amount', 'agreed sum', 'deposit of',
-                    'security of', 'guarantee of', 'liability of', 'quantum of',
-                    'monetary claim', 'financial claim', 'pecuniary loss', 'loss and damage'
-                ]
-                context_words = ['claim', 'seek', 'damage', 'compensation', 'debt', 'owing', 'recovery', 'loss']
-            else:  # judgment
-                keywords = [
-                    # 原有关键词
-                    'ordered to pay', 'judgment for', 'costs assessed', 'defendant shall pay',
-                    'award', 'grant', 'summarily assessed',
-                    
-                    # 新增关键词
-                    'I order', 'the court orders', 'hereby ordered', 'it is ordered',
-                    'judgment is entered', 'decree that', 'direct payment', 'liable to pay',
-                    'responsible for', 'costs of', 'costs in the sum', 'interest on',
-                    'penalty of', 'fine of', 'damages awarded', 'compensation ordered',
-                    'restitution of', 'refund ordered', 'payment directed', 'sum awarded',
-                    'amount granted', 'relief granted', 'monetary judgment', 'pecuniary award',
-                    'costs summarily assessed', 'costs taxed', 'interest at', 'compound interest',
-                    'default judgment for', 'judgment in favour', 'enter judgment for'
-                ]
-                context_words = ['order', 'pay', 'costs', 'assess', 'award', 'judgment', 'grant', 'liable']
-        else:  # chinese
-            if amount_type == 'claim':
-                keywords = [
-                    '申請', '索償', '賠償', '損失', '要求', '請求', '原告申請', '申請人請求',
-                    '欠款', '債務', '借款', '貸款', '本金', '利息', '違約金', '罰款'
-                ]
-                context_words = ['申請', '索償', '賠償', '要求', '損失', '債務']
-            else:  # judgment
-                keywords = [
-                    '判令', '命令', '賠償', '支付', '費用', '法庭命令', '判決', '裁定支付',
-                    '責令', '判給', '給予', '授予', '課以', '罰款', '利息'
-                ]
-                context_words = ['判令', '支付', '費用', '賠償', '命令', '判決']
-        
-        return keywords, context_words
-
-    def _get_enhanced_amount_patterns(self, language: str) -> list:
-        """获取增强的金额识别模式"""
-        patterns = [
-            # 完整货币表达
-            r'HK\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
-            r'USD?[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?', 
-            r'US\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
-            r'RMB[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
-            
-            # 文字描述
-            r'(?:Hong Kong|US|United States)\s+Dollars?\s*[\d,]+(?:\.\d{2})?',
-            r'(?:the\s+)?sum of\s+HK\$[\d,]+(?:\.\d{2})?',
-            r'(?:the\s+)?amount of\s+USD?[\d,]+(?:\.\d{2})?',
-            
-            # 复合表达（本金+利息）
-            r'HK\$[\d,]+(?:\.\d{2})?\s+(?:plus|together with|and)\s+interest',
-            r'principal sum of\s+HK\$[\d,]+(?:\.\d{2})?',
-            r'outstanding balance of\s+USD?[\d,]+(?:\.\d{2})?',
-            
-            # 数字先行模式
-            r'[\d,]+(?:\.\d{2})?\s*(?:Hong Kong Dollars|US Dollars|USD|HKD)',
-            r'[\d,]+(?:\.\d{2})?\s*(?:million|billion|thousand)?\s*(?:dollars?|USD|HKD)',
-            
-            # 简单数字模式（大金额）
-            r'\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
-            r'[\d]{1,3}(?:,\d{3})+(?:\.\d{2})?',  # 格式化大数字
-        ]
-        
+        """获取增强的关键词库：(关键词, 上下文词汇)"""
+        language = 'english' if language == 'english' else 'chinese'
+        amount_type = 'claim' if amount_type == 'claim' else 'judgment'
+        return self._AMOUNT_KEYWORDS[(language, amount_type)]
+
+    def _get_enhanced_amount_pattern(self, language: str):
+        """获取增强的金额识别模式（所有模式合并后的预编译交替模式）"""
         if language == 'chinese':
-            patterns.extend([
-                r'(?:港幣|港币|美金|美元|人民幣|人民币)[\d,\.]+(?:萬|万|億|亿)?',
-                r'[\d,]+(?:\.\d{2})?\s*(?:港元|美元|人民币)',
-                r'[\d,]+\s*(?:萬|万|億|亿)\s*(?:港元|美元)'
-            ])
+            return self._CN_AMOUNT_RE
+        return self._EN_AMOUNT_RE
+
+    def _scan_amount_matches(self, text: str, language: str) -> list:
+        """扫描全文中的金额表达，返回按出现位置排列、互不重叠的 (起点, 终点, 金额文本)
         
-        return patterns
+        同一文档的 claim 与 judgment 提取共用一次扫描结果（只读，不可修改）
+        """
+        digest = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        cache_key = (digest, len(text), language)
+        cached_key, cached_matches = self._amount_matches_cache
+        if cached_key == cache_key:
+            return cached_matches
+        
+        pattern = self._get_enhanced_amount_pattern(language)
+        matches = pattern.finditer(text, concurrent=True) if _regex else pattern.finditer(text)
+        amount_matches = [(match.start(), match.end(), match.group()) for match in matches]
+        self._amount_matches_cache = (cache_key, amount_matches)
+        return amount_matches
 
-    def _find_potential_amounts(self, text: str, amount_patterns: list) -> list:
-        """查找所有潜在的金额表达"""
+    def _find_potential_amounts(self, text: str, amount_matches: list, start: int, end: int) -> list:
+        """查找 text[start:end] 区间内的潜在金额表达（amount_matches 按位置排列且互不重叠）
+        
+        Returns:
+            [(上下文起点, 上下文终点, 规范化的小写上下文, 金额在区间内的位置), ...]
+        """
         potential_amounts = []
         
-        for pattern in amount_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # 提取上下文（前后各150字符）
-                start = max(0, match.start() - 150)
-                end = min(len(text), match.end() + 150)
-                context = text[start:end]
-                
-                # 清理上下文
-                context = re.sub(r'\s+', ' ', context.strip())
-                
-                potential_amounts.append({
-                    'amount': match.group(),
-                    'context': context,
-                    'position': match.start(),
-                    'full_text_len': len(text)
-                })
+        # 区间只转一次小写，评分用的小写上下文直接从中切片（小写化改变了长度时退回逐个转换）
+        section_lower = text[start:end].lower()
+        same_offsets = len(section_lower) == end - start
+        
+        # 二分定位区间内的第一个匹配；匹配互不重叠，终点也递增，越过区间终点即可停止
+        first = bisect_left(amount_matches, (start,))
+        for match_start, match_end, _ in islice(amount_matches, first, None):
+            if match_end > end:
+                break
+            
+            # 上下文范围（前后各150字符，不越出区间）；原文上下文只为最终入选的结果生成
+            context_start = max(start, match_start - 150)
+            context_end = min(end, match_end + 150)
+            if same_offsets:
+                context_lower = _norm_ws(section_lower[context_start - start:context_end - start])
+            else:
+                context_lower = _norm_ws(text[context_start:context_end]).lower()
+            
+            potential_amounts.append((context_start, context_end, context_lower, match_start - start))
         
         return potential_amounts
 
-    def _validate_amount_context(self, amount_info: dict, amount_type: str, language: str, 
-                                keywords: list, context_words: list) -> float:
-        """验证金额上下文的相关性，返回置信度分数"""
-        context = amount_info['context'].lower()
-        score = 0.0
-        
-        # 关键词匹配得分
-        for keyword in keywords:
-            if keyword.lower() in context:
-                if len(keyword) > 10:  # 长关键词权重更高
-                    score += 3
-                elif len(keyword) > 5:
-                    score += 2
-                else:
-                    score += 1
-        
-        # 上下文词汇得分
-        for word in context_words:
-            if word.lower() in context:
-                score += 1
-        
-        # 负面关键词扣分（避免误判）
-        if amount_type == 'claim':
-            negative_words = ['costs', 'legal fees', 'court fees', 'filing fee', 'ordered to pay']
-        else:  # judgment
-            negative_words = ['claims', 'seeks damages', 'plaintiff seeks', 'applicant seeks']
+    def _get_keyword_weights(self, language: str, amount_type: str) -> tuple:
+        """获取金额上下文评分表 ((小写词, 分值), ...)，按 (语言, 金额类型) 只构建一次"""
+        cache_key = (language, amount_type)
+        keyword_weights = self._keyword_weight_cache.get(cache_key)
+        if keyword_weights is None:
+            keywords, context_words = self._get_enhanced_keywords(language, amount_type)
+            
+            # 关键词：长关键词权重更高
+            weights = [(keyword.lower(), 3 if len(keyword) > 10 else 2 if len(keyword) > 5 else 1)
+                       for keyword in keywords]
+            # 上下文词汇
+            weights.extend((word.lower(), 1) for word in context_words)
+            # 负面关键词扣分（避免误判）
+            negative_words = self._AMOUNT_NEGATIVE_WORDS['claim' if amount_type == 'claim' else 'judgment']
+            weights.extend((neg_word, -1.5) for neg_word in negative_words)
+            
+            # 同一个词在多个词表中出现时合并为一项，评分时每个词只做一次子串查找
+            merged = {}
+            for word, weight in weights:
+                merged[word] = merged.get(word, 0) + weight
+            keyword_weights = self._keyword_weight_cache[cache_key] = tuple(merged.items())
+        return keyword_weights
+
+    def _validate_amount_context(self, amount_info: tuple, section_len: int, amount_type: str, keyword_weights: tuple,
+                                 context_scores: dict) -> float:
+        """验证金额上下文的相关性，返回置信度分数；context_scores 缓存各上下文的关键词得分"""
+        _, _, context, position = amount_info
         
-        for neg_word in negative_words:
-            if neg_word in context:
-                score -= 1.5
+        # 关键词、上下文词汇得分与负面关键词扣分（每个词出现即计一次）
+        score = context_scores.get(context)
+        if score is None:
+            score = context_scores[context] = sum((weight for word, weight in keyword_weights if word in context), 0.0)
         
         # 位置加分
-        if amount_info.get('full_text_len', 0) > 0:
-            text_position = amount_info['position'] / amount_info['full_text_len']
+        if section_len > 0:
+            text_position = position / section_len
             if amount_type == 'judgment' and text_position > 0.6:
                 score += 1  # 判决金额在后部分
             elif amount_type == 'claim' and text_position < 0.4:
@@ -2449,124 +2828,44 @@ class DocumentExtractor:
         if not text or len(text.strip()) < 20:
             return ""
         
-        try:
-            # 构建分析提示
-            if language == 'english':
-                if amount_type == 'claim':
-                    prompt = f"""
-分析以下法律文档文本，提取所有被告要求赔偿的现金总额。
-
-要求：
-1. 只返回一个具体的金额数字（如：HK$100,000 或 USD50,000）
-2. 如果有多个金额，计算总和
-3. 如果没有明确的金额，返回unknown
-4. 不要包含解释或其他文字
-
-文本内容：
-{text}
-
-分析结果（只返回金额数字）："""
-                else:  # judgment
-                    prompt = f"""
-分析以下法律文档文本，提取所有被告实际需要赔偿的总额（判决金额）。
-
-要求：
-1. 只返回一个具体的金额数字（如：HK$100,000 或 USD50,000）
-2. 如果有多个金额，计算总和
-3. 如果没有明确的判决金额，返回unknown
-4. 不要包含解释或其他文字
-
-文本内容：
-{text}
-
-分析结果（只返回金额数字）："""
-            else:  # chinese
-                if amount_type == 'claim':
-                    prompt = f"""
-分析以下中文法律文档文本，提取所有申请人要求的赔偿总额。
-
-要求：
-1. 只返回一个具体的金额数字（如：港币100,000元 或 人民币50,000元）
-2. 如果有多个金额，计算总和
-3. 如果没有明确的金额，返回空字符串
-4. 不要包含解释或其他文字
-
-文本内容：
-{text}
-
-分析结果（只返回金额数字）："""
-                else:  # judgment
-                    prompt = f"""
-分析以下中文法律文档文本，提取所有被告实际需要赔偿的总额（判决金额）。
-
-要求：
-1. 只返回一个具体的金额数字（如：港币100,000元 或 人民币50,000元）
-2. 如果有多个金额，计算总和
-3. 如果没有明确的判决金额，返回空字符串
-4. 不要包含解释或其他文字
-
-文本内容：
-{text}
-
-分析结果（只返回金额数字）："""
-            
-            # 这里可以集成实际的LLM API调用
-            # 目前先使用基于规则的方法作为备选
-            analyzed_amount = self._extract_amount_numbers_from_text(text)
-            
-            if analyzed_amount:
-                self.logger.info(f"LLM分析成功提取{amount_type}金额: {analyzed_amount}")
-                return analyzed_amount
-                
-        except Exception as e:
-            self.logger.warning(f"LLM金额分析失败: {e}")
-        
-        return ""
+        # 这里可以集成实际的LLM API调用（届时再按 amount_type / language 构建提示词）
+        # 目前先使用基于规则的方法作为备选
+        analyzed_amount = self._extract_amount_numbers_from_text(text)
+        if analyzed_amount:
+            self.logger.info(f"LLM分析成功提取{amount_type}金额: {analyzed_amount}")
+        return analyzed_amount
     
     def _extract_amount_numbers_from_text(self, text: str) -> str:
         """从文本中提取并计算金额数字（增强版）"""
-        # 更全面的金额识别模式
-        amount_patterns = [
-            # 标准货币格式
-            r'HK\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
-            r'USD?\s*[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
-            r'US\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
-            r'RMB[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
-            
-            # 文字表达
-            r'(?:Hong Kong|US|United States)\s+Dollars?\s*[\d,]+(?:\.\d{2})?',
-            r'(?:the\s+)?sum of\s+(?:HK\$|USD?|US\$)[\d,]+(?:\.\d{2})?',
-            r'(?:the\s+)?amount of\s+(?:HK\$|USD?|US\$)[\d,]+(?:\.\d{2})?',
-            
-            # 数字在前格式
-            r'[\d,]+(?:\.\d{2})?\s*(?:Hong Kong Dollars|US Dollars|USD|HKD)',
-            r'[\d,]+(?:\.\d{2})?\s*(?:million|billion|thousand)?\s*(?:dollars?|USD|HKD)',
-            
-            # 简单数字（大金额）
-            r'\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|billion|thousand))?',
-            r'[\d]{1,3}(?:,\d{3})+(?:\.\d{2})?',  # 格式化大数字
-            
-            # 中文格式
-            r'(?:港币|港幣|美金|美元|人民币|人民幣)[\d,]+(?:\.\d{2})?(?:\s*(?:万|萬|亿|億))?',
-            r'[\d,]+(?:\.\d{2})?\s*(?:港元|美元|人民币|元)',
-            r'[\d,]+\s*(?:万|萬|亿|億)\s*(?:港元|美元|元)',
-            
-            # 法律文档常见表达
-            r'damages?\s+(?:of|in the sum of|totaling|amounting to)\s+(?:HK\$|USD?|US\$|\$)[\d,]+(?:\.\d{2})?',
-            r'compensation\s+(?:of|in the sum of)\s+(?:HK\$|USD?|US\$|\$)[\d,]+(?:\.\d{2})?',
-            r'costs?\s+(?:of|in the sum of|assessed at)\s+(?:HK\$|USD?|US\$|\$)[\d,]+(?:\.\d{2})?'
-        ]
-        
         found_amounts = []
         amount_values = []
         currencies = set()
-        
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
+        # 已计入的匹配区间（互不重叠，按位置排序）：同一处金额被多个模式匹配时只按最先（最具体）的模式计一次
+        taken_starts = []
+        taken_ends = []
+        # 已计入的 (数值, 币种)：判决书中复述的同一金额（"the said sum of HK$..."）只计一次，
+        # 紧接 "further / additional / 另加" 等措辞的金额是另一笔款项，照常累加
+        seen_amounts = set()
+        
+        for pattern in self._AMOUNT_NUMBER_PATTERNS:
+            for number_match in pattern.finditer(text):
+                match_start, match_end = number_match.span()
+                # 第一个终点在 match_start 之后的已计入区间，若其起点早于 match_end 则两者重叠
+                index = bisect_right(taken_ends, match_start)
+                if index < len(taken_starts) and taken_starts[index] < match_end:
+                    continue
+                taken_starts.insert(index, match_start)
+                taken_ends.insert(index, match_end)
+                
                 # 提取数字和币种
+                match = number_match.group()
                 amount_data = self._parse_amount_match(match)
                 if amount_data:
+                    if amount_data in seen_amounts:
+                        preceding = text[max(0, match_start - self._AMOUNT_ADDITIONAL_LOOKBEHIND):match_start]
+                        if not self._AMOUNT_ADDITIONAL_RE.search(preceding):
+                            continue
+                    seen_amounts.add(amount_data)
                     value, currency = amount_data
                     if value > 0:  # 排除零值
                         amount_values.append(value)
@@ -2591,18 +2890,19 @@ class DocumentExtractor:
     def _parse_amount_match(self, match: str) -> tuple:
         """解析匹配到的金额字符串，返回(数值, 币种)"""
         try:
-            # 确定币种
-            if 'HK' in match.upper() or '港' in match:
+            # 确定币种（只转一次大写）
+            upper = match.upper()
+            if 'HK' in upper or '港' in match:
                 currency = 'HK$'
-            elif 'USD' in match.upper() or 'US$' in match.upper() or 'US ' in match.upper() or '美' in match:
+            elif 'US' in upper and ('USD' in upper or 'US$' in upper or 'US ' in upper) or '美' in match:
                 currency = 'USD'
-            elif 'RMB' in match.upper() or '人民' in match:
+            elif 'RMB' in upper or '人民' in match:
                 currency = 'RMB'
             else:
                 currency = '$'
             
             # 提取数字
-            number_match = re.search(r'[\d,]+(?:\.\d{2})?', match)
+            number_match = self._AMOUNT_DIGITS_RE.search(match)
             if not number_match:
                 return None
             
@@ -2610,16 +2910,11 @@ class DocumentExtractor:
             value = float(number_str)
             
             # 处理单位（million, billion等）
-            if re.search(r'\bmillion\b', match, re.IGNORECASE):
-                value *= 1000000
-            elif re.search(r'\bbillion\b', match, re.IGNORECASE):
-                value *= 1000000000
-            elif re.search(r'\bthousand\b', match, re.IGNORECASE):
-                value *= 1000
-            elif '万' in match or '萬' in match:
-                value *= 10000
-            elif '亿' in match or '億' in match:
-                value *= 100000000
+            lowered = match.lower()
+            for unit, multiplier in self._AMOUNT_UNIT_MULTIPLIERS.items():
+                if unit in lowered:
+                    value *= multiplier
+                    break
             
             return (value, currency)
             
@@ -2633,18 +2928,16 @@ class DocumentExtractor:
         if not valid_results:
             return ""
         
-        # 去重
+        # 去重：长度超过50的结果前50个字符相同视为重复
         unique_results = []
+        seen_prefixes = set()  # 已保留结果（长度>50）的前50字符
         for result in valid_results:
-            # 简单去重：检查前50个字符是否相似
-            is_duplicate = False
-            for existing in unique_results:
-                if len(result) > 50 and len(existing) > 50:
-                    if result[:50] == existing[:50]:
-                        is_duplicate = True
-                        break
-            if not is_duplicate:
-                unique_results.append(result)
+            if len(result) > 50:
+                prefix = result[:50]
+                if prefix in seen_prefixes:
+                    continue
+                seen_prefixes.add(prefix)
+            unique_results.append(result)
         
         combined = ' | '.join(unique_results)
         if len(combined) > 3000:
@@ -2656,7 +2949,7 @@ class DocumentExtractor:
         """检测文书类型"""
         if file_name:
             file_upper = file_name.upper()
-            for doc_type in ['HCA', 'HCAL', 'CACC', 'CAMP', 'CACV', 'DCCC', 'DCMP', 'DCCJ', 'LD', 'HC', 'FCMC']:
+            for doc_type in self._DOCUMENT_TYPES:
                 if doc_type in file_upper:
                     self.logger.info(f"Document type detected from filename: {doc_type}")
                     return doc_type
@@ -2803,21 +3096,22 @@ class DocumentExtractor:
         
         corrections = []
         for pattern in correction_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                for match in matches[:2]:  # 最多2个更正
-                    if isinstance(match, tuple) and len(match) == 2:
-                        corrections.append(f"{match[0]} → {match[1]}")
-                    elif isinstance(match, tuple):
-                        corrections.append(' '.join(match))
-                    else:
-                        corrections.append(str(match))
+            # 最多2个更正：只取前两个匹配，不必先收集全部匹配
+            for match in islice(re.finditer(pattern, text, re.IGNORECASE), 2):
+                groups = match.groups()
+                if len(groups) == 2:
+                    corrections.append(f"{groups[0]} → {groups[1]}")
+                elif groups:
+                    corrections.append(groups[0])
+                else:
+                    corrections.append(match.group())
         
         if not corrections:
             # 简单描述
-            if 'names' in text.lower() and 'added' in text.lower():
+            text_lower = text.lower()
+            if 'names' in text_lower and 'added' in text_lower:
                 corrections.append("添加律师姓名")
-            elif 'corrected' in text.lower():
+            elif 'corrected' in text_lower:
                 corrections.append("文字更正")
             else:
                 corrections.append("格式或内容更正")
@@ -2843,6 +3137,35 @@ class DocumentExtractor:
         self.logger.info(f"Successfully processed {pdf_path}")
         return result 
     
+    def extract_batch(self, texts: List[str], file_names: Optional[List[str]] = None,
+                      max_workers: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        多进程批量提取文本信息（正则匹配为CPU密集型，按文档并行）
+        
+        Args:
+            texts: 文档文本列表
+            file_names: 对应的文件名列表（可选）
+            max_workers: 最大工作进程数，None为自动检测
+            
+        Returns:
+            与输入顺序一致的提取结果列表
+        """
+        if file_names is None:
+            file_names = [""] * len(texts)
+        
+        # 单个文档或单进程时直接在当前进程处理，避免进程池开销
+        if len(texts) <= 1 or max_workers == 1:
+            return [self.extract_information(text, file_name) for text, file_name in zip(texts, file_names)]
+        
+        workers = max_workers or os.cpu_count() or 1
+        # 按块分发任务，减少进程间通信次数
+        chunksize = max(1, len(texts) // (workers * 4))
+        
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_batch_worker,
+                                 initargs=(self.logger.level,)) as executor:
+            return list(executor.map(_extract_in_batch_worker, texts, file_names, chunksize=chunksize))
+    
     def _extract_multiple_parties_chinese(self, text: str, party_type: str) -> str:
         """提取多方当事人（中文）- 增强版，支持诉讼描述格式"""
         
@@ -2867,46 +3190,38 @@ class DocumentExtractor:
     
     def _extract_standard_chinese_plaintiffs(self, text: str) -> str:
         """提取标准格式中文原告"""
-        patterns = [
-            r'第一原告人\s*([^第\n]+)(?=第二原告人|第三原告人|被告)',
-            r'第二原告人\s*([^第\n]+)(?=第三原告人|第四原告人|被告)',
-            r'第三原告人\s*([^第\n]+)(?=第四原告人|第五原告人|被告)',
-            r'第四原告人\s*([^第\n]+)(?=第五原告人|第六原告人|被告)',
-            r'第五原告人\s*([^第\n]+)(?=第六原告人|被告)',
-        ]
-        
-        parties = []
-        for i, pattern in enumerate(patterns, 1):
-            match = re.search(pattern, text)
-            if match:
-                party_name = re.sub(r'\s+', ' ', match.group(1).strip())
-                if len(party_name) > 2:
-                    parties.append(f"{party_name} (第{i}原告人)")
-        
-        if len(parties) > 1:
-            return ' | '.join(parties)
-        elif len(parties) == 1:
-            return parties[0]
-        
-        return ""
+        return self._extract_standard_chinese_parties(text, '原告')
     
     def _extract_standard_chinese_defendants(self, text: str) -> str:
         """提取标准格式中文被告"""
-        patterns = [
-            r'第一被告人\s*([^第\n]+)(?=第二被告人|第三被告人|Before)',
-            r'第二被告人\s*([^第\n]+)(?=第三被告人|第四被告人|Before)',
-            r'第三被告人\s*([^第\n]+)(?=第四被告人|第五被告人|Before)',
-            r'第四被告人\s*([^第\n]+)(?=第五被告人|第六被告人|Before)',
-            r'第五被告人\s*([^第\n]+)(?=第六被告人|Before)',
-        ]
+        return self._extract_standard_chinese_parties(text, '被告')
+    
+    def _extract_standard_chinese_parties(self, text: str, role: str) -> str:
+        """提取标准格式中文当事人（第一至第五原告人/被告人），每个序号取首个匹配"""
+        combined_pattern, ordinal_patterns = self._CN_STANDARD_PARTY_PATTERNS[role]
+        
+        # 一次扫描：姓名部分不含"第"，一个匹配不会遮住其他序号的起点
+        names = {}
+        for match in combined_pattern.finditer(text):
+            index = self._CN_ORDINALS.index(match.group(1))
+            if index in names:
+                continue
+            next_ordinal = match.group(3)
+            if next_ordinal is None or 0 < self._CN_ORDINALS.index(next_ordinal) - index <= 2:
+                names[index] = match.group(2)
+            else:
+                # 后续序号超出允许范围：按该序号自己的模式从此处继续查找
+                exact_match = ordinal_patterns[index].search(text, match.start())
+                names[index] = exact_match.group(1) if exact_match else None
+            if len(names) == len(ordinal_patterns):
+                break
         
         parties = []
-        for i, pattern in enumerate(patterns, 1):
-            match = re.search(pattern, text)
-            if match:
-                party_name = re.sub(r'\s+', ' ', match.group(1).strip())
+        for index in range(len(ordinal_patterns)):
+            if names.get(index):
+                party_name = _norm_ws(names[index])
                 if len(party_name) > 2:
-                    parties.append(f"{party_name} (第{i}被告人)")
+                    parties.append(f"{party_name} (第{index + 1}{role}人)")
         
         if len(parties) > 1:
             return ' | '.join(parties)
@@ -2918,23 +3233,14 @@ class DocumentExtractor:
     def _extract_litigation_format_plaintiffs(self, text: str) -> str:
         """提取诉讼描述格式的原告 - 新增方法"""
         # 模式：原告人XXX起訴...
-        patterns = [
-            # 模式1：之原告人XXX起訴
-            r'之原告人([^起訴\n]+?)(?:起訴|女士起訴|先生起訴)',
-            # 模式2：原告人XXX起訴  
-            r'原告人([^起訴\n]+?)(?:起訴|女士起訴|先生起訴)',
-            # 模式3：申請人XXX申請
-            r'申請人([^申請\n]+?)(?:申請|女士申請|先生申請)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in self._CN_LITIGATION_PLAINTIFF_PATTERNS:
+            match = pattern.search(text)
             if match:
                 plaintiff_raw = match.group(1).strip()
                 
                 # 清理格式
-                plaintiff_clean = re.sub(r'\s+', ' ', plaintiff_raw)
-                plaintiff_clean = re.sub(r'^[^\u4e00-\u9fff]*', '', plaintiff_clean)  # 移除开头非中文字符
+                plaintiff_clean = _norm_ws(plaintiff_raw)
+                plaintiff_clean = _lstrip_noncjk(plaintiff_clean)  # 移除开头非中文字符
                 plaintiff_clean = plaintiff_clean.strip()
                 
                 if 2 <= len(plaintiff_clean) <= 50:
@@ -2944,58 +3250,53 @@ class DocumentExtractor:
     
     def _extract_litigation_format_defendants(self, text: str) -> str:
         """提取诉讼描述格式的被告 - 新增方法"""
+        # 以下所有模式都包含"被告人"，完整模式还必须包含"第二被告人"；缺少时直接跳过对应扫描
+        if '被告人' not in text:
+            return ""
+        
         defendants = []
         
         # 方法1：从完整诉讼描述中提取编号被告
-        litigation_patterns = [
-            # 匹配：起訴第一被告人XXX、第二被告人YYY...
-            r'起訴.*?第一被告人([^，、第]+?)(?:女士|先生)?[，、].*?第二被告人([^，、第]+?)(?:女士|先生)?(?:[，、].*?第三被告人([^，、第]+?)(?:女士|先生)?)?(?:[，、].*?第四被告人([^，、第]+?)(?:女士|先生)?)?',
-            # 简化模式：第X被告人XXX
-            r'第([一二三四五六七八九十])被告人([^，、第\n]+?)(?:女士|先生)?(?:[，、]|$)'
-        ]
-        
-        for pattern in litigation_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in (self._CN_LITIGATION_DEFENDANT_FULL_RE, self._CN_LITIGATION_DEFENDANT_SIMPLE_RE):
+            if pattern is self._CN_LITIGATION_DEFENDANT_FULL_RE and '第二被告人' not in text:
+                continue
+            matches = pattern.findall(text)
             if matches:
-                if pattern == litigation_patterns[0]:  # 完整模式
+                if pattern is self._CN_LITIGATION_DEFENDANT_FULL_RE:  # 完整模式
                     for match in matches:
                         for i, defendant_name in enumerate(match, 1):
                             if defendant_name and defendant_name.strip():
-                                clean_name = re.sub(r'\s+', ' ', defendant_name.strip())
+                                clean_name = _norm_ws(defendant_name)
                                 # 进一步清理
                                 clean_name = self._clean_chinese_defendant_name(clean_name)
                                 if clean_name:
                                     defendants.append(f"{clean_name} (第{i}被告人)")
                 else:  # 简化模式
-                    chinese_nums = {'一': 1, '二': 2, '三': 3, '四': 4, '五': 5, '六': 6, '七': 7, '八': 8, '九': 9, '十': 10}
                     for num_text, name in matches:
-                        if num_text in chinese_nums:
-                            clean_name = re.sub(r'\s+', ' ', name.strip())
-                            clean_name = self._clean_chinese_defendant_name(clean_name)
-                            if clean_name:
-                                defendants.append(f"{clean_name} (第{chinese_nums[num_text]}被告人)")
+                        # 模式只会捕获一至十中的一个字符
+                        clean_name = _norm_ws(name)
+                        clean_name = self._clean_chinese_defendant_name(clean_name)
+                        if clean_name:
+                            defendants.append(f"{clean_name} (第{self._CN_ORDINALS.index(num_text) + 1}被告人)")
         
         # 方法2：直接搜索被告模式（回退）
         if not defendants:
-            direct_patterns = [
-                r'第一被告人[：:\s]*([^，、第\n]+?)(?:女士|先生)?(?:[，、]|、第二被告人)',
-                r'第二被告人[：:\s]*([^，、第\n]+?)(?:女士|先生)?(?:[，、]|、第三被告人)',  
-                r'第三被告人[：:\s]*([^，、第\n]+?)(?:女士|先生)?(?:[，、]|、第四被告人)',
-                r'第四被告人[：:\s]*([^，、第\n]+?)(?:女士|先生)?(?:[，、]|$)',
-            ]
+            # 一次扫描找出第一至第四被告人各自的首个匹配（姓名部分不含"第"，匹配之间不会互相遮挡）
+            direct_names = {}
+            for match in self._CN_LITIGATION_DEFENDANT_DIRECT_RE.finditer(text):
+                index = self._CN_ORDINALS.index(match.group(1))
+                # 只有第四被告人允许以文本结尾收尾
+                if index in direct_names or (match.group(3) is None and index < 3):
+                    continue
+                direct_names[index] = match.group(2)
             
-            for i, pattern in enumerate(direct_patterns, 1):
-                match = re.search(pattern, text)
-                if match:
-                    clean_name = self._clean_chinese_defendant_name(match.group(1))
-                    if clean_name:
-                        defendants.append(f"{clean_name} (第{i}被告人)")
+            for index in sorted(direct_names):
+                clean_name = self._clean_chinese_defendant_name(direct_names[index])
+                if clean_name:
+                    defendants.append(f"{clean_name} (第{index + 1}被告人)")
         
-        # 去重并排序
-        unique_defendants = []
-        for defendant in defendants:
-            if defendant not in unique_defendants:
-                unique_defendants.append(defendant)
+        # 去重（保持顺序）
+        unique_defendants = list(dict.fromkeys(defendants))
         
         if len(unique_defendants) > 1:
             return ' | '.join(unique_defendants)
@@ -3010,21 +3311,21 @@ class DocumentExtractor:
             return ""
         
         # 基本清理
-        clean = re.sub(r'\s+', ' ', name.strip())
+        clean = _norm_ws(name)
         
         # 移除常见后缀词
-        clean = re.sub(r'(?:女士|先生|小姐)$', '', clean)
+        if clean.endswith(self._CN_NAME_HONORIFICS):
+            clean = clean[:-2]
         
         # 移除干扰词
-        clean = re.sub(r'^(?:及|、|，|,|\s)+', '', clean)
-        clean = re.sub(r'(?:及|、|，|,|\s)+$', '', clean)
+        clean = clean.strip(self._CN_NAME_JUNK_CHARS)
         
         # 移除明显的干扰内容
         if '無律師代' in clean or '缺席應訊' in clean or '親自出庭' in clean:
             return ""
         
         # 验证长度和有效性
-        if 2 <= len(clean) <= 30 and not re.match(r'^[\s\d，、,]+$', clean):
+        if 2 <= len(clean) <= 30 and not self._CN_NAME_INVALID_RE.match(clean):
             return clean
         
         return ""
@@ -3033,8 +3334,7 @@ class DocumentExtractor:
         """获取序数词后缀"""
         if 10 <= num % 100 <= 13:
             return 'th'
-        else:
-            return {1: 'st', 2: 'nd', 3: 'rd'}.get(num % 10, 'th')
+        return _ORDINAL_SUFFIXES[num % 10]
     
     def extract_lawyer_segment(self, text: str, language: str) -> str:
         """
@@ -3059,64 +3359,49 @@ class DocumentExtractor:
         self.logger.info("开始提取律师信息段落（从文档末尾）")
         
         # === 策略1：扫描文档最后20%的内容 ===
+        # 只传递起始位置，段落直接在全文上按位置切分，不复制末尾部分
         last_section_start = max(0, len(text) - len(text) // 5)
-        last_section = text[last_section_start:]
         
         if language == 'english':
-            return self._extract_english_lawyer_segment(last_section, text)
+            return self._extract_english_lawyer_segment(text, last_section_start)
         else:
-            return self._extract_chinese_lawyer_segment(last_section, text)
+            return self._extract_chinese_lawyer_segment(text, last_section_start)
     
-    def _extract_english_lawyer_segment(self, last_section: str, full_text: str) -> str:
+    def _extract_english_lawyer_segment(self, full_text: str, last_section_start: int) -> str:
         """提取英文律师信息段落 - 增强版"""
         lawyer_segments = []
         
-        # === 增强的律师信息模式 ===
-        lawyer_patterns = [
-            # 标准格式
-            r'(?i)(?:mr|ms|miss)\.?\s+[A-Z][a-z]+[^.]*?instructed\s+by[^.]*?for\s+(?:the\s+)?(?:plaintiff|defendant)',
-            r'(?i)instructed\s+by[^.]*?for\s+(?:the\s+)?(?:plaintiff|defendant)',
-            r'(?i)counsel\s+for\s+(?:the\s+)?(?:plaintiff|defendant)[:\s]+([^\n\.]+)',
-            r'(?i)(?:plaintiff|defendant).*?represented\s+by[^.]*?instructed\s+by',
-            
-            # 新增格式
-            r'(?i)for\s+(?:the\s+)?(?:plaintiff|defendant)[:\s]+(?:mr|ms|miss)\.?\s+[A-Z][a-z]+',
-            r'(?i)(?:mr|ms|miss)\.?\s+[A-Z][a-z]+.*?(?:instructed\s+by|of\s+[A-Z][a-z]+.*?(?:chambers|solicitors?))',
-            r'(?i)(?:mr|ms|miss)\.?\s+[A-Z][a-z]+.*?for\s+(?:the\s+)?(?:plaintiff|defendant|1st|2nd|3rd|4th)',
-            r'(?i)(?:leading\s+)?counsel.*?(?:instructed\s+by|for\s+(?:the\s+)?(?:plaintiff|defendant))',
-            r'(?i)(?:the\s+)?(?:plaintiff|defendant).*?(?:was\s+)?not\s+represented',
-        ]
+        # 末尾部分只转一次小写，各段落按位置切出小写版本；
+        # 少数字符转小写后长度会变化（如 'İ'），此时位置无法对齐，退回逐段转换
+        section_lower = full_text[last_section_start:].lower()
+        if len(section_lower) != len(full_text) - last_section_start:
+            section_lower = None
         
         # === 方法1：扫描段落 ===
-        paragraphs = re.split(r'\n\s*\n', last_section)
-        
-        for paragraph in paragraphs:
-            paragraph = paragraph.strip()
+        for para_start, para_end in _iter_paragraph_spans(full_text, last_section_start):
+            raw_paragraph = full_text[para_start:para_end]
+            paragraph = raw_paragraph.strip()
             if len(paragraph) < 30:  # 降低最小长度要求
                 continue
                 
-            # 检查律师信息模式
-            has_lawyer_info = any(re.search(pattern, paragraph) for pattern in lawyer_patterns)
-            
-            # 扩展关键词检查
-            lawyer_keywords = [
-                'instructed by', 'counsel for', 'represented by', 'chambers', 'solicitor',
-                'barrister', 'appeared for', 'acting for', 'solicitors', 'law firm',
-                'not represented', 'in person', 'did not appear'
-            ]
-            has_keywords = any(keyword in paragraph.lower() for keyword in lawyer_keywords)
-            
-            # 检查律师姓名模式
-            has_name_pattern = bool(re.search(r'(?i)(?:mr|ms|miss)\.?\s+[A-Z][a-z]+', paragraph))
+            # 扩展关键词检查（小写版本取自整段缓存）+ 律师姓名模式；两者都满足时无需再做模式扫描
+            if section_lower is not None:
+                offset = para_start - last_section_start + len(raw_paragraph) - len(raw_paragraph.lstrip())
+                paragraph_lower = section_lower[offset:offset + len(paragraph)]
+            else:
+                paragraph_lower = paragraph.lower()
+            has_keywords = any(keyword in paragraph_lower for keyword in self._EN_LAWYER_SEGMENT_KEYWORDS)
+            has_keywords_and_name = has_keywords and bool(self._LAWYER_TITLE_NAME_RE.search(paragraph))
             
-            if has_lawyer_info or (has_keywords and has_name_pattern):
+            # 检查律师信息模式
+            if has_keywords_and_name or self._EN_LAWYER_SEGMENT_RE.search(paragraph):
                 cleaned = self._clean_lawyer_segment(paragraph)
                 if 15 <= len(cleaned) <= 1000:  # 放宽长度限制
                     lawyer_segments.append(cleaned)
         
         # === 方法2：扫描最后几行（很多律师信息在文档最末尾）===
         if not lawyer_segments:
-            lines = last_section.split('\n')[-10:]  # 取最后10行
+            lines = full_text[last_section_start:].rsplit('\n', 10)[-10:]  # 取最后10行（只从末尾切分）
             
             for i, line in enumerate(lines):
                 line = line.strip()
@@ -3125,7 +3410,7 @@ class DocumentExtractor:
                 
                 # 检查是否包含律师信息
                 line_lower = line.lower()
-                if any(keyword in line_lower for keyword in ['instructed', 'counsel', 'represented', 'chambers']):
+                if any(keyword in line_lower for keyword in self._LAWYER_LINE_KEYWORDS):
                     # 收集相关的连续行
                     context_lines = []
                     start_idx = max(0, i-2)
@@ -3144,24 +3429,17 @@ class DocumentExtractor:
         
         # === 方法3：如果还是没找到，扩大搜索范围到文档后30% ===
         if not lawyer_segments:
+            # 直接从起始位置扫描全文（模式不含锚点），不复制后30%的文本；只切出每个匹配的上下文
             extended_section_start = max(0, len(full_text) - len(full_text) * 30 // 100)
-            extended_section = full_text[extended_section_start:]
             
             # 在更大范围内搜索明确的律师信息模式
-            clear_patterns = [
-                r'(?i)(?:mr|ms|miss)\.?\s+[A-Z][a-z]+.*?instructed\s+by.*?for\s+(?:the\s+)?(?:plaintiff|defendant)',
-                r'(?i)for\s+(?:the\s+)?(?:plaintiff|defendant)[:\s]+(?:mr|ms|miss)\.?\s+[A-Z][a-z]+.*?(?:instructed|chambers)',
-                r'(?i)(?:the\s+)?(?:plaintiff|defendant).*?not\s+represented',
-                r'(?i)(?:the\s+)?(?:plaintiff|defendant).*?did\s+not\s+appear'
-            ]
-            
-            for pattern in clear_patterns:
-                matches = re.finditer(pattern, extended_section)
+            for pattern in self._EN_LAWYER_CLEAR_PATTERNS:
+                matches = pattern.finditer(full_text, extended_section_start)
                 for match in matches:
                     # 获取匹配内容及其上下文
-                    start = max(0, match.start() - 100)
-                    end = min(len(extended_section), match.end() + 100)
-                    context = extended_section[start:end]
+                    start = max(extended_section_start, match.start() - 100)
+                    end = min(len(full_text), match.end() + 100)
+                    context = full_text[start:end]
                     
                     cleaned = self._clean_lawyer_segment(context)
                     if 20 <= len(cleaned) <= 600:
@@ -3171,18 +3449,16 @@ class DocumentExtractor:
         
         # === 组合结果 ===
         if lawyer_segments:
-            # 去重
+            # 去重：长度超过30的段落前30个字符相同视为重复
             unique_segments = []
+            seen_prefixes = set()  # 已保留段落（长度>30）的前30字符
             for segment in lawyer_segments:
-                is_duplicate = False
-                for existing in unique_segments:
-                    # 简单重复检查
-                    if len(segment) > 30 and len(existing) > 30:
-                        if segment[:30] == existing[:30]:
-                            is_duplicate = True
-                            break
-                if not is_duplicate:
-                    unique_segments.append(segment)
+                if len(segment) > 30:
+                    prefix = segment[:30]
+                    if prefix in seen_prefixes:
+                        continue
+                    seen_prefixes.add(prefix)
+                unique_segments.append(segment)
             
             # 限制总长度
             result_segments = []
@@ -3206,60 +3482,47 @@ class DocumentExtractor:
         self.logger.warning("未找到英文律师信息段落")
         return ""
     
-    def _extract_chinese_lawyer_segment(self, last_section: str, full_text: str) -> str:
+    def _extract_chinese_lawyer_segment(self, full_text: str, last_section_start: int) -> str:
         """提取中文律师信息段落"""
-        # 中文律师信息模式
-        chinese_patterns = [
-            r'委托律师[：:]\s*[^\n]+',
-            r'代理律师[：:]\s*[^\n]+',
-            r'(?:原告|申請人|被告|被申請人).*?委託.*?代理',
-            r'律师.*?(?:代表|代理)',
-        ]
-        
         lawyer_segments = []
         
-        # 按段落搜索
-        paragraphs = re.split(r'\n\s*\n', last_section)
-        
-        for paragraph in paragraphs:
+        # 按段落搜索（逐个产出段落，找到2个段落即停止）
+        for paragraph in _iter_paragraphs(full_text, last_section_start):
             paragraph = paragraph.strip()
             if len(paragraph) < 20:
                 continue
                 
-            # 检查是否包含中文律师信息
-            has_lawyer_info = any(re.search(pattern, paragraph) for pattern in chinese_patterns)
-            
-            chinese_keywords = ['委托律师', '代理律师', '委託', '代理', '律师']
-            has_keywords = any(keyword in paragraph for keyword in chinese_keywords)
-            
-            if has_lawyer_info or has_keywords:
+            # 检查是否包含中文律师信息（各律师信息模式都包含关键词，关键词检查即可覆盖）
+            if any(keyword in paragraph for keyword in self._CN_LAWYER_SEGMENT_KEYWORDS):
                 cleaned = self._clean_lawyer_segment(paragraph)
                 if 15 <= len(cleaned) <= 600:
                     lawyer_segments.append(cleaned)
+                    if len(lawyer_segments) >= 2:  # 中文最多2个段落
+                        break
         
         if lawyer_segments:
-            result = ' | '.join(lawyer_segments[:2])  # 中文最多2个段落
+            result = ' | '.join(lawyer_segments)
             self.logger.info(f"提取到中文律师信息段落，长度: {len(result)}")
             return result
         
         self.logger.warning("未找到中文律师信息段落")
         return ""
     
-    def _is_lawyer_segment(self, text: str) -> bool:
-        """判断文本是否是律师信息段落"""
-        text_lower = text.lower()
+    def _is_lawyer_segment(self, text: str, text_lower: str = None) -> bool:
+        """判断文本是否是律师信息段落；调用方已有小写文本时可通过 text_lower 传入，避免重复转换"""
+        if text_lower is None:
+            text_lower = text.lower()
         
         # 必须包含的关键词
-        required_keywords = ['instructed', 'counsel', 'represented', 'solicitor', 'chambers']
-        has_required = any(keyword in text_lower for keyword in required_keywords)
-        
-        # 律师姓名模式
-        has_name_pattern = bool(re.search(r'(?:mr|ms|miss)\.?\s+[A-Z][a-z]+', text))
+        if not any(keyword in text_lower for keyword in self._LAWYER_REQUIRED_KEYWORDS):
+            return False
         
-        # 当事方关键词
-        has_party_ref = any(word in text_lower for word in ['plaintiff', 'defendant', 'applicant', 'respondent'])
+        # 当事方关键词（子串检查比姓名模式扫描便宜，先检查）
+        if any(word in text_lower for word in self._LAWYER_PARTY_KEYWORDS):
+            return True
         
-        return has_required and (has_name_pattern or has_party_ref)
+        # 律师姓名模式
+        return bool(self._LAWYER_TITLE_NAME_CASED_RE.search(text))
     
     def _clean_lawyer_segment(self, text: str) -> str:
         """清理律师信息段落"""
@@ -3267,15 +3530,29 @@ class DocumentExtractor:
             return ""
         
         # 基本清理
-        cleaned = re.sub(r'\s+', ' ', text.strip())
+        cleaned = _norm_ws(text)
         
         # 移除页码和分隔符
-        cleaned = re.sub(r'\s*-\s*\d+\s*-\s*', ' ', cleaned)
-        cleaned = re.sub(r'\s*_{5,}\s*', ' ', cleaned)
+        cleaned = self._LAWYER_PAGE_NUMBER_RE.sub(' ', cleaned)
+        cleaned = self._LAWYER_UNDERLINE_RE.sub(' ', cleaned)
         
         # 移除明显的非律师信息内容
-        cleaned = re.sub(r'(?i)\s*(?:page|頁|第.*頁).*$', '', cleaned)
-        cleaned = re.sub(r'^\s*[,;.:\s]+', '', cleaned)
-        cleaned = re.sub(r'[.\s]*$', '', cleaned)
+        cleaned = self._LAWYER_PAGE_TAIL_RE.sub('', cleaned)
         
-        return cleaned.strip()
\ No newline at end of file
+        # 空白已规范化为单个空格：去除开头的标点和末尾的句点
+        return cleaned.lstrip(',;.: ').rstrip('. ')
+
+
+# 批量提取的工作进程状态：每个进程只创建一个提取器实例
+_batch_extractor = None
+
+
+def _init_batch_worker(log_level):
+    """工作进程初始化：创建进程内共享的提取器"""
+    global _batch_extractor
+    _batch_extractor = DocumentExtractor(log_level)
+
+
+def _extract_in_batch_worker(text: str, file_name: str) -> Dict[str, str]:
+    """工作进程中提取单个文档的信息（供多进程调用）"""
+    return _batch_extractor.extract_information(text, file_name)
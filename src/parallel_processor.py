@@ -14,13 +14,15 @@ import time
 import logging
 from datetime import datetime
 from pathlib import Path
+from collections import Counter
 from typing import List, Dict, Optional
-from multiprocessing import Pool, cpu_count
-from concurrent.futures import ProcessPoolExecutor, as_completed
-import pandas as pd
+from multiprocessing import cpu_count
+from concurrent.futures import ProcessPoolExecutor
 
 # 导入原有的提取器
 from extractor import DocumentExtractor
+# 文件查找与结果写出与顺序处理器共用
+from processor import _scan_files, _write_csv, _write_excel
 
 class ParallelBatchProcessor:
     """并行批量文档处理器"""
@@ -91,10 +93,10 @@ class ParallelBatchProcessor:
             self.logger.error(f"Input directory does not exist: {input_dir}")
             return []
         
-        pdf_files = list(input_path.glob(pattern))
+        pdf_files = _scan_files(input_path, pattern)
         self.logger.info(f"Found {len(pdf_files)} PDF files in {input_dir}")
         
-        return [str(pdf_file) for pdf_file in pdf_files]
+        return pdf_files
     
     def process_directory_parallel(self, input_dir: str) -> List[Dict[str, str]]:
         """
@@ -126,20 +128,17 @@ class ParallelBatchProcessor:
         # 创建进度跟踪
         total_files = len(pdf_files)
         
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            # 提交所有任务
-            future_to_file = {
-                executor.submit(process_single_pdf, pdf_file): pdf_file 
-                for pdf_file in pdf_files
-            }
-            
-            # 收集结果
-            for i, future in enumerate(as_completed(future_to_file), 1):
-                pdf_file = future_to_file[future]
-                file_name = Path(pdf_file).name
-                
-                try:
-                    result = future.result(timeout=30)  # 30秒超时
+        # 按块提交任务：每个块一次进程间通信，每个进程约分到4个块以平衡负载
+        chunksize = max(1, total_files // (self.max_workers * 4))
+        
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker) as executor:
+            # 按提交顺序收集结果（process_single_pdf 内部已捕获处理异常并返回 None）
+            i = 0
+            try:
+                for i, (pdf_file, result) in enumerate(
+                        zip(pdf_files, executor.map(process_single_pdf, pdf_files, chunksize=chunksize)), 1):
+                    file_name = Path(pdf_file).name
+                    
                     if result:
                         results.append(result)
                         successful += 1
@@ -147,17 +146,18 @@ class ParallelBatchProcessor:
                     else:
                         failed += 1
                         self.logger.error(f"❌ [{i}/{total_files}] 处理失败: {file_name}")
-                except Exception as e:
-                    failed += 1
-                    self.logger.error(f"❌ [{i}/{total_files}] 处理异常: {file_name} - {e}")
-                
-                # 每处理10个文件显示一次进度
-                if i % 10 == 0:
-                    elapsed = time.time() - start_time
-                    avg_time = elapsed / i
-                    remaining = (total_files - i) * avg_time
-                    self.logger.info(f"📊 进度: {i}/{total_files} ({i/total_files*100:.1f}%), "
-                                   f"已用时: {elapsed:.1f}s, 预计剩余: {remaining:.1f}s")
+                    
+                    # 每处理10个文件显示一次进度
+                    if i % 10 == 0:
+                        elapsed = time.time() - start_time
+                        avg_time = elapsed / i
+                        remaining = (total_files - i) * avg_time
+                        self.logger.info(f"📊 进度: {i}/{total_files} ({i/total_files*100:.1f}%), "
+                                       f"已用时: {elapsed:.1f}s, 预计剩余: {remaining:.1f}s")
+            except Exception as e:
+                # 进程池异常（如工作进程崩溃）：剩余文件均计为失败
+                failed += total_files - i
+                self.logger.error(f"❌ 并行处理异常，剩余 {total_files - i} 个文件未处理: {e}")
         
         # 最终统计
         total_time = time.time() - start_time
@@ -168,12 +168,13 @@ class ParallelBatchProcessor:
         
         return results
     
-    def generate_summary_report(self, results: List[Dict[str, str]]) -> Dict:
+    def generate_summary_report(self, results: List[Dict[str, str]], timestamp: Optional[str] = None) -> Dict:
         """
         生成处理摘要报告 - 调用原版processor的完整统计功能
         
         Args:
             results: 处理结果列表
+            timestamp: 文件名中的时间戳，None为当前时间
             
         Returns:
             摘要报告字典
@@ -183,46 +184,47 @@ class ParallelBatchProcessor:
         
         # 统计信息
         total_files = len(results)
-        language_stats = {}
-        court_stats = {}
-        case_type_stats = {}
+        language_stats = Counter()
+        court_stats = Counter()
+        case_type_stats = Counter()
+        complete_counts = Counter()
         
-        # 统计各项指标
+        # 从第一个结果中获取所有字段名（除了文件路径相关字段）
+        all_fields = [key for key in results[0].keys() if key not in ['file_name', 'file_path']]
+        
+        # 单次遍历统计各项指标
         for result in results:
             # 语言统计
-            lang = result.get('language', 'unknown')
-            language_stats[lang] = language_stats.get(lang, 0) + 1
+            language_stats[result.get('language', 'unknown')] += 1
             
             # 法庭统计
             court = result.get('court_name', 'unknown')
             if court and court != 'unknown':
                 court_key = court[:50] + "..." if len(court) > 50 else court
-                court_stats[court_key] = court_stats.get(court_key, 0) + 1
+                court_stats[court_key] += 1
             
             # 案件类型统计
             case_type = result.get('case_type', 'unknown')
             if case_type and case_type != 'unknown':
                 # 提取案件类型关键词
-                if 'application' in case_type.lower():
-                    case_type_stats['Application'] = case_type_stats.get('Application', 0) + 1
-                elif 'action' in case_type.lower():
-                    case_type_stats['Action'] = case_type_stats.get('Action', 0) + 1
+                case_type_lower = case_type.lower()
+                if 'application' in case_type_lower:
+                    case_type_stats['Application'] += 1
+                elif 'action' in case_type_lower:
+                    case_type_stats['Action'] += 1
                 else:
-                    case_type_stats['Other'] = case_type_stats.get('Other', 0) + 1
+                    case_type_stats['Other'] += 1
+            
+            # 字段完整性：非空且不全是空白
+            for field in all_fields:
+                value = result.get(field)
+                if value and not value.isspace():
+                    complete_counts[field] += 1
         
         # 字段完整性统计 - 统计所有字段
         field_completeness = {}
-        
-        # 从第一个结果中获取所有字段名（除了文件路径相关字段）
-        if results:
-            all_fields = [key for key in results[0].keys() if key not in ['file_name', 'file_path']]
-        else:
-            all_fields = ['trial_date', 'court_name', 'case_number', 'plaintiff', 'defendant', 
-                         'judge', 'case_type', 'lawyer', 'judgment_result', 'claim_amount', 
-                         'judgment_amount', 'language', 'document_type']
-        
         for field in all_fields:
-            complete_count = sum(1 for result in results if result.get(field, '').strip())
+            complete_count = complete_counts[field]
             field_completeness[field] = {
                 'complete': complete_count,
                 'missing': total_files - complete_count,
@@ -234,15 +236,15 @@ class ParallelBatchProcessor:
             'processing_mode': 'parallel',
             'max_workers': self.max_workers,
             'total_files_processed': total_files,
-            'language_distribution': language_stats,
-            'court_distribution': court_stats,
-            'case_type_distribution': case_type_stats,
+            'language_distribution': dict(language_stats),
+            'court_distribution': dict(court_stats),
+            'case_type_distribution': dict(case_type_stats),
             'field_completeness': field_completeness,
             'success_rate': 100.0
         }
         
         # 保存摘要报告
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         summary_file = self.output_dir / f"parallel_summary_report_{timestamp}.json"
         with open(summary_file, 'w', encoding='utf-8') as f:
             json.dump(summary, f, ensure_ascii=False, indent=2)
@@ -250,15 +252,19 @@ class ParallelBatchProcessor:
         self.logger.info(f"Summary report saved: {summary_file}")
         return summary
 
-    def save_results(self, results: List[Dict[str, str]], format_type: str = "all") -> Dict[str, str]:
-        """保存处理结果"""
+    def save_results(self, results: List[Dict[str, str]], format_type: str = "all",
+                     timestamp: Optional[str] = None) -> Dict[str, str]:
+        """保存处理结果（timestamp 为文件名中的时间戳，None为当前时间）"""
         if not results:
             self.logger.warning("No results to save")
             return {}
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         saved_files = {}
         
+        # 表格列：所有结果字段的并集，按首次出现的顺序
+        fieldnames = list(dict.fromkeys(key for result in results for key in result))
+        
         # JSON格式
         if format_type in ['json', 'all']:
             json_file = self.output_dir / f"parallel_extraction_results_{timestamp}.json"
@@ -271,8 +277,7 @@ class ParallelBatchProcessor:
         if format_type in ['csv', 'all']:
             try:
                 csv_file = self.output_dir / f"parallel_extraction_results_{timestamp}.csv"
-                df = pd.DataFrame(results)
-                df.to_csv(csv_file, index=False, encoding='utf-8-sig')
+                _write_csv(csv_file, results, fieldnames)
                 saved_files['csv'] = str(csv_file)
                 self.logger.info(f"Results saved to CSV: {csv_file}")
             except Exception as e:
@@ -282,8 +287,7 @@ class ParallelBatchProcessor:
         if format_type in ['excel', 'all']:
             try:
                 excel_file = self.output_dir / f"parallel_extraction_results_{timestamp}.xlsx"
-                df = pd.DataFrame(results)
-                df.to_excel(excel_file, index=False, engine='openpyxl')
+                _write_excel(excel_file, results, fieldnames)
                 saved_files['excel'] = str(excel_file)
                 self.logger.info(f"Results saved to Excel: {excel_file}")
             except Exception as e:
@@ -311,11 +315,14 @@ class ParallelBatchProcessor:
         results = self.process_directory_parallel(input_dir)
         
         if results:
+            # 结果文件与摘要报告使用同一时间戳，便于对应
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            
             # 保存结果
-            saved_files = self.save_results(results, output_format)
+            saved_files = self.save_results(results, output_format, timestamp)
             
             # 生成摘要报告
-            summary = self.generate_summary_report(results)
+            summary = self.generate_summary_report(results, timestamp)
             summary['saved_files'] = saved_files
             
             self.logger.info("=" * 50)
@@ -331,6 +338,16 @@ class ParallelBatchProcessor:
             return {}
 
 
+# 工作进程内共享的提取器实例（由 _init_worker 创建）
+_worker_extractor = None
+
+
+def _init_worker():
+    """工作进程初始化：每个进程只创建一个提取器实例，供该进程处理的所有文件复用"""
+    global _worker_extractor
+    _worker_extractor = DocumentExtractor(log_level=logging.WARNING)  # 减少日志输出
+
+
 def process_single_pdf(pdf_path: str) -> Optional[Dict[str, str]]:
     """
     单个PDF处理函数（供多进程调用）
@@ -342,9 +359,10 @@ def process_single_pdf(pdf_path: str) -> Optional[Dict[str, str]]:
         处理结果字典
     """
     try:
-        # 每个进程创建独立的提取器实例
-        extractor = DocumentExtractor(log_level=logging.WARNING)  # 减少日志输出
-        result = extractor.process_pdf(pdf_path)
+        # 未经 _init_worker 初始化时（如在主进程中直接调用）按需创建提取器
+        if _worker_extractor is None:
+            _init_worker()
+        result = _worker_extractor.process_pdf(pdf_path)
         return result
     except Exception as e:
         # 在多进程环境中，异常处理要谨慎
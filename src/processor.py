@@ -14,8 +14,16 @@ import csv
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
-import pandas as pd
+from collections import Counter
+from fnmatch import fnmatch
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+# 可选的 orjson 库（见 requirements.txt）：C 实现的 JSON 序列化，未安装时使用标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 修复import路径
 try:
@@ -26,17 +34,20 @@ except ImportError:
 class BatchProcessor:
     """批量文档处理器"""
     
-    def __init__(self, output_dir: str = "output", log_dir: str = "logs"):
+    def __init__(self, output_dir: str = "output", log_dir: str = "logs", max_workers: Optional[int] = None):
         """
         初始化批量处理器
         
         Args:
             output_dir: 输出目录
             log_dir: 日志目录
+            max_workers: 并行处理的进程数，None为CPU核心数，1为在当前进程中串行处理
         """
         self.output_dir = Path(output_dir)
         self.log_dir = Path(log_dir)
-        self.extractor = DocumentExtractor()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # 提取器只在当前进程串行处理时需要，首次访问时再创建（进程池中各工作进程自行创建）
+        self._extractor = None
         
         # 创建目录
         self.output_dir.mkdir(exist_ok=True)
@@ -45,6 +56,13 @@ class BatchProcessor:
         # 设置日志
         self.logger = self._setup_logger()
         
+    @property
+    def extractor(self) -> DocumentExtractor:
+        """当前进程中使用的提取器（按需创建）"""
+        if self._extractor is None:
+            self._extractor = DocumentExtractor()
+        return self._extractor
+    
     def _setup_logger(self):
         """设置处理器日志"""
         logger = logging.getLogger('BatchProcessor')
@@ -87,10 +105,10 @@ class BatchProcessor:
             self.logger.error(f"Input directory does not exist: {input_dir}")
             return []
         
-        pdf_files = list(input_path.glob(pattern))
+        pdf_files = _scan_files(input_path, pattern)
         self.logger.info(f"Found {len(pdf_files)} PDF files in {input_dir}")
         
-        return [str(pdf_file) for pdf_file in pdf_files]
+        return pdf_files
     
     def process_directory(self, input_dir: str) -> List[Dict[str, str]]:
         """
@@ -112,35 +130,55 @@ class BatchProcessor:
         
         # 处理文件
         results = []
-        successful = 0
-        failed = 0
-        
-        for i, pdf_file in enumerate(pdf_files, 1):
-            self.logger.info(f"Processing {i}/{len(pdf_files)}: {Path(pdf_file).name}")
-            
-            try:
-                result = self.extractor.process_pdf(pdf_file)
-                if result:
-                    results.append(result)
-                    successful += 1
-                    self.logger.info(f"✅ Successfully processed: {Path(pdf_file).name}")
-                else:
-                    failed += 1
-                    self.logger.error(f"❌ Failed to process: {Path(pdf_file).name}")
-            except Exception as e:
-                failed += 1
-                self.logger.error(f"❌ Error processing {Path(pdf_file).name}: {e}")
+        total_files = len(pdf_files)
         
+        # 各文件相互独立：多个文件时用进程池并行处理，结果按文件顺序返回
+        if self.max_workers == 1 or total_files == 1:
+            self._collect_outcomes(pdf_files, (_run_extractor(self.extractor, pdf_file) for pdf_file in pdf_files),
+                                   results)
+        else:
+            # 按块分发任务，减少进程间通信次数
+            chunksize = max(1, total_files // (self.max_workers * 4))
+            with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker) as executor:
+                self._collect_outcomes(pdf_files, executor.map(_process_one, pdf_files, chunksize=chunksize),
+                                       results)
+        
+        successful = len(results)
+        failed = total_files - successful
         self.logger.info(f"Batch processing completed: {successful} successful, {failed} failed")
         return results
     
-    def save_results(self, results: List[Dict[str, str]], format_type: str = "all") -> Dict[str, str]:
+    def _collect_outcomes(self, pdf_files: List[str], outcomes, results: List[Dict[str, str]]):
+        """按文件顺序收集处理结果并记录日志；进程池异常时剩余文件计为失败"""
+        total_files = len(pdf_files)
+        i = 0
+        try:
+            # 每个文件都会记录的日志使用 % 参数，日志级别被过滤时不格式化消息；
+            # 结果到达时该文件已处理完毕（并行时各文件的开始时间不在主进程中）
+            for i, (pdf_file, (result, error)) in enumerate(zip(pdf_files, outcomes), 1):
+                file_name = os.path.basename(pdf_file)
+                self.logger.info("Processed %d/%d: %s", i, total_files, file_name)
+                
+                if error is not None:
+                    self.logger.error("❌ Error processing %s: %s", file_name, error)
+                elif result:
+                    results.append(result)
+                    self.logger.info("✅ Successfully processed: %s", file_name)
+                else:
+                    self.logger.error("❌ Failed to process: %s", file_name)
+        except Exception as e:
+            # 进程池异常（如工作进程崩溃）
+            self.logger.error(f"❌ Batch processing aborted, {total_files - i} files not processed: {e}")
+    
+    def save_results(self, results: List[Dict[str, str]], format_type: str = "all",
+                     timestamp: Optional[str] = None) -> Dict[str, str]:
         """
         保存处理结果
         
         Args:
             results: 处理结果列表
-            format_type: 输出格式 ('json', 'csv', 'excel', 'all')
+            format_type: 输出格式 ('json', 'csv', 'excel', 'all', 'feather', 'parquet')
+            timestamp: 文件名中的时间戳，None为当前时间
             
         Returns:
             保存的文件路径字典
@@ -149,41 +187,59 @@ class BatchProcessor:
             self.logger.warning("No results to save")
             return {}
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         saved_files = {}
         
+        # 表格列：所有结果字段的并集，按首次出现的顺序
+        fieldnames = list(dict.fromkeys(key for result in results for key in result))
+        
         # JSON格式
         if format_type in ['json', 'all']:
             json_file = self.output_dir / f"extraction_results_{timestamp}.json"
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+            _write_json(json_file, results)
             saved_files['json'] = str(json_file)
             self.logger.info(f"Results saved to JSON: {json_file}")
         
         # CSV格式
         if format_type in ['csv', 'all']:
             csv_file = self.output_dir / f"extraction_results_{timestamp}.csv"
-            df = pd.DataFrame(results)
-            df.to_csv(csv_file, index=False, encoding='utf-8-sig')
+            _write_csv(csv_file, results, fieldnames)
             saved_files['csv'] = str(csv_file)
             self.logger.info(f"Results saved to CSV: {csv_file}")
         
         # Excel格式
         if format_type in ['excel', 'all']:
             excel_file = self.output_dir / f"extraction_results_{timestamp}.xlsx"
-            df = pd.DataFrame(results)
-            df.to_excel(excel_file, index=False, engine='openpyxl')
+            _write_excel(excel_file, results, fieldnames)
             saved_files['excel'] = str(excel_file)
             self.logger.info(f"Results saved to Excel: {excel_file}")
         
+        # 列式格式（Feather/Parquet）：写入比 Excel 快得多、文件更小，需要 pyarrow，不包含在 'all' 中
+        if format_type in ['feather', 'parquet']:
+            columnar_file = self.output_dir / f"extraction_results_{timestamp}.{format_type}"
+            try:
+                # pandas 只在列式输出时需要，按需导入以免拖慢模块加载
+                import pandas as pd
+                # 列已由 fieldnames 给出，无需再逐行推断列集合
+                df = pd.DataFrame.from_records(results, columns=fieldnames)
+                if format_type == 'feather':
+                    df.to_feather(columnar_file, compression='zstd')
+                else:
+                    df.to_parquet(columnar_file, compression='zstd', index=False)
+                saved_files[format_type] = str(columnar_file)
+                self.logger.info(f"Results saved to {format_type.capitalize()}: {columnar_file}")
+            except ImportError as e:
+                self.logger.warning(f"{format_type.capitalize()} output requires pandas and pyarrow: {e}")
+        
         return saved_files
     
-    def generate_summary_report(self, results: List[Dict[str, str]]) -> Dict:
+    def generate_summary_report(self, results: List[Dict[str, str]], timestamp: Optional[str] = None) -> Dict:
         """
         生成处理摘要报告
         
         Args:
             results: 处理结果列表
+            timestamp: 文件名中的时间戳，None为当前时间
             
         Returns:
             摘要报告字典
@@ -193,46 +249,47 @@ class BatchProcessor:
         
         # 统计信息
         total_files = len(results)
-        language_stats = {}
-        court_stats = {}
-        case_type_stats = {}
+        # 语言统计
+        language_stats = Counter(result.get('language', 'unknown') for result in results)
+        court_stats = Counter()
+        case_type_stats = Counter()
         
         # 统计各项指标
         for result in results:
-            # 语言统计
-            lang = result.get('language', 'unknown')
-            language_stats[lang] = language_stats.get(lang, 0) + 1
-            
             # 法庭统计
             court = result.get('court_name', 'unknown')
             if court and court != 'unknown':
                 court_key = court[:50] + "..." if len(court) > 50 else court
-                court_stats[court_key] = court_stats.get(court_key, 0) + 1
+                court_stats[court_key] += 1
             
             # 案件类型统计
             case_type = result.get('case_type', 'unknown')
             if case_type and case_type != 'unknown':
-                # 提取案件类型关键词
-                if 'application' in case_type.lower():
-                    case_type_stats['Application'] = case_type_stats.get('Application', 0) + 1
-                elif 'action' in case_type.lower():
-                    case_type_stats['Action'] = case_type_stats.get('Action', 0) + 1
+                # 提取案件类型关键词（只转一次小写）
+                case_type_lower = case_type.lower()
+                if 'application' in case_type_lower:
+                    case_type_stats['Application'] += 1
+                elif 'action' in case_type_lower:
+                    case_type_stats['Action'] += 1
                 else:
-                    case_type_stats['Other'] = case_type_stats.get('Other', 0) + 1
+                    case_type_stats['Other'] += 1
         
         # 字段完整性统计 - 统计所有字段
         field_completeness = {}
         
-        # 从第一个结果中获取所有字段名（除了文件路径相关字段）
-        if results:
-            all_fields = [key for key in results[0].keys() if key not in ['file_name', 'file_path']]
-        else:
-            all_fields = ['trial_date', 'court_name', 'case_number', 'plaintiff', 'defendant', 
-                         'judge', 'case_type', 'lawyer', 'judgment_result', 'claim_amount', 
-                         'judgment_amount', 'language', 'document_type']
+        # 从第一个结果中获取所有字段名（除了文件路径相关字段；results 在函数开头已确认非空）
+        all_fields = tuple(key for key in results[0] if key not in ('file_name', 'file_path'))
+        
+        # 单次遍历所有结果统计各字段的非空数量（非空且不全是空白）
+        complete_counts = Counter()
+        for result in results:
+            # map(result.get, ...) 每个结果只绑定一次 get 方法，缺失字段得到 None
+            for field, value in zip(all_fields, map(result.get, all_fields)):
+                if value and not value.isspace():
+                    complete_counts[field] += 1
         
         for field in all_fields:
-            complete_count = sum(1 for result in results if result.get(field, '').strip())
+            complete_count = complete_counts[field]
             field_completeness[field] = {
                 'complete': complete_count,
                 'missing': total_files - complete_count,
@@ -242,18 +299,17 @@ class BatchProcessor:
         summary = {
             'processing_time': datetime.now().isoformat(),
             'total_files_processed': total_files,
-            'language_distribution': language_stats,
-            'court_distribution': court_stats,
-            'case_type_distribution': case_type_stats,
+            'language_distribution': dict(language_stats),
+            'court_distribution': dict(court_stats),
+            'case_type_distribution': dict(case_type_stats),
             'field_completeness': field_completeness,
             'success_rate': 100.0  # 因为只有成功的结果才会被包含在results中
         }
         
         # 保存摘要报告
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         summary_file = self.output_dir / f"summary_report_{timestamp}.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        _write_json(summary_file, summary)
         
         self.logger.info(f"Summary report saved: {summary_file}")
         return summary
@@ -277,11 +333,14 @@ class BatchProcessor:
         results = self.process_directory(input_dir)
         
         if results:
+            # 结果文件与摘要报告使用同一时间戳，便于对应
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            
             # 保存结果
-            saved_files = self.save_results(results, output_format)
+            saved_files = self.save_results(results, output_format, timestamp)
             
             # 生成摘要报告
-            summary = self.generate_summary_report(results)
+            summary = self.generate_summary_report(results, timestamp)
             summary['saved_files'] = saved_files
             
             self.logger.info("=" * 50)
@@ -293,4 +352,72 @@ class BatchProcessor:
             return summary
         else:
             self.logger.error("No files were successfully processed")
-            return {} 
\ No newline at end of file
+            return {}
+
+
+def _scan_files(directory: Path, pattern: str) -> List[str]:
+    """列出目录中文件名匹配通配符的条目路径"""
+    # os.scandir 直接给出文件名，按通配符过滤，不为每个条目构造 Path 对象
+    # （fnmatch 与 Path.glob 一样：POSIX 上区分大小写，Windows 上不区分）
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries if fnmatch(entry.name, pattern)]
+
+
+def _write_json(path: Path, data):
+    """写出 UTF-8、缩进2的 JSON 文件；有 orjson 时用其序列化"""
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson 不支持的值（如超出64位的整数）退回标准库
+            payload = None
+        if payload is not None:
+            with open(path, 'wb') as f:
+                f.write(payload)
+            return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _write_csv(path: Path, results: List[Dict[str, str]], fieldnames: List[str]):
+    """逐行写出 CSV（UTF-8 带 BOM），不构建 DataFrame；缺失字段留空"""
+    with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, restval='', lineterminator=os.linesep)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def _write_excel(path: Path, results: List[Dict[str, str]], fieldnames: List[str]):
+    """以只写模式逐行写出 Excel，不构建 DataFrame，也不在内存中保留整张表"""
+    from openpyxl import Workbook
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('Sheet1')
+    worksheet.append(fieldnames)
+    for result in results:
+        worksheet.append([result.get(field) for field in fieldnames])
+    workbook.save(path)
+
+
+# 工作进程内的提取器实例（由 _init_worker 创建）
+_worker_extractor = None
+
+
+def _init_worker(log_level: int = logging.INFO):
+    """工作进程初始化：每个进程只创建一个提取器实例，供该进程处理的所有文件复用"""
+    global _worker_extractor
+    _worker_extractor = DocumentExtractor(log_level)
+
+
+def _run_extractor(extractor: DocumentExtractor, pdf_path: str) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
+    """处理单个PDF，返回 (结果, 错误信息)；异常在此捕获，便于跨进程传回主进程记录"""
+    try:
+        return extractor.process_pdf(pdf_path), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _process_one(pdf_path: str) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
+    """单个PDF处理函数（供进程池调用）"""
+    if _worker_extractor is None:
+        _init_worker()
+    return _run_extractor(_worker_extractor, pdf_path)
@@ -30,16 +30,9 @@ def stage1_single_thread(input_path: str, output_file: str = None):
     if output_file:
         args.extend(['--output-file', output_file])
     
-    # 模拟命令行调用
-    import sys
-    old_argv = sys.argv
-    sys.argv = ['main.py'] + args
-    
-    try:
-        main_extract()
-        print("✅ 第一阶段提取完成！")
-    finally:
-        sys.argv = old_argv
+    # 直接传入参数列表调用，无需改写 sys.argv
+    main_extract(args)
+    print("✅ 第一阶段提取完成！")
 
 def stage1_parallel(input_path: str, output_file: str = None):
     """第一阶段：并行处理"""
@@ -54,16 +47,9 @@ def stage1_parallel(input_path: str, output_file: str = None):
     if output_file:
         args.extend(['--output-file', output_file])
     
-    # 模拟命令行调用
-    import sys
-    old_argv = sys.argv
-    sys.argv = ['run_parallel.py'] + args
-    
-    try:
-        parallel_main()
-        print("✅ 第一阶段并行提取完成！")
-    finally:
-        sys.argv = old_argv
+    # 直接传入参数列表调用，无需改写 sys.argv
+    parallel_main(args)
+    print("✅ 第一阶段并行提取完成！")
 
 def main():
     parser = argparse.ArgumentParser(
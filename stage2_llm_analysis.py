@@ -15,9 +15,36 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+# 可选的 orjson 库：C 实现的 JSON 解析，未安装时使用标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 添加src路径
 sys.path.append('src')
 
+# 本进程中已确认存在的输出目录，重复调用时不再创建
+_ENSURED_DIRS = set()
+
+def _ensure_dir(directory: str):
+    """确保目录存在；空路径表示当前目录，无需创建"""
+    if directory and directory not in _ENSURED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+
+def _load_json(path: str):
+    """读取 JSON 文件；有 orjson 时直接解析原始字节，省去单独的解码步骤"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson 不接受的内容（如 NaN、超出64位的整数）交给标准库处理
+            pass
+    return json.loads(data.decode('utf-8'))
+
 def stage2_llm_analysis(input_file: str, output_file: str = None):
     """第二阶段：LLM智能分析"""
     print("🧠 第二阶段：LLM智能分析")
@@ -30,8 +57,7 @@ def stage2_llm_analysis(input_file: str, output_file: str = None):
     
     # 加载输入数据
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            cases = json.load(f)
+        cases = _load_json(input_file)
         print(f"✅ 成功加载 {len(cases)} 个案件")
     except Exception as e:
         print(f"❌ 错误：无法加载输入文件: {e}")
@@ -43,7 +69,7 @@ def stage2_llm_analysis(input_file: str, output_file: str = None):
         output_file = f"output/llm_analysis_{timestamp}.json"
     
     # 确保输出目录存在
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    _ensure_dir(os.path.dirname(output_file))
     
     print(f"📤 输出文件: {output_file}")
     print()
@@ -60,24 +86,27 @@ def stage2_llm_analysis(input_file: str, output_file: str = None):
     # 启动LLM分析
     print("🚀 开始LLM分析...")
     try:
-        # 使用processor处理
-        processor.process_batch(input_file, output_file, delay=2.0, batch_size=3)
+        # 使用processor处理（传入已加载的案件、直接使用返回的结果，输入和输出文件都只解析一次）
+        results = processor.process_batch(input_file, output_file, delay=2.0, batch_size=3, cases=cases)
         
         print()
         print("🎉 第二阶段LLM分析完成！")
         print(f"📊 分析结果已保存到: {output_file}")
         
         # 显示简要统计
-        if os.path.exists(output_file):
-            with open(output_file, 'r', encoding='utf-8') as f:
-                results = json.load(f)
-            
+        if results:
             # 统计分析结果
             total_cases = len(results)
-            case_type_success = sum(1 for r in results if r.get('case_type', '').strip())
-            judgment_success = sum(1 for r in results if r.get('judgment_result', '').strip())
-            plaintiff_lawyer_success = sum(1 for r in results if r.get('plaintiff_lawyer', '').strip())
-            defendant_lawyer_success = sum(1 for r in results if r.get('defendant_lawyer', '').strip())
+            # 单次遍历统计各字段的非空数量
+            success_counts = dict.fromkeys(('case_type', 'judgment_result', 'plaintiff_lawyer', 'defendant_lawyer'), 0)
+            for r in results:
+                for field in success_counts:
+                    if r.get(field, '').strip():
+                        success_counts[field] += 1
+            case_type_success = success_counts['case_type']
+            judgment_success = success_counts['judgment_result']
+            plaintiff_lawyer_success = success_counts['plaintiff_lawyer']
+            defendant_lawyer_success = success_counts['defendant_lawyer']
             
             print()
             print("📈 分析结果统计:")
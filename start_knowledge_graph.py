@@ -8,6 +8,7 @@
 import os
 import sys
 import subprocess
+import importlib.util
 import time
 
 def print_banner():
@@ -35,11 +36,11 @@ def check_requirements():
     required_packages = ['neo4j', 'dash', 'dash_cytoscape', 'pandas', 'plotly']
     missing_packages = []
     
+    # find_spec 只查找模块而不执行导入，避免加载 pandas/plotly 等大型包
     for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
+        if importlib.util.find_spec(package.replace('-', '_')) is not None:
             print(f"[+] {package}")
-        except ImportError:
+        else:
             missing_packages.append(package)
             print(f"[!] {package} 未安装")
     
@@ -120,9 +121,14 @@ def main():
     print("请稍等，系统正在初始化...")
     
     try:
-        # 运行主程序
-        cmd = [sys.executable, "run_knowledge_graph.py", "--data-file", data_file]
-        subprocess.run(cmd)
+        # 在当前进程中运行主程序，省去新解释器的启动和模块重新导入
+        importlib.invalidate_caches()  # 环境检查时可能刚安装了依赖包
+        from run_knowledge_graph import main as run_knowledge_graph
+        rc = run_knowledge_graph(["--data-file", data_file])
+        if rc:
+            # 数据文件缺失、Neo4j连接失败或导入失败等已由主程序输出原因
+            print("\n[!] 知识图谱系统运行失败")
+            return rc
     except KeyboardInterrupt:
         print("\n[i] 用户中断，程序退出")
     except Exception as e:
@@ -8,6 +8,7 @@
 import os
 import sys
 import subprocess
+import importlib.util
 
 def print_banner():
     """打印启动横幅"""
@@ -28,11 +29,11 @@ def check_requirements():
     required_packages = ['dash', 'dash_cytoscape', 'pandas', 'plotly']
     missing_packages = []
     
+    # find_spec 只查找模块而不执行导入，避免加载 pandas/plotly 等大型包
     for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
+        if importlib.util.find_spec(package.replace('-', '_')) is not None:
             print(f"✅ {package}")
-        except ImportError:
+        else:
             missing_packages.append(package)
             print(f"❌ {package} 未安装")
     
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+金额数字汇总的回归检查：复述的同一金额只计一次，追加的同额款项照常累加
+
+运行: python -m unittest discover tests
+"""
+
+import logging
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from extractor import DocumentExtractor
+
+
+class AmountNumbersTest(unittest.TestCase):
+    """_extract_amount_numbers_from_text 的金额汇总"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.extractor = DocumentExtractor(logging.CRITICAL)
+
+    def total(self, text: str) -> str:
+        return self.extractor._extract_amount_numbers_from_text(text)
+
+    def test_restated_sum_counted_once(self):
+        text = ("Judgment is entered for the Plaintiff in the sum of HK$1,000,000. "
+                "The Defendant shall pay the Plaintiff the said sum of HK$1,000,000 within 14 days.")
+        self.assertEqual(self.total(text), "HK$1,000,000")
+
+    def test_restated_chinese_amount_counted_once(self):
+        text = "原告人申索港幣500,000元。本庭命令被告人支付港幣500,000元及利息。"
+        self.assertEqual(self.total(text), "$500,000")
+
+    def test_further_equal_amount_added(self):
+        text = ("damages of HK$50,000 for loss of earnings and a further HK$50,000 "
+                "for pain and suffering")
+        self.assertEqual(self.total(text), "HK$100,000")
+
+    def test_distinct_amounts_added(self):
+        text = "法庭判令被告人支付原告人港幣500,000元及訟費港幣30,000元。"
+        self.assertEqual(self.total(text), "$530,000")
+
+    def test_restated_judgment_amount(self):
+        text = ("JUDGMENT\n\n"
+                "1. This is the Plaintiff's claim for damages for breach of a loan agreement.\n\n"
+                "2. Judgment is entered for the Plaintiff in the sum of HK$1,000,000. The Defendant "
+                "shall pay the Plaintiff the said sum of HK$1,000,000 together with interest and "
+                "costs of the action.\n")
+        result = self.extractor.extract_information(text, "HCA000001_2024.pdf")
+        self.assertEqual(result['judgment_amount'], "HK$1,000,000")
+
+
+if __name__ == '__main__':
+    unittest.main()
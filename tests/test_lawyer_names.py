@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+律师姓名提取的回归检查："SC leading" 之后的带称谓姓名与 "X and Y" 中的姓名都要保留
+
+运行: python -m unittest discover tests
+"""
+
+import logging
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from extractor import DocumentExtractor
+
+
+class LawyerNamesTest(unittest.TestCase):
+    """_extract_lawyer_names 的姓名列表"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.extractor = DocumentExtractor(logging.CRITICAL)
+
+    def names(self, text: str) -> list:
+        return self.extractor._extract_lawyer_names(text)
+
+    def test_sc_leading_titled_name(self):
+        names = self.names("Mr Ambrose Ho SC leading Mr Jonathan Chang, instructed by Messrs Wong & Co")
+        self.assertEqual(names[:2], ['Ambrose Ho', 'Jonathan Chang'])
+
+    def test_titled_names_joined_by_and(self):
+        names = self.names("Mr Albert Ho and Ms Jane Lee, for the defendant")
+        self.assertEqual(names[:2], ['Albert Ho', 'Jane Lee'])
+
+
+if __name__ == '__main__':
+    unittest.main()